@@ -0,0 +1,71 @@
+# Benchmarks/bench_burst.py
+import gc, random, sys, time
+from Simulator.config import SimConfig
+from Simulator.engine import Engine
+from Simulator.scheduler import SCHEDULERS
+from Utils.types import EventType, Frame, FrameKind, Packet
+
+"""
+    Benchmark de agendar una rafaga de ventana: por cada frame una llegada
+    (FRAME_ARRIVAL) y un TIMEOUT, como hace burst_send en GBN/SR.
+    Compara agendar uno por uno contra Engine.batch() (una sola insercion con
+    push_many) para distintos tamaños de rafaga y de eventos ya pendientes.
+    Solo se mide el agendado; despues de cada rafaga se sacan 2k eventos para
+    mantener constante la poblacion de la cola.
+    Uso (desde la raiz del repo):
+        python -m Benchmarks.bench_burst [rondas]
+"""
+
+PENDING = (100, 10_000)
+BURSTS = (8, 64, 512)
+
+
+"""
+    Funcion que mide el agendado de rafagas
+    Args:
+        kind (str): Cola de eventos (SimConfig.scheduler)
+        pending (int): Eventos pendientes antes de cada rafaga
+        k (int): Frames por rafaga
+        rounds (int): Rafagas a medir
+        batched (bool): Usar Engine.batch()
+    Returns:
+        float: Microsegundos por rafaga
+"""
+def run(kind: str, pending: int, k: int, rounds: int, batched: bool) -> float:
+    rng = random.Random(1)
+    eng = Engine(SimConfig(scheduler=kind, data_timeout=0.25), record=False)
+    for _ in range(pending):
+        eng.schedule(rng.uniform(0.0, 1.0), EventType.FRAME_ARRIVAL, None)
+    f = Frame(FrameKind.DATA, 0, 0, Packet("A>MSG_0"))
+    spent = 0.0
+    for _ in range(rounds):
+        t0 = time.perf_counter()
+        if batched:
+            with eng.batch():
+                for s in range(k):
+                    eng.schedule(0.02 + rng.random() * 0.01, EventType.FRAME_ARRIVAL, f)
+                    eng.start_timer(s)
+        else:
+            for s in range(k):
+                eng.schedule(0.02 + rng.random() * 0.01, EventType.FRAME_ARRIVAL, f)
+                eng.start_timer(s)
+        spent += time.perf_counter() - t0
+        for _ in range(2 * k):
+            eng.now = eng.queue.pop()[0]
+    return spent / rounds * 1e6
+
+
+def main():
+    rounds = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    gc.disable()        # las pausas del GC sobre las tuplas de eventos meten mas ruido que la diferencia medida
+    print(f"{'cola':7s} {'pend':>6s} {'k':>5s} {'uno a uno us':>14s} {'batch us':>10s} {'ganancia':>9s}")
+    for kind in sorted(SCHEDULERS):
+        for pending in PENDING:
+            for k in BURSTS:
+                single = min(run(kind, pending, k, rounds, False) for _ in range(5))
+                batched = min(run(kind, pending, k, rounds, True) for _ in range(5))
+                print(f"{kind:7s} {pending:6d} {k:5d} {single:14.1f} {batched:10.1f} {single / batched:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
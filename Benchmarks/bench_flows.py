@@ -0,0 +1,57 @@
+# Benchmarks/bench_flows.py
+import cProfile, gc, pstats, sys, time
+from Simulator.cli import build_config, build_parser, run_protocol
+from Protocols.drivers import PROTOCOLS
+
+"""
+    Benchmark del modo multi-flujo (Simulator.flows): K flujos independientes
+    sobre un mismo motor con un enlace compartido de 10 Mb/s y cola drop-tail,
+    sin registros (solo las probes del resumen). Para cada K mide el costo por
+    evento entregado a los protocolos, los eventos en cola al final y la
+    equidad entre flujos; con "profile" corre el K mas grande bajo cProfile y
+    muestra las funciones con mas tiempo propio.
+    Uso (desde la raiz del repo):
+        python -m Benchmarks.bench_flows [eventos] [K1,K2,...] [profile]
+"""
+
+DEFAULT_FLOWS = (1, 10, 100, 1000)
+CHANNEL = ["--jitter", "0", "--bitrate", "10M", "--queue-size", "200"]
+
+
+"""
+    Funcion que corre K flujos de un protocolo
+    Args:
+        key (str): Protocolo en PROTOCOLS
+        k (int): Flujos
+        events (int): Eventos a procesar
+    Returns:
+        tuple[float, Engine]: (nanosegundos por evento, motor al final)
+"""
+def measure(key: str, k: int, events: int):
+    spec = PROTOCOLS[key]
+    cfg = build_config(spec, build_parser().parse_args([key, *CHANNEL]))
+    t0 = time.perf_counter()
+    eng = run_protocol(spec, cfg, seed=1, max_events=events, flows=k)
+    return (time.perf_counter() - t0) / max(1, eng.events_processed) * 1e9, eng
+
+
+def main():
+    args = [a for a in sys.argv[1:] if a != "profile"]
+    events = int(args[0]) if args else 200_000
+    sizes = [int(x) for x in args[1].split(",")] if len(args) > 1 else DEFAULT_FLOWS
+    gc.disable()
+    print(f"{'proto':6s} {'K':>6s} {'ns/evento':>10s} {'cola':>8s} {'entregados':>11s} {'jain':>6s}")
+    for key in ("par", "gbn"):
+        for k in sizes:
+            ns, eng = measure(key, k, events)
+            fl = eng.probes["flows"].summary()
+            print(f"{key:6s} {k:6d} {ns:10.0f} {len(eng.queue):8d} {fl['delivered']['total']:11d} "
+                  f"{fl['fairness']:6.3f}")
+    if "profile" in sys.argv[1:]:
+        prof = cProfile.Profile()
+        prof.runcall(measure, "gbn", max(sizes), events)
+        pstats.Stats(prof).sort_stats("tottime").print_stats(15)
+
+
+if __name__ == "__main__":
+    main()
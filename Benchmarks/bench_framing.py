@@ -0,0 +1,55 @@
+# Benchmarks/bench_framing.py
+import gc, sys, time
+from Simulator.framing import FrameCodec, OVERHEAD
+from Utils.types import Frame, FrameKind, Packet
+
+"""
+    Benchmark del costo de CPU del modo bit a bit (Simulator.framing):
+    serializar + CRC32 + verificar + reconstruir un frame, por tamaño de info.
+    Con el costo por frame calcula la tasa de linea maxima que un nucleo puede
+    sostener y que fraccion de un nucleo se necesita a 100 Mb/s, 1 Gb/s y 10 Gb/s.
+    Uso (desde la raiz del repo):
+        python -m Benchmarks.bench_framing [frames]
+"""
+
+SIZES = (16, 64, 512, 1400)
+LINE_RATES = (("100M", 100e6), ("1G", 1e9), ("10G", 10e9))
+
+
+"""
+    Funcion que mide el ciclo completo de un frame
+    Args:
+        size (int): Bytes de info
+        n (int): Frames a medir
+    Returns:
+        tuple[float, float]: (ns por frame solo serializando, ns por frame ida y vuelta)
+"""
+def measure(size: int, n: int):
+    codec = FrameCodec(slot_size=size + OVERHEAD, slots=1)
+    f = Frame(FrameKind.DATA, 3, 5, Packet("x" * size))
+    t0 = time.perf_counter()
+    for _ in range(n):
+        codec.pool.release(codec.send(f)[0])
+    enc = (time.perf_counter() - t0) / n * 1e9
+    t0 = time.perf_counter()
+    for _ in range(n):
+        codec.receive(codec.send(f))
+    full = (time.perf_counter() - t0) / n * 1e9
+    return enc, full
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    gc.disable()
+    head = " ".join(f"{'%CPU@' + name:>10s}" for name, _ in LINE_RATES)
+    print(f"{'info B':>7s} {'frame B':>8s} {'enc ns':>8s} {'ida+vuelta ns':>14s} {'max Mb/s':>9s} {head}")
+    for size in SIZES:
+        enc, full = measure(size, n)
+        bits = (size + OVERHEAD) * 8
+        max_bps = bits / (full * 1e-9)
+        cpu = " ".join(f"{100 * rate / max_bps:10.1f}" for _, rate in LINE_RATES)
+        print(f"{size:7d} {size + OVERHEAD:8d} {enc:8.0f} {full:14.0f} {max_bps / 1e6:9.1f} {cpu}")
+
+
+if __name__ == "__main__":
+    main()
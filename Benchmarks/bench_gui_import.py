@@ -0,0 +1,53 @@
+# Benchmarks/bench_gui_import.py
+import json, os, statistics, subprocess, sys
+
+"""
+    Benchmark de arranque en frio de la GUI (sin crear ventanas).
+    Cada medicion corre en un interprete nuevo y compara:
+      - lazy:  import GUI.main_gui + plugin_registry.load("Utopia") (lo que hace el arranque)
+      - eager: import GUI.main_gui + importar los seis plugins (comportamiento anterior)
+    Uso (desde la raiz del repo):
+        python -m Benchmarks.bench_gui_import [repeticiones]
+"""
+
+BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_CHILD = r"""
+import json, sys, time
+t0 = time.perf_counter()
+import GUI.main_gui as m
+from GUI import plugin_registry as reg
+names = ["Utopia"] if MODE == "lazy" else reg.names(m.PROTOCOL_ORDER)
+for n in names:
+    reg.load(n)
+dt = time.perf_counter() - t0
+mods = sorted(k for k in sys.modules if k.startswith("Protocols."))
+print(json.dumps({"seconds": dt, "protocol_modules": mods}))
+"""
+
+
+"""
+    Funcion que mide un arranque en un proceso nuevo
+    Args:
+        mode (str): "lazy" o "eager"
+    Returns:
+        dict: {"seconds": float, "protocol_modules": list[str]}
+"""
+def measure(mode: str) -> dict:
+    code = f"MODE = {mode!r}\n" + _CHILD
+    out = subprocess.run([sys.executable, "-c", code], cwd=BASE, capture_output=True, text=True, check=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    reps = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    for mode in ("lazy", "eager"):
+        runs = [measure(mode) for _ in range(reps)]
+        times = [r["seconds"] * 1000 for r in runs]
+        print(f"{mode:5s}: mediana {statistics.median(times):7.1f} ms  "
+              f"(min {min(times):.1f} / max {max(times):.1f}, n={reps})")
+        print(f"       modulos de protocolo importados: {', '.join(runs[-1]['protocol_modules'])}")
+
+
+if __name__ == "__main__":
+    main()
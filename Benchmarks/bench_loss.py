@@ -0,0 +1,49 @@
+# Benchmarks/bench_loss.py
+import gc, random, sys, time
+from Simulator.channel import ChannelPolicy
+from Simulator.config import SimConfig
+from Simulator.loss import GilbertElliott
+
+"""
+    Benchmark del costo por frame de las decisiones de perdida/corrupcion del canal:
+    Bernoulli independiente (ChannelPolicy por defecto) contra Gilbert-Elliott
+    muestreado por bloques y frame a frame (block=1, un sorteo por suceso como
+    lo haria una implementacion directa).
+    Uso (desde la raiz del repo):
+        python -m Benchmarks.bench_loss [frames]
+"""
+
+
+"""
+    Funcion que mide will_drop + will_corrupt por frame
+    Args:
+        chan: Objeto con will_drop() y will_corrupt()
+        n (int): Frames
+    Returns:
+        float: Nanosegundos por frame
+"""
+def measure(chan, n: int) -> float:
+    drop, corrupt = chan.will_drop, chan.will_corrupt
+    t0 = time.perf_counter()
+    for _ in range(n):
+        if not drop():
+            corrupt()
+    return (time.perf_counter() - t0) / n * 1e9
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    gc.disable()
+    random.seed(1)
+    ge = dict(p=0.01, r=0.3, corrupt_good=0.001, corrupt_bad=0.05)
+    cases = (
+        ("bernoulli", ChannelPolicy(SimConfig(loss_prob=0.03, corrupt_prob=0.002))),
+        ("gilbert bloque", GilbertElliott(**ge)),
+        ("gilbert block=1", GilbertElliott(**ge, block=1)),
+    )
+    for name, chan in cases:
+        print(f"{name:16s} {measure(chan, n):8.0f} ns/frame")
+
+
+if __name__ == "__main__":
+    main()
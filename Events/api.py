@@ -1,39 +1,74 @@
 
+import random, threading
+
+# Engine enlazado: uno por hilo (corridas en paralelo). El hilo principal (GUI,
+# scripts) ademas deja el suyo como valor por defecto; un hilo de trabajo que no
+# llamo a bind falla en vez de caer en el motor de otro hilo
 _env = None
+_local = threading.local()
 
 def bind(env):
     global _env
-    _env = env
+    if threading.current_thread() is threading.main_thread():
+        _env = env
+    _local.env = env
+
+def current():
+    env = getattr(_local, "env", None)
+    if env is not None:
+        return env
+    if threading.current_thread() is not threading.main_thread():
+        raise RuntimeError(f"el hilo {threading.current_thread().name} no enlazo un motor (Events.api.bind)")
+    return _env
+
+# Generador del motor enlazado (Engine.rng; el modulo random si no tiene uno)
+def rng():
+    return getattr(current(), "rng", random)
 
 def wait_for_event():
-    return _env.wait_for_event()
+    return current().wait_for_event()
+
+def from_network_layer(peer="A"):
+    return current().from_network_layer(peer)
 
-def from_network_layer():
-    return _env.from_network_layer()
+def network_layer_ready(peer=None):
+    return current().network_layer_ready(peer)
+
+def attach_source(peer, src):
+    return current().attach_source(peer, src)
+
+def attach_stream(peer, stream, rate=None):
+    return current().attach_stream(peer, stream, rate)
+
+def attach_scenario(scenario):
+    return current().attach_scenario(scenario)
 
 def to_network_layer(p):
-    return _env.to_network_layer(p)
+    return current().to_network_layer(p)
 
 def from_physical_layer(payload):
-    return _env.from_physical_layer(payload)
+    return current().from_physical_layer(payload)
 
 def to_physical_layer(f):
-    return _env.to_physical_layer(f)
+    return current().to_physical_layer(f)
+
+def batch():
+    return current().batch()
 
 def start_timer(seq):
-    return _env.start_timer(seq)
+    return current().start_timer(seq)
 
 def stop_timer(seq):
-    return _env.stop_timer(seq)
+    return current().stop_timer(seq)
 
 def start_ack_timer():
-    return _env.start_ack_timer()
+    return current().start_ack_timer()
 
 def stop_ack_timer():
-    return _env.stop_ack_timer()
+    return current().stop_ack_timer()
 
 def enable_network_layer():
-    return _env.enable_network_layer()
+    return current().enable_network_layer()
 
 def disable_network_layer():
-    return _env.disable_network_layer()
\ No newline at end of file
+    return current().disable_network_layer()
\ No newline at end of file
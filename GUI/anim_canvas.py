@@ -132,6 +132,14 @@ class AnimationCanvas(tk.Canvas):
         else:
             self.pause()
 
+    """
+        Funcion que indica si hay una trama en vuelo en el lienzo.
+        Returns:
+            bool: True si hay un paquete activo (aunque esté en pausa).
+    """
+    def is_animating(self):
+        return self._active is not None
+
     """
         Funcion que pausa la animación.
     """
@@ -0,0 +1,213 @@
+from __future__ import annotations
+from bisect import bisect_left
+from collections import deque
+from itertools import islice
+from typing import Callable, Deque, List, Optional, Sequence, Tuple
+
+"""
+    Clase AnimStream
+    ---------------------------------------
+    Etapa de animación que lee de forma perezosa el log de transmisiones del
+    Engine mediante un cursor, con un buffer acotado. Solo se convierten a
+    TxRecord las filas que entran al buffer, y el Main consulta can_simulate()
+    para frenar la simulación (contrapresión) mientras la animación no haya
+    consumido lo ya generado. Así simulación y animación se solapan y la
+    memoria de esta etapa no crece con la duración de la corrida.
+"""
+class AnimStream:
+
+    """
+        Funcion que inicializa el stream.
+        Args:
+            read_since (Callable[[int, int], Sequence]): Lector del motor (start, limit) -> filas TxRecord.
+            count (Callable[[], int]): Cantidad de filas disponibles en el motor.
+            capacity (int): Tamaño máximo del buffer de animación.
+            oldest (Callable[[], int], opcional): Índice de la fila más antigua que el motor aún
+                conserva (p.ej. RecordRing.oldest); las anteriores ya no se pueden leer.
+    """
+    def __init__(self, read_since: Callable[[int, int], Sequence], count: Callable[[], int],
+                 capacity: int = 256, oldest: Optional[Callable[[], int]] = None):
+        self._read = read_since
+        self._count = count
+        self._oldest = oldest
+        self.capacity = max(1, int(capacity))
+        self._buf: Deque = deque()
+        self._cursor = 0
+        self.shown = 0
+        self.dropped = 0
+
+    """
+        Funcion que vacía el buffer y reinicia el cursor (nuevo Engine).
+    """
+    def reset(self):
+        self._buf.clear()
+        self._cursor = 0
+        self.shown = 0
+        self.dropped = 0
+
+    """
+        Funcion que adelanta el cursor a la fila más antigua conservada; las filas que el
+        motor ya descartó sin animarse se cuentan en dropped.
+        Returns:
+            int: Cursor válido para leer.
+    """
+    def _sync(self) -> int:
+        if self._oldest is not None:
+            base = self._oldest()
+            if base > self._cursor:
+                self.dropped += base - self._cursor
+                self._cursor = base
+        return self._cursor
+
+    """
+        Funcion que trae filas del motor hasta llenar el buffer.
+        Returns:
+            int: Cantidad de filas leídas en esta llamada.
+    """
+    def fill(self) -> int:
+        room = self.capacity - len(self._buf)
+        if room <= 0:
+            return 0
+        rows = self._read(self._sync(), room)
+        self._buf.extend(rows)
+        self._cursor += len(rows)
+        return len(rows)
+
+    """
+        Funcion que indica cuántas filas generadas aún no se leyeron del motor.
+    """
+    def unread(self) -> int:
+        return max(0, self._count() - self._sync())
+
+    """
+        Funcion de contrapresión: la simulación solo debe avanzar si lo ya
+        generado y no animado cabe en el buffer.
+        Returns:
+            bool: True si se puede correr otro bloque de simulación.
+    """
+    def can_simulate(self) -> bool:
+        return len(self._buf) + self.unread() < self.capacity
+
+    """
+        Funcion que indica si no queda nada por animar (buffer y motor agotados).
+    """
+    def exhausted(self) -> bool:
+        return not self._buf and self.unread() == 0
+
+    """
+        Funcion que devuelve el tiempo de la primera fila pendiente.
+        Returns:
+            float | None: Tiempo simulado o None si el buffer está vacío.
+    """
+    def head_time(self) -> Optional[float]:
+        return self._buf[0].t if self._buf else None
+
+    """
+        Funcion que extrae la trama más reciente ya vencida en el reloj.
+        Las intermedias se descartan (el render no alcanzó a mostrarlas).
+        Args:
+            sim_now (float): Tiempo simulado actual del reloj de reproducción.
+        Returns:
+            tuple[TxRecord | None, int]: (fila a mostrar, tramas omitidas)
+    """
+    def take_due(self, sim_now: float) -> Tuple[Optional[object], int]:
+        last = None
+        n = 0
+        buf = self._buf
+        while True:
+            while buf and buf[0].t <= sim_now:
+                last = buf.popleft()
+                n += 1
+            if buf or not self.fill():
+                break
+        if last is None:
+            return None, 0
+        self.shown += 1
+        self.dropped += n - 1
+        return last, n - 1
+
+    """
+        Funcion que reposiciona el cursor en un indice (p.ej. para volver atras):
+        vacía el buffer y la siguiente lectura empieza en esa fila.
+        Args:
+            index (int): Indice absoluto de la fila
+    """
+    def seek(self, index: int):
+        self._buf.clear()
+        self._cursor = max(0, int(index))
+
+    """
+        Funcion que descarta todas las filas anteriores a un tiempo dado,
+        avanzando el cursor por el motor si hace falta.
+        Args:
+            sim_t (float): Tiempo simulado destino.
+        Returns:
+            int: Cantidad de filas descartadas.
+    """
+    def skip_to(self, sim_t: float) -> int:
+        n = 0
+        buf = self._buf
+        while True:
+            while buf and buf[0].t < sim_t:
+                buf.popleft()
+                n += 1
+            if buf or not self.fill():
+                break
+        self.dropped += n
+        return n
+
+
+"""
+    Clase RecordRing
+    ---------------------------------------
+    Registro acotado de filas (TxRecord/RxRecord) que alimenta la GUI desde un
+    suscriptor del Engine (Engine.subscribe) en lugar de los logs completos:
+    guarda solo las ultimas `capacity` filas pero las indexa por su posicion
+    absoluta en la corrida, asi los lectores con cursor (AnimStream, tablas)
+    siguen funcionando y la memoria no crece con la duracion de la corrida.
+"""
+class RecordRing:
+
+    def __init__(self, capacity: int = 5000):
+        self.capacity = max(1, int(capacity))
+        self._rows: Deque = deque(maxlen=self.capacity)
+        self.total = 0
+
+    def append(self, row):
+        self._rows.append(row)
+        self.total += 1
+
+    """
+        Funcion que devuelve el indice absoluto de la fila mas antigua retenida
+    """
+    def oldest(self) -> int:
+        return self.total - len(self._rows)
+
+    """
+        Funcion que devuelve las filas desde un indice absoluto
+        Args:
+            start (int): Indice absoluto (si ya se descarto, se empieza por la mas antigua retenida)
+            limit (int, opcional): Maximo de filas
+        Returns:
+            list: Filas en orden
+    """
+    def since(self, start: int, limit: Optional[int] = None) -> List:
+        base = self.oldest()
+        i0 = max(start, base)
+        stop = self.total if limit is None else min(self.total, i0 + limit)
+        if stop <= i0:
+            return []
+        return list(islice(self._rows, i0 - base, stop - base))
+
+    """
+        Funcion que busca la primera fila retenida con t >= sim_t
+        Args:
+            sim_t (float): Tiempo simulado
+        Returns:
+            tuple[int, float | None]: (indice absoluto, tiempo de la fila mas antigua retenida o None)
+    """
+    def seek(self, sim_t: float) -> Tuple[int, Optional[float]]:
+        rows = self._rows
+        if not rows:
+            return self.total, None
+        return self.oldest() + bisect_left(rows, sim_t, key=lambda r: r.t), rows[0].t
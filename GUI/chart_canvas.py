@@ -0,0 +1,80 @@
+from __future__ import annotations
+import tkinter as tk
+from typing import List, Tuple
+from GUI.metrics_series import MinMaxSeries
+
+"""
+    Clase ChartCanvas
+    ---------------------------------------
+    Lienzo Tkinter que dibuja una o varias MinMaxSeries. Cada cubeta se dibuja
+    como una barra vertical min/max más una polilínea por el último valor,
+    así el costo de dibujo depende solo de la capacidad de la serie.
+"""
+class ChartCanvas(tk.Canvas):
+
+    """
+        Funcion que inicializa el lienzo del gráfico.
+        Args:
+            master: El widget padre.
+            title: Título que se muestra en la esquina superior.
+            height: La altura del lienzo (por defecto 120).
+    """
+    def __init__(self, master, title: str, height: int = 120):
+        super().__init__(master, height=height, background="#0b1220", highlightthickness=0)
+        self._title = title
+        self._series: List[Tuple[str, MinMaxSeries, str]] = []
+        self._pad = (34, 8, 8, 18)  # izquierda, derecha, arriba, abajo
+
+    """
+        Funcion que fija las series a dibujar.
+        Args:
+            series: Lista de tuplas (etiqueta, MinMaxSeries, color).
+        Returns:
+            None
+    """
+    def set_series(self, series):
+        self._series = list(series)
+
+    """
+        Funcion que vuelve a dibujar el gráfico completo.
+    """
+    def redraw(self):
+        self.delete("all")
+        w = max(self.winfo_width(), self.winfo_reqwidth(), 120)
+        h = max(self.winfo_height(), self.winfo_reqheight(), 60)
+        pl, pr, pt, pb = self._pad
+        x0, x1, y0, y1 = pl, w - pr, pt, h - pb
+
+        self.create_text(pl, 2, text=self._title, anchor="nw", fill="#9fb3c8", font=("Segoe UI", 9))
+        self.create_line(x0, y1, x1, y1, fill="#334155")
+        self.create_line(x0, y0, x0, y1, fill="#334155")
+
+        bounds = [b for b in (s.bounds() for _, s, _ in self._series) if b]
+        if not bounds:
+            return
+        tmin = min(b[0] for b in bounds)
+        tmax = max(b[1] for b in bounds)
+        vmax = max(1e-9, max(b[3] for b in bounds))
+        tspan = max(1e-9, tmax - tmin)
+
+        sx = lambda t: x0 + (t - tmin) / tspan * (x1 - x0)
+        sy = lambda v: y1 - max(0.0, v) / vmax * (y1 - y0)
+
+        self.create_text(x0 - 4, y0, text=f"{vmax:.0f}", anchor="ne", fill="#9fb3c8", font=("Segoe UI", 8))
+        self.create_text(x1, h - 2, text=f"{tmax:.1f}s", anchor="se", fill="#9fb3c8", font=("Segoe UI", 8))
+
+        lx = x1
+        for label, series, color in self._series:
+            pts = []
+            for (bx0, bx1, lo, hi, last) in series.buckets():
+                x = sx((bx0 + bx1) / 2.0)
+                if hi > lo:
+                    self.create_line(x, sy(lo), x, sy(hi), fill=color, width=1)
+                pts.extend((x, sy(last)))
+            if len(pts) >= 4:
+                self.create_line(*pts, fill=color, width=2)
+            elif pts:
+                self.create_oval(pts[0] - 2, pts[1] - 2, pts[0] + 2, pts[1] + 2, outline=color, fill=color)
+            if label:
+                tid = self.create_text(lx, 2, text=label, anchor="ne", fill=color, font=("Segoe UI", 9))
+                lx = self.bbox(tid)[0] - 8
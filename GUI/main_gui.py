@@ -2,88 +2,34 @@ from __future__ import annotations
 import sys, os
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Optional, List, Any
+from dataclasses import replace
+from typing import Optional
 BASE = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 if BASE not in sys.path:
     sys.path.append(BASE)
 from Simulator.config import SimConfig
 from Simulator.engine import Engine
+from Simulator.metrics import LatencyTracker
+from Utils.types import TxRecord, RxRecord
 from Events.api import bind
 from GUI.anim_canvas import AnimationCanvas
-from GUI.plugins.utopia_ui import UtopiaUI
-from GUI.plugins.stop_and_wait_ui import StopAndWaitUI
-from GUI.plugins.gobackn_ui import GoBackNUI
-from GUI.plugins.selective_repeat_ui import SelectiveRepeatUI
-from GUI.plugins.par_ui import PARUI
-from GUI.plugins.sliding1_ui import SlidingOneBitUI
+from GUI.playback import PlaybackClock
+from GUI.anim_stream import AnimStream, RecordRing
+from GUI.chart_canvas import ChartCanvas
+from GUI.metrics_series import LiveMetrics
+from GUI import plugin_registry
 from GUI.protocol_base import ProtocolPlugin
 
+# Orden en el selector; los plugins se importan recién al elegirlos (plugin_registry)
+PROTOCOL_ORDER = ["Utopia", "Stop-and-Wait", "PAR", "Sliding Window 1-bit", "Go-Back-N", "Selective Repeat"]
 
 
-"""
-    Funcion auxiliar para normalizar y parsear las filas de tx
-"""
-def _norm_kind(kind):
-    k = (kind or "").upper()
-    if "DATA" in k: return "DATA"
-    if "ACK"  in k: return "ACK"
-    return kind or "?"
-
-"""
-    Funcion que detecta si un valor es entero aunque venga como float
-"""
-def _is_int_like(x: Any) -> bool:
-    return isinstance(x, int) or (isinstance(x, float) and float(x).is_integer())
-
-"""
-    Normaliza una fila de tx a la tupla (t, kind, seq, ack, info)
-"""
-def _parse_tx_row(row):
-
-    if isinstance(row, dict):
-        t = float(row.get("t", row.get("time", 0.0)) or 0.0)
-        kind = str(row.get("kind", row.get("type", "DATA")) or "DATA")
-        seq = row.get("seq", None)
-        ack = row.get("ack", None)
-        info = row.get("info", "")
-        seq = int(seq) if _is_int_like(seq) else (None if seq is None else seq)
-        ack = int(ack) if _is_int_like(ack) else (None if ack is None else ack)
-        info = str(info or "")
-        return t, kind, seq, ack, info
-
-    if isinstance(row, (list, tuple)):
-        vals = list(row) + [None] * (5 - len(row))
-        t, kind, a, b, c = vals[:5]
-        t = float(t or 0.0); kind = str(kind or "DATA")
-
-        if _is_int_like(a) and (_is_int_like(b) or b is None) and isinstance(c, (str, type(None))):
-            seq = int(a); ack = int(b) if _is_int_like(b) else (None if b is None else b)
-            info = "" if c is None else str(c)
-            return t, kind, seq, ack, info
-
-        if _is_int_like(a) and isinstance(b, str) and (_is_int_like(c) or c is None):
-            seq = int(a); info = str(b); ack = int(c) if _is_int_like(c) else (None if c is None else c)
-            return t, kind, seq, ack, info
-
-        seq = int(a) if _is_int_like(a) else None
-        if _is_int_like(b): ack, info = int(b), str(c or "")
-        elif isinstance(b, str): info, ack = str(b), (int(c) if _is_int_like(c) else None)
-        else: ack, info = (int(c) if _is_int_like(c) else None), str(b or "")
-        return t, kind, seq, ack, info
-
-    return 0.0, "DATA", None, None, str(row)
-
-"""
-    Funcion que mapea una lista de filas de tx a tuplas normalizadas
-"""
-def _normalize_tx_rows(rows: List[Any]):
-    return [_parse_tx_row(r) for r in rows]
-
 
 """
     Clase que maneja el motor de simulación y su configuración
 """
 class Runner:
+    HISTORY = 5000             # filas tx/rx que se conservan (tablas, métricas y volver atrás)
 
     """
         Funcion inicializadora
@@ -92,32 +38,115 @@ class Runner:
         self.engine: Optional[Engine] = None
         self.cfg: Optional[SimConfig] = None
         self.protocol_name: Optional[str] = None
+        self._tx = RecordRing(self.HISTORY)
+        self._rx = RecordRing(self.HISTORY)
 
     """
         Funcion que crea y enlaza el motor de simulación
+        Detalles:
+            - El motor corre sin logs (trace_level "counters"): la GUI se alimenta de un
+              suscriptor que guarda solo las últimas HISTORY filas, así la memoria no crece
+              con la duración de la corrida. Los totales salen del probe "counters".
     """
     def build_and_bind(self, protocol, cfg, window_size: int):
+        self.close()
         self.protocol_name = protocol
         self.cfg = cfg
-        self.engine = Engine(cfg)
+        self.engine = Engine(replace(cfg, trace_level="counters"))
+        self.engine.add_probe("latency", LatencyTracker())
+        self._tx = RecordRing(self.HISTORY)
+        self._rx = RecordRing(self.HISTORY)
+        self.engine.subscribe(tx=self._on_tx, rx=self._on_rx)
         bind(self.engine)
 
     """
-        Funcion que ejecuta un paso del protocolo
+        Funcion que cierra el motor actual (libera los mmap de una traza de canal)
+    """
+    def close(self):
+        if self.engine:
+            self.engine.close()
+
+    def _on_tx(self, t: float, f):
+        self._tx.append(TxRecord(t, f.kind.name, f.seq, f.ack, f.info.data))
+
+    def _on_rx(self, t: float, p):
+        self._rx.append(RxRecord(t, p.data))
+
+    """
+        Funcion que devuelve las últimas filas registradas
     """
     def snapshot(self):
+        t = self.engine.now if self.engine else 0.0
+        return {"time": t, "tx": self._tx.since(0), "rx": self._rx.since(0), "events": []}
+
+    """
+        Funcion que devuelve los TxRecord nuevos desde el indice dado
+    """
+    def tx_since(self, start: int, limit: Optional[int] = None):
+        return self._tx.since(start, limit) if self.engine else []
+
+    """
+        Funcion que devuelve la cantidad de filas de tx registradas
+    """
+    def tx_count(self) -> int:
+        return self._tx.total if self.engine else 0
+
+    """
+        Funcion que devuelve el indice de la trama más antigua conservada
+    """
+    def tx_oldest(self) -> int:
+        return self._tx.oldest()
+
+    """
+        Funcion que devuelve el indice de la primera trama con t >= sim_t
+        Returns:
+            tuple[int, float | None]: (indice, tiempo de la trama más antigua conservada)
+    """
+    def tx_seek(self, sim_t: float):
+        return self._tx.seek(sim_t)
+
+    """
+        Funcion que devuelve los RxRecord nuevos desde el indice dado
+    """
+    def rx_since(self, start: int):
+        return self._rx.since(start) if self.engine else []
+
+    """
+        Funcion que devuelve la cantidad de filas de rx registradas
+    """
+    def rx_count(self) -> int:
+        return self._rx.total if self.engine else 0
+
+    """
+        Funcion que devuelve los totales del probe "counters" (tx, tx_data, tx_ack, rx)
+    """
+    def counters(self) -> dict:
         if self.engine:
-            return self.engine.snapshot()
-        else:
-            return {"time": 0.0, "tx": [], "rx": [], "events": []}
+            return self.engine.probes["counters"].summary()
+        return {"tx": 0, "tx_data": 0, "tx_ack": 0, "rx": 0}
+
+    """
+        Funcion que devuelve el tiempo simulado actual
+    """
+    def now(self) -> float:
+        return self.engine.now if self.engine else 0.0
+
+    """
+        Funcion que devuelve el histograma de latencia extremo a extremo (o None sin engine)
+    """
+    def latency(self):
+        return self.engine.probes["latency"].latency if self.engine else None
 
 
 """
     Clase principal de la GUI
 """
 class MainGUI(ttk.Frame):
-    ANIM_DURATION_MS = 2200
-    ANIM_GAP_MS = 180
+    PLAY_TICK_MS = 16          # periodo del bucle simulación/reproducción
+    ANIM_BUFFER = 256          # tramas máximas entre simulación y animación
+    MIN_FLIGHT_MS = 120        # vuelo mínimo visible de una trama
+    MAX_FLIGHT_MS = 2200       # vuelo máximo (velocidades muy lentas)
+    TABLE_ROWS = 2000          # filas visibles en las tablas tx/rx (se borran las más viejas)
 
     """
         Funcion inicializadora
@@ -146,11 +175,18 @@ class MainGUI(ttk.Frame):
         self._target_steps = 0
 
 
-        self._last_tx_len = 0
-        self._pending_anim: List[tuple] = []
-        self._animating = False
-        self._anim_index = 0
-        self._anim_total = 0
+        self._stream = AnimStream(self.runner.tx_since, self.runner.tx_count, capacity=self.ANIM_BUFFER,
+                                  oldest=self.runner.tx_oldest)
+        self._clock = PlaybackClock(speed=1.0)
+        self._clock_started = False
+
+        # métricas en vivo (series submuestreadas)
+        self._metrics = LiveMetrics()
+
+        # filas ya volcadas a las tablas (refresco incremental)
+        self._shown_engine = None
+        self._tx_shown = 0
+        self._rx_shown = 0
 
 
         self._phase = "idle"
@@ -252,7 +288,7 @@ class MainGUI(ttk.Frame):
         ttk.Label(row, text="Protocolo").pack(anchor="w")
         self.sel_proto = ttk.Combobox(
             row, state="readonly",
-            values=["Utopia", "Stop-and-Wait", "PAR", "Sliding Window 1-bit", "Go-Back-N", "Selective Repeat"]
+            values=plugin_registry.names(PROTOCOL_ORDER)
         )
         self.sel_proto.current(0)
         self.sel_proto.pack(fill="x", pady=(4,0))
@@ -300,6 +336,20 @@ class MainGUI(ttk.Frame):
         self.btn_pause.pack(fill="x", pady=4)
         ttk.Button(ctrls, text="Detener", command=self._auto_stop).pack(fill="x", pady=4)
 
+        # Reproducción escalada en el tiempo (t_sim -> t_real)
+        sr = ttk.Frame(ctrls); sr.pack(fill="x", pady=(8, 2))
+        ttk.Label(sr, text="Velocidad (x)").pack(side="left")
+        self.speed_var = tk.DoubleVar(value=self._clock.speed)
+        ttk.Spinbox(sr, textvariable=self.speed_var, from_=PlaybackClock.MIN_SPEED, to=PlaybackClock.MAX_SPEED,
+                    increment=0.1, width=8, justify="right")\
+            .pack(side="right")
+        self.speed_var.trace_add("write", lambda *_: self._on_speed_change())
+        ttk.Button(ctrls, text="⏩ Avance rápido (x10)", command=self._fast_forward).pack(fill="x", pady=4)
+        kr = ttk.Frame(ctrls); kr.pack(fill="x", pady=(4, 0))
+        self.skip_var = tk.StringVar(value="0.0")
+        ttk.Entry(kr, textvariable=self.skip_var, width=8, justify="right").pack(side="left")
+        ttk.Button(kr, text="Saltar a t (s)", command=self._skip_to_time).pack(side="right")
+
         # Controles del protocolo
         self.plugin_host = ttk.Labelframe(left, text="Controles del Protocolo", style="Card.TLabelframe", padding=10)
         self.plugin_host.pack(fill="x", pady=(10,0))
@@ -312,8 +362,20 @@ class MainGUI(ttk.Frame):
         self.rx_total_var = tk.StringVar(value="0")
         self.eff_var = tk.StringVar(value="0.00")
         self.gp_var = tk.StringVar(value="0.00 pkts/s")
+        self.lat_var = tk.StringVar(value="-")
         self._kv(sg, 0, "t (sim)", self.time_var); self._kv(sg, 0, "TX totales", self.tx_total_var, col=1)
-        self._kv(sg, 1, "RX entregados", self.rx_total_var);
+        self._kv(sg, 1, "RX entregados", self.rx_total_var); self._kv(sg, 1, "Latencia p50/p99/p999", self.lat_var, col=1)
+
+        # Métricas en vivo
+        charts = ttk.Labelframe(right, text="Métricas en vivo", style="Card.TLabelframe", padding=10)
+        charts.pack(fill="x", pady=(10,0))
+        charts.columnconfigure((0, 1, 2), weight=1, uniform="chart")
+        self.chart_goodput = ChartCanvas(charts, "Goodput (pkts/s)", height=110)
+        self.chart_retx = ChartCanvas(charts, "Retransmisiones (pkts/s)", height=110)
+        self.chart_window = ChartCanvas(charts, "Ventana en vuelo (tramas)", height=110)
+        for i, ch in enumerate((self.chart_goodput, self.chart_retx, self.chart_window)):
+            ch.configure(width=200)
+            ch.grid(row=0, column=i, sticky="ew", padx=4)
 
 
         # Animacion
@@ -322,7 +384,6 @@ class MainGUI(ttk.Frame):
         self.anim = AnimationCanvas(canvas_card, height=280)
         self.anim.pack(fill="x")
         self.anim.bind_click(self._on_packet_clicked)
-        self.anim.set_on_finished(self._on_anim_finished)
 
         # Detalle de paquete
         detail = ttk.Labelframe(right, text="Detalle del paquete (pausa + click)", style="Card.TLabelframe", padding=10)
@@ -407,22 +468,13 @@ class MainGUI(ttk.Frame):
     def _load_plugin(self, name):
         for w in self.plugin_host.winfo_children():
             w.destroy()
-        if name == "Utopia":
-            self.plugin = UtopiaUI(self.plugin_host)
-        elif name == "Stop-and-Wait":
-            self.plugin = StopAndWaitUI(self.plugin_host)
-        elif name == "PAR":
-            self.plugin = PARUI(self.plugin_host)
-        elif name == "Sliding Window 1-bit":
-            self.plugin = SlidingOneBitUI(self.plugin_host)
-        elif name == "Go-Back-N":
-            self.plugin = GoBackNUI(self.plugin_host)
-        elif name == "Selective Repeat":
-            self.plugin = SelectiveRepeatUI(self.plugin_host)
-        else:
+        try:
+            plugin_cls = plugin_registry.load(name)
+        except KeyError:
             self.plugin = None
             messagebox.showerror("Protocolo", f"{name} no implementado")
             return
+        self.plugin = plugin_cls(self.plugin_host)
 
         self.plugin.pack(fill="x")
         self.plugin.bind_host(self.runner, self.anim, self._refresh)
@@ -449,9 +501,7 @@ class MainGUI(ttk.Frame):
         if not self.plugin:
             return
         cfg = self._cfg()
-        from GUI.plugins.stop_and_wait_ui import StopAndWaitUI as _SW
-        from GUI.plugins.utopia_ui import UtopiaUI as _UT
-        if isinstance(self.plugin, (_UT, _SW)):
+        if self.plugin.name in ("Utopia", "Stop-and-Wait"):
             cfg.loss_prob = 0.0
             cfg.corrupt_prob = 0.0
 
@@ -461,6 +511,7 @@ class MainGUI(ttk.Frame):
         self.rx_tree.delete(*self.rx_tree.get_children())
         self.time_var.set("0.00 s"); self.tx_total_var.set("0 (DATA 0 | ACK 0)")
         self.rx_total_var.set("0"); self.eff_var.set("0.00"); self.gp_var.set("0.00 pkts/s")
+        self.lat_var.set("-")
         self.sel_t.set("-"); self.sel_kind.set("-"); self.sel_seq.set("-"); self.sel_ack.set("-"); self.sel_info.set("-")
         self.progress_var.set("Listo")
 
@@ -468,9 +519,8 @@ class MainGUI(ttk.Frame):
         self._steps_done = 0
         self._target_steps = 0
         self._phase = "idle"
-        self._last_tx_len = 0
-        self._pending_anim.clear()
-        self._animating = False
+        self._stream.reset()
+        self._clock_started = False
         self._paused = False
         self.btn_pause.configure(text="Pausa")
 
@@ -494,8 +544,10 @@ class MainGUI(ttk.Frame):
         self._is_running = True
         self._paused = False
         self.btn_pause.configure(text="Pausa")
-        self.anim.set_running(False)
-        self._start_generation_phase()
+        self._clock_started = False
+        self._phase = "run"
+        self.anim.set_running(True)
+        self._pump()
 
     """
         Funcion que detiene la ejecución automática
@@ -512,8 +564,7 @@ class MainGUI(ttk.Frame):
             except Exception:
                 pass
             self._job = None
-        self._pending_anim.clear()
-        self._animating = False
+        self._clock.pause()
         self._phase = "idle"
         self.progress_var.set("Listo")
 
@@ -528,6 +579,7 @@ class MainGUI(ttk.Frame):
             self.btn_pause.configure(text="▶ Reanudar")
             self.progress_var.set("Pausado")
             self.anim.pause()
+            self._clock.pause()
             if self._job:
                 try:
                     self.after_cancel(self._job)
@@ -536,107 +588,165 @@ class MainGUI(ttk.Frame):
                 self._job = None
         else:
             self.btn_pause.configure(text="⏯ Pausa")
-            if self._phase == "gen":
-                self.progress_var.set(f"Generando {self._steps_done}/{self._target_steps}")
-                self.anim.resume()
-                self._gen_loop_autostep()
-            elif self._phase == "anim":
-                self.progress_var.set(f"Animando {self._anim_index}/{self._anim_total}")
+            if self._phase == "run":
+                self._clock.resume()
                 self.anim.resume()
+                self._pump()
 
     """
-        Funcion que gestiona la fase de generación de pasos
+        Funcion del bucle principal: simulación y animación solapadas.
+        - Simula un bloque (auto_step) solo si la animación ya consumió lo generado
+          (contrapresión del AnimStream).
+        - Reproduce según el reloj escalado, sin adelantarse a lo ya simulado, y
+          omite tramas intermedias si el render no alcanza.
     """
-    def _start_generation_phase(self):
-        self._phase = "gen"
-        self.progress_var.set(f"Generando 0/{self._target_steps}")
-        self._gen_loop_autostep()
-
-    """
-        Funcion que ejecuta un paso de generación y programa el siguiente
-        si no se ha alcanzado el límite de pasos.
-    """
-    def _gen_loop_autostep(self):
-        if not self._is_running or self._phase != "gen" or self._paused:
+    def _pump(self):
+        self._job = None
+        if not self._is_running or self._phase != "run" or self._paused:
             return
 
-        if self._steps_done >= self._target_steps:
-            self._refresh()
-            self._prepare_anim_batch_from_delta()
-            self.anim.set_running(True)
-            self._start_anim_batch()
+        generating = self._steps_done < self._target_steps
+        if generating and self._stream.can_simulate():
+            if not self._gen_step():
+                return
+            generating = self._steps_done < self._target_steps
+
+        self._stream.fill()
+        if not self._clock_started:
+            head = self._stream.head_time()
+            if head is None:
+                if not generating:
+                    self._auto_stop()
+                    return
+                self._job = self.after(self.PLAY_TICK_MS, self._pump)
+                return
+            self._clock.set_speed(self._read_speed())
+            self._clock.start(head)
+            self._clock_started = True
+
+        if generating:
+            self._clock.hold_at(self.runner.now())
+        sim_now = self._clock.now()
+        row, _ = self._stream.take_due(sim_now)
+        if row is not None:
+            direction = self.plugin.direction_for(row.kind, row.seq, row.ack, row.info)
+            label = row.info or (f"D{row.seq}" if row.kind == "DATA" else f"A{row.ack}")
+            self.anim.enqueue(row.kind, direction, label, row._asdict(), duration_ms=self._flight_ms())
+
+        self._set_play_progress(sim_now)
+        if not generating and self._stream.exhausted() and not self.anim.is_animating():
+            self._auto_stop()
             return
+        self._job = self.after(self.PLAY_TICK_MS, self._pump)
 
+    """
+        Funcion que ejecuta un bloque de simulación del plugin
+        Returns:
+            bool: False si el plugin falló (la ejecución se detiene)
+    """
+    def _gen_step(self):
         try:
             got = int(self.plugin.auto_step())
         except Exception as e:
             messagebox.showerror("Generación", f"auto_step falló: {e}")
             self._auto_stop()
-            return
-
-        if got < 0:
-            got = 0
-        remain = self._target_steps - self._steps_done
-        use = min(got, remain)
-        self._steps_done += use
+            return False
 
-        self.progress_var.set(f"Generando {self._steps_done}/{self._target_steps}")
+        if got <= 0:
+            # el plugin ya no genera más (p.ej. corrida completa de GBN/SR)
+            self._steps_done = self._target_steps
+        else:
+            remain = self._target_steps - self._steps_done
+            self._steps_done += min(got, remain)
         self._refresh()
-        self._job = self.after(1, self._gen_loop_autostep)
+        return True
 
     """
-        Funcion que prepara el lote de animación a partir de las nuevas filas de tx
-        desde la última vez que se llamó a esta función.
+        Funcion que calcula la duración en pantalla del vuelo de una trama
+        a partir del retardo simulado del canal y la velocidad actual.
     """
-    def _prepare_anim_batch_from_delta(self):
-        snap = self.runner.snapshot()
-        tx_rows = _normalize_tx_rows(snap.get("tx", []))
-        if len(tx_rows) <= self._last_tx_len:
-            return
-        for (t, kind, seq, ack, info) in tx_rows[self._last_tx_len:]:
-            nk = _norm_kind(kind)
-            direction = self.plugin.direction_for(nk, seq, ack, info)
-            label = str(info) if info not in (None, "") else (f"D{seq}" if nk == "DATA" else f"A{ack}")
-            self._pending_anim.append(
-                (nk, direction, label, {"t": t, "kind": kind, "seq": seq, "ack": ack, "info": info})
-            )
-        self._last_tx_len = len(tx_rows)
+    def _flight_ms(self):
+        delay = float(getattr(self.runner.cfg, "delay", 0.0) or 0.0)
+        ms = self._clock.wall_ms(delay)
+        return int(min(self.MAX_FLIGHT_MS, max(self.MIN_FLIGHT_MS, ms)))
 
     """
-        Funcion que inicia la fase de animación del lote preparado
+        Funcion que muestra el avance de la simulación y la reproducción
     """
-    def _start_anim_batch(self):
-        self._phase = "anim"
-        if not self._pending_anim:
-            self._auto_stop()
-            return
-        if self._paused:
-            return
-        self._animating = True
-        self._anim_index = 1
-        self._anim_total = len(self._pending_anim)
-        nk, direction, label, meta = self._pending_anim.pop(0)
-        self.progress_var.set(f"Animando {self._anim_index}/{self._anim_total}")
-        self.anim.enqueue(nk, direction, label, meta, duration_ms=self.ANIM_DURATION_MS)
+    def _set_play_progress(self, sim_now):
+        gen = f"Generando {self._steps_done}/{self._target_steps} · " if self._steps_done < self._target_steps else ""
+        self.progress_var.set(
+            f"{gen}Reproduciendo t={sim_now:.2f}/{self.runner.now():.2f} s · "
+            f"mostradas {self._stream.shown} · omitidas {self._stream.dropped} · x{self._clock.speed:g}"
+        )
+
+    """
+        Funcion que lee la velocidad de la UI (acotada al rango permitido)
+    """
+    def _read_speed(self):
+        try:
+            return PlaybackClock.clamp_speed(self.speed_var.get())
+        except (tk.TclError, ValueError):
+            return self._clock.speed
+
+    """
+        Funcion que aplica un cambio de velocidad de reproducción
+    """
+    def _on_speed_change(self):
+        self._clock.set_speed(self._read_speed())
 
     """
-        Funcion que maneja el evento de fin de animación de un paquete
-        y lanza la animación del siguiente paquete en la cola si la hay.
+        Funcion de avance rápido: multiplica la velocidad por 10 (hasta el máximo)
     """
-    def _on_anim_finished(self):
-        if not self._is_running or self._phase != "anim":
+    def _fast_forward(self):
+        speed = self._clock.set_speed(self._clock.speed * 10.0)
+        self.speed_var.set(round(speed, 2))
+
+    """
+        Funcion que salta la reproducción a un tiempo simulado dado.
+        Hacia adelante las tramas anteriores al destino se descartan sin animarse; hacia
+        atrás la animación se reanuda desde las tramas conservadas (las últimas
+        Runner.HISTORY), y si el destino es más viejo se ajusta a la primera y se avisa.
+    """
+    def _skip_to_time(self):
+        try:
+            target = float(self.skip_var.get())
+        except ValueError:
+            messagebox.showerror("Reproducción", "Tiempo inválido")
             return
-        if self._paused:
-            self._animating = False
+        if self._phase != "run" or not self._clock_started:
             return
-        if not self._pending_anim:
-            self._animating = False
-            self._auto_stop()
+        target = min(target, self.runner.now())
+        if target < self._clock.now():
+            idx, oldest = self.runner.tx_seek(target)
+            if oldest is not None and target < oldest:
+                messagebox.showinfo(
+                    "Reproducción",
+                    f"Solo se conservan las últimas {Runner.HISTORY} tramas; "
+                    f"se salta a t={oldest:.2f} s")
+                target = oldest
+            self._stream.seek(idx)
+        else:
+            self._stream.skip_to(target)
+        self._clock.seek(target)
+        self.anim.clear_packets()
+        if self._paused:
+            self._set_play_progress(target)
             return
-        self._anim_index += 1
-        nk, direction, label, meta = self._pending_anim.pop(0)
-        self.progress_var.set(f"Animando {self._anim_index}/{self._anim_total}")
-        self.anim.enqueue(nk, direction, label, meta, duration_ms=self.ANIM_DURATION_MS)
+        if self._job:
+            try:
+                self.after_cancel(self._job)
+            except Exception:
+                pass
+        self._pump()
+
+    """
+        Funcion que borra las filas más viejas de una tabla por encima de TABLE_ROWS
+    """
+    def _trim_table(self, tree):
+        rows = tree.get_children()
+        if len(rows) > self.TABLE_ROWS:
+            tree.delete(*rows[:len(rows) - self.TABLE_ROWS])
 
     """
         Funcion que refresca la UI con el snapshot actual del motor
@@ -646,46 +756,64 @@ class MainGUI(ttk.Frame):
             None
     """
     def _refresh(self, force: bool=False):
-        snap = self.runner.snapshot()
-        raw_tx = snap.get("tx", [])
-        tx_rows = _normalize_tx_rows(raw_tx)
-
-        self.tx_tree.delete(*self.tx_tree.get_children())
-        for (t, kind, seq, ack, info) in tx_rows:
-            self.tx_tree.insert("", tk.END, values=(
-                f"{t:.2f}", str(kind),
-                "—" if seq is None else seq,
-                "—" if ack is None else ack,
-                info
-            ))
-
-        self.rx_tree.delete(*self.rx_tree.get_children())
-        for it in snap.get("rx", []):
-            if isinstance(it, (list, tuple)) and len(it) == 2 and isinstance(it[0], (int, float)):
-                tt, data = it
-            else:
-                tt, data = 0.0, str(it)
-            self.rx_tree.insert("", tk.END, values=(f"{tt:.2f}", str(data)))
-
-        # métricas
-        t = float(snap.get("time", 0.0))
-        data_tx = [r for r in tx_rows if _norm_kind(r[1]) == "DATA"]
-        ack_tx  = [r for r in tx_rows if _norm_kind(r[1]) == "ACK"]
-        rx = snap.get("rx", []); rx_count = len(rx)
+        if force or self._shown_engine is not self.runner.engine:
+            self.tx_tree.delete(*self.tx_tree.get_children())
+            self.rx_tree.delete(*self.rx_tree.get_children())
+            self._shown_engine = self.runner.engine
+            self._tx_shown = self._rx_shown = 0
+            self._metrics = LiveMetrics()
+
+        new_tx = self.runner.tx_since(self._tx_shown)
+        new_rx = self.runner.rx_since(self._rx_shown)
+        for r in new_tx:
+            self.tx_tree.insert("", tk.END, values=(f"{r.t:.2f}", r.kind, r.seq, r.ack, r.info))
+        for r in new_rx:
+            self.rx_tree.insert("", tk.END, values=(f"{r.t:.2f}", r.data))
+        self._trim_table(self.tx_tree)
+        self._trim_table(self.rx_tree)
+        self._tx_shown = self.runner.tx_count()
+        self._rx_shown = self.runner.rx_count()
+
+        # métricas (los totales salen del probe "counters": las filas solo son las últimas)
+        t = float(self.runner.now())
+        c = self.runner.counters()
+        rx_count, n_data = c["rx"], c["tx_data"]
         self.time_var.set(f"{t:.2f} s")
-        self.tx_total_var.set(f"{len(tx_rows)} (DATA {len(data_tx)} | ACK {len(ack_tx)})")
+        self.tx_total_var.set(f"{c['tx']} (DATA {n_data} | ACK {c['tx_ack']})")
         self.rx_total_var.set(f"{rx_count}")
-        eff = (rx_count / len(data_tx)) if data_tx else 0.0
+        eff = (rx_count / n_data) if n_data else 0.0
         gp = (rx_count / t) if t > 0 else 0.0
         self.eff_var.set(f"{eff:.2f}"); self.gp_var.set(f"{gp:.2f} pkts/s")
+        lat = self.runner.latency()
+        if lat is not None and lat.count:
+            self.lat_var.set(" / ".join(f"{lat.quantile(q) * 1000:.1f}" for q in (0.5, 0.99, 0.999)) + " ms")
+        else:
+            self.lat_var.set("-")
+
+        self._metrics.feed(new_tx, new_rx)
+        self._redraw_charts()
 
         if force:
             self.anim.clear_packets()
-            self._pending_anim.clear()
-            self._animating = False
-            self._last_tx_len = 0
+            self._stream.reset()
+            self._clock_started = False
             self.progress_var.set("Listo")
 
+    """
+        Funcion que redibuja los gráficos de métricas en vivo (costo fijo por serie)
+    """
+    def _redraw_charts(self):
+        m = self._metrics
+        peer_colors = ("#f59e0b", "#a78bfa", "#34d399", "#f472b6")
+        self.chart_goodput.set_series([("", m.goodput, self._clr["acc"])])
+        self.chart_retx.set_series([("", m.retx_rate, "#ef4444")])
+        self.chart_window.set_series([
+            (peer, series, peer_colors[i % len(peer_colors)])
+            for i, (peer, series) in enumerate(sorted(m.inflight.items()))
+        ])
+        for ch in (self.chart_goodput, self.chart_retx, self.chart_window):
+            ch.redraw()
+
     """
         Funcion que maneja el evento de clic en un paquete animado
         Args:
@@ -713,6 +841,7 @@ def main():
     app = MainGUI(root)
     app.pack(fill="both", expand=True)
     root.mainloop()
+    app.runner.close()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
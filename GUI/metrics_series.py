@@ -0,0 +1,195 @@
+from __future__ import annotations
+from heapq import merge
+from typing import Dict, Iterable, List, Optional, Tuple
+
+"""
+    Clase MinMaxSeries
+    ---------------------------------------
+    Serie temporal con submuestreo por cubetas min/max y capacidad fija.
+    Cada cubeta guarda [x0, x1, ymin, ymax, ylast, n]. Cuando se supera la
+    capacidad, las cubetas se fusionan de a pares y el tamaño de cubeta se
+    duplica, de modo que dibujar la serie cuesta lo mismo sin importar la
+    duración de la corrida, sin perder los picos.
+"""
+class MinMaxSeries:
+
+    """
+        Funcion que inicializa la serie.
+        Args:
+            capacity (int): Número máximo de cubetas a conservar (>= 2).
+    """
+    def __init__(self, capacity: int = 256):
+        self.capacity = max(2, int(capacity))
+        self.per_bucket = 1
+        self._buckets: List[list] = []
+
+    def __len__(self):
+        return len(self._buckets)
+
+    """
+        Funcion que agrega una muestra (x, y) a la serie.
+        Args:
+            x (float): Abscisa (tiempo simulado), no decreciente.
+            y (float): Valor de la muestra.
+        Returns:
+            None
+    """
+    def add(self, x: float, y: float):
+        b = self._buckets[-1] if self._buckets else None
+        if b is not None and b[5] < self.per_bucket:
+            b[1] = x
+            if y < b[2]: b[2] = y
+            if y > b[3]: b[3] = y
+            b[4] = y
+            b[5] += 1
+        else:
+            self._buckets.append([x, x, y, y, y, 1])
+        if len(self._buckets) > self.capacity:
+            self._compact()
+
+    """
+        Funcion que fusiona cubetas adyacentes de a pares y duplica el tamaño de cubeta.
+    """
+    def _compact(self):
+        old = self._buckets
+        out = []
+        for i in range(0, len(old) - 1, 2):
+            a, b = old[i], old[i + 1]
+            out.append([a[0], b[1], min(a[2], b[2]), max(a[3], b[3]), b[4], a[5] + b[5]])
+        if len(old) % 2:
+            out.append(old[-1])
+        self._buckets = out
+        self.per_bucket *= 2
+
+    """
+        Funcion que devuelve las cubetas actuales (para dibujar).
+        Returns:
+            list[tuple]: Tuplas (x0, x1, ymin, ymax, ylast).
+    """
+    def buckets(self) -> List[Tuple[float, float, float, float, float]]:
+        return [(b[0], b[1], b[2], b[3], b[4]) for b in self._buckets]
+
+    """
+        Funcion que calcula los límites de la serie.
+        Returns:
+            tuple | None: (xmin, xmax, ymin, ymax) o None si está vacía.
+    """
+    def bounds(self) -> Optional[Tuple[float, float, float, float]]:
+        if not self._buckets:
+            return None
+        return (self._buckets[0][0], self._buckets[-1][1],
+                min(b[2] for b in self._buckets), max(b[3] for b in self._buckets))
+
+
+"""
+    Funcion que extrae (origen, número de mensaje) del texto de una trama.
+    Args:
+        info (str): Texto como "A>MSG_12" o "MSG_3" (sin prefijo se asume "A").
+    Returns:
+        tuple[str, int] | None: (peer, id) o None si no es un mensaje de datos.
+"""
+def _msg_key(info) -> Optional[Tuple[str, int]]:
+    s = str(info or "")
+    peer, _, body = s.rpartition(">")
+    if not body.startswith("MSG_"):
+        return None
+    try:
+        return (peer or "A"), int(body[4:])
+    except ValueError:
+        return None
+
+
+"""
+    Clase LiveMetrics
+    ---------------------------------------
+    Calcula de forma incremental, a partir de los logs tx/rx del Engine,
+    series de goodput, tasa de retransmisiones y ocupación de ventana
+    (tramas DATA en vuelo) por peer, en ventanas de sample_dt segundos simulados.
+    La memoria es constante: por peer se guarda solo el mayor id enviado y los
+    contadores de enviados/entregados.
+"""
+class LiveMetrics:
+
+    """
+        Funcion que inicializa las series.
+        Args:
+            sample_dt (float): Ancho de la ventana de muestreo (segundos simulados).
+            capacity (int): Cubetas máximas por serie (costo de dibujo fijo).
+    """
+    def __init__(self, sample_dt: float = 0.05, capacity: int = 256):
+        self.sample_dt = float(sample_dt)
+        self.capacity = capacity
+        self.goodput = MinMaxSeries(capacity)
+        self.retx_rate = MinMaxSeries(capacity)
+        self.inflight: Dict[str, MinMaxSeries] = {}
+
+        self._win_start = 0.0
+        self._win_rx = 0
+        self._win_retx = 0
+        self._max_sent: Dict[str, int] = {}
+        self._sent: Dict[str, int] = {}
+        self._delivered: Dict[str, int] = {}
+
+    """
+        Funcion que consume las filas nuevas de tx/rx (en orden temporal).
+        Args:
+            tx_rows (Iterable[TxRecord]): Filas nuevas de tx desde la última llamada.
+            rx_rows (Iterable[RxRecord]): Filas nuevas de rx desde la última llamada.
+        Returns:
+            None
+    """
+    def feed(self, tx_rows: Iterable, rx_rows: Iterable):
+        tagged_tx = ((r.t, 0, r) for r in tx_rows)
+        tagged_rx = ((r.t, 1, r) for r in rx_rows)
+        for t, src, row in merge(tagged_tx, tagged_rx, key=lambda it: (it[0], it[1])):
+            self._advance(t)
+            if src == 0:
+                self._on_tx(row)
+            else:
+                self._on_rx(row)
+
+    def _on_tx(self, row):
+        if row.kind != "DATA":
+            return
+        key = _msg_key(row.info)
+        if key is None:
+            return
+        peer, mid = key
+        if mid <= self._max_sent.get(peer, -1):
+            self._win_retx += 1
+            return
+        self._max_sent[peer] = mid
+        self._sent[peer] = self._sent.get(peer, 0) + 1
+        if peer not in self.inflight:
+            self.inflight[peer] = MinMaxSeries(self.capacity)
+
+    def _on_rx(self, row):
+        self._win_rx += 1
+        key = _msg_key(row.data)
+        if key is not None:
+            self._delivered[key[0]] = self._delivered.get(key[0], 0) + 1
+
+    """
+        Funcion que cierra las ventanas de muestreo vencidas antes de t.
+        Un hueco largo sin eventos se representa con una sola muestra en cero.
+    """
+    def _advance(self, t: float):
+        dt = self.sample_dt
+        if t < self._win_start + dt:
+            return
+        self._close_window()
+        if t >= self._win_start + dt:
+            # Hueco sin eventos: una muestra en cero y salto a la ventana actual
+            self._close_window()
+            self._win_start += dt * int((t - self._win_start) // dt)
+
+    def _close_window(self):
+        dt = self.sample_dt
+        x = self._win_start + dt
+        self.goodput.add(x, self._win_rx / dt)
+        self.retx_rate.add(x, self._win_retx / dt)
+        for peer, series in self.inflight.items():
+            series.add(x, max(0, self._sent.get(peer, 0) - self._delivered.get(peer, 0)))
+        self._win_start = x
+        self._win_rx = 0
+        self._win_retx = 0
@@ -0,0 +1,127 @@
+from __future__ import annotations
+import time
+from typing import Callable
+
+"""
+    Clase PlaybackClock
+    ---------------------------------------
+    Reloj de reproducción que mapea el tiempo simulado al tiempo real (pared)
+    a una velocidad ajustable. speed=1.0 reproduce un segundo simulado por
+    segundo real, speed=10.0 reproduce diez segundos simulados por segundo real.
+"""
+class PlaybackClock:
+    MIN_SPEED = 0.1
+    MAX_SPEED = 1000.0
+
+    """
+        Funcion que inicializa el reloj (pausado en t=0).
+        Args:
+            speed (float): Velocidad inicial (se acota a [MIN_SPEED, MAX_SPEED]).
+            clock (Callable[[], float]): Fuente de tiempo real en segundos.
+    """
+    def __init__(self, speed: float = 1.0, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self.speed = self.clamp_speed(speed)
+        self._sim0 = 0.0
+        self._wall0 = clock()
+        self._paused = True
+
+    """
+        Funcion que acota una velocidad al rango permitido.
+        Args:
+            speed (float): Velocidad pedida.
+        Returns:
+            float: Velocidad dentro de [MIN_SPEED, MAX_SPEED].
+    """
+    @classmethod
+    def clamp_speed(cls, speed) -> float:
+        return min(cls.MAX_SPEED, max(cls.MIN_SPEED, float(speed)))
+
+    """
+        Funcion que devuelve el tiempo simulado que corresponde al instante actual.
+        Returns:
+            float: Tiempo simulado (segundos).
+    """
+    def now(self) -> float:
+        if self._paused:
+            return self._sim0
+        return self._sim0 + (self._clock() - self._wall0) * self.speed
+
+    """
+        Funcion que arranca la reproducción desde un tiempo simulado dado.
+        Args:
+            sim_t (float): Tiempo simulado inicial.
+        Returns:
+            None
+    """
+    def start(self, sim_t: float = 0.0):
+        self._sim0 = max(0.0, float(sim_t))
+        self._wall0 = self._clock()
+        self._paused = False
+
+    """
+        Funcion que congela el reloj en el tiempo simulado actual.
+    """
+    def pause(self):
+        if self._paused:
+            return
+        self._sim0 = self.now()
+        self._paused = True
+
+    """
+        Funcion que reanuda el reloj desde donde se pausó.
+    """
+    def resume(self):
+        if not self._paused:
+            return
+        self._wall0 = self._clock()
+        self._paused = False
+
+    """
+        Funcion que cambia la velocidad sin saltos en el tiempo simulado.
+        Args:
+            speed (float): Nueva velocidad (se acota).
+        Returns:
+            float: Velocidad efectivamente aplicada.
+    """
+    def set_speed(self, speed) -> float:
+        self._sim0 = self.now()
+        self._wall0 = self._clock()
+        self.speed = self.clamp_speed(speed)
+        return self.speed
+
+    """
+        Funcion que salta a un tiempo simulado (hacia adelante o atrás).
+        Args:
+            sim_t (float): Tiempo simulado destino.
+        Returns:
+            None
+    """
+    def seek(self, sim_t: float):
+        self._sim0 = max(0.0, float(sim_t))
+        self._wall0 = self._clock()
+
+    """
+        Funcion que impide que el reloj adelante a lo ya simulado: si el tiempo
+        de reproducción supera max_t, el reloj queda retenido en max_t.
+        Args:
+            max_t (float): Horizonte simulado disponible.
+        Returns:
+            bool: True si el reloj tuvo que retenerse.
+    """
+    def hold_at(self, max_t: float) -> bool:
+        if self.now() <= max_t:
+            return False
+        self.seek(max_t)
+        return True
+
+    """
+        Funcion que convierte una duración simulada a milisegundos reales.
+        Args:
+            sim_dt (float): Duración en segundos simulados.
+        Returns:
+            float: Duración en milisegundos de pared a la velocidad actual.
+    """
+    def wall_ms(self, sim_dt: float) -> float:
+        return max(0.0, float(sim_dt)) / self.speed * 1000.0
+
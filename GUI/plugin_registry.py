@@ -0,0 +1,98 @@
+from __future__ import annotations
+import ast, importlib, os, pkgutil
+from typing import Dict, List, Optional, Type
+
+"""
+    Registro perezoso de plugins de protocolos.
+    Descubre los plugins de GUI/plugins por nombre leyendo el atributo `name`
+    de sus clases con ast (sin importarlos), y solo importa el módulo de un
+    plugin (y con él la implementación del protocolo) la primera vez que se
+    selecciona. Así el arranque en frío solo paga por el protocolo inicial.
+"""
+
+_PKG = "GUI.plugins"
+_PKG_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "plugins")
+
+_index: Optional[Dict[str, tuple]] = None     # nombre visible -> (módulo, clase)
+_loaded: Dict[str, type] = {}                 # nombre visible -> clase ya importada
+
+
+"""
+    Funcion que busca en un módulo la clase plugin y su nombre visible
+    Args:
+        path (str): Ruta al archivo .py del plugin
+    Returns:
+        tuple[str, str] | None: (nombre visible, nombre de la clase) o None si no hay plugin
+"""
+def _scan_module(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        tree = ast.parse(f.read(), filename=path)
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        bases = {getattr(b, "id", getattr(b, "attr", None)) for b in node.bases}
+        if "ProtocolPlugin" not in bases:
+            continue
+        for stmt in node.body:
+            if (isinstance(stmt, ast.Assign) and len(stmt.targets) == 1
+                    and getattr(stmt.targets[0], "id", None) == "name"
+                    and isinstance(stmt.value, ast.Constant) and isinstance(stmt.value.value, str)):
+                return stmt.value.value, node.name
+    return None
+
+
+"""
+    Funcion que descubre (una sola vez) los plugins disponibles
+    Returns:
+        dict[str, tuple[str, str]]: nombre visible -> (módulo, clase)
+"""
+def discover() -> Dict[str, tuple]:
+    global _index
+    if _index is None:
+        found = {}
+        for mod in pkgutil.iter_modules([_PKG_DIR]):
+            if mod.ispkg:
+                continue
+            hit = _scan_module(os.path.join(_PKG_DIR, mod.name + ".py"))
+            if hit:
+                found[hit[0]] = (f"{_PKG}.{mod.name}", hit[1])
+        _index = found
+    return _index
+
+
+"""
+    Funcion que lista los nombres visibles de los plugins descubiertos
+    Args:
+        preferred (list[str], opcional): Orden deseado; los no listados van al final
+    Returns:
+        list[str]
+"""
+def names(preferred: Optional[List[str]] = None) -> List[str]:
+    found = discover()
+    head = [n for n in (preferred or []) if n in found]
+    return head + sorted(n for n in found if n not in head)
+
+
+"""
+    Funcion que devuelve la clase del plugin, importándola en el primer uso
+    Args:
+        name (str): Nombre visible del protocolo (p.ej. "Go-Back-N")
+    Returns:
+        type[ProtocolPlugin]
+    Raises:
+        KeyError: Si no existe un plugin con ese nombre
+"""
+def load(name: str) -> Type:
+    cls = _loaded.get(name)
+    if cls is None:
+        module, cls_name = discover()[name]
+        cls = getattr(importlib.import_module(module), cls_name)
+        _loaded[name] = cls
+    return cls
+
+
+"""
+    Funcion que indica si un plugin ya fue importado
+"""
+def is_loaded(name: str) -> bool:
+    return name in _loaded
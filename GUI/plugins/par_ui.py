@@ -1,11 +1,12 @@
 from __future__ import annotations
 from tkinter import ttk, messagebox
 from Simulator.config import SimConfig
+from Simulator.engine import QueueDrained
 from GUI.protocol_base import ProtocolPlugin
-from Utils.types import EventType, FrameKind
-from Events.api import wait_for_event, from_physical_layer
+from Events.api import wait_for_event
 from Events.api import enable_network_layer, disable_network_layer
 from Protocols.PAR.par import ParSender, ParReceiver
+from Protocols.drivers import PairFlow
 
 
 class PARUI(ProtocolPlugin):
@@ -41,8 +42,7 @@ class PARUI(ProtocolPlugin):
         cfg.data_timeout = 0.25
         cfg.ack_timeout = 0.08
         self.runner.build_and_bind(self.name, cfg, window_size=1)
-        self.S = ParSender()
-        self.R = ParReceiver()
+        self.flow = PairFlow(ParSender(), ParReceiver())
         self.anim.clear_packets()
 
     """
@@ -62,7 +62,7 @@ class PARUI(ProtocolPlugin):
 
     """
     Ejecuta una ráfaga de eventos.
-    Entrega DATA al receptor y ACK al emisor, maneja NETWORK_LAYER_READY/TIMEOUT en el emisor.
+    Pasa los eventos de a uno por PairFlow: DATA al receptor, ACK y NETWORK_LAYER_READY/TIMEOUT al emisor.
 
     Args:
         (none)
@@ -78,21 +78,10 @@ class PARUI(ProtocolPlugin):
             while processed < N:
                 try:
                     ev, payload = wait_for_event()
-                except IndexError:
+                except QueueDrained:
                     # cola vacía: no hay eventos listos ahora mismo
                     break
-
-                if ev == EventType.FRAME_ARRIVAL:
-                    f = from_physical_layer(payload)
-                    if f:
-                        if f.kind == FrameKind.DATA:
-                            self.R.on_event(ev, f)   # receptor procesa DATA
-                        elif f.kind == FrameKind.ACK:
-                            self.S.on_event(ev, f)   # emisor procesa ACK
-
-                elif ev in (EventType.NETWORK_LAYER_READY, EventType.TIMEOUT):
-                    self.S.on_event(ev, payload)
-
+                self.flow.on_event(ev, payload)
                 processed += 1
 
             return processed
@@ -2,6 +2,7 @@
 from __future__ import annotations
 from tkinter import ttk, messagebox
 from Simulator.config import SimConfig
+from Simulator.engine import QueueDrained
 from GUI.protocol_base import ProtocolPlugin
 
 
@@ -83,6 +84,10 @@ class SelectiveRepeatUI(ProtocolPlugin):
             run_sr_bidirectional(steps=steps, max_seq=self.runner.cfg.max_seq)
             self._ran_full = True
             return steps
+        except QueueDrained:
+            # cola vacia con la capa de red deshabilitada: la corrida termino antes de steps
+            self._ran_full = True
+            return steps
         except Exception as e:
             messagebox.showerror(self.name, str(e))
             return 0
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from tkinter import ttk, messagebox
 from Simulator.config import SimConfig
+from Simulator.engine import QueueDrained
 from GUI.protocol_base import ProtocolPlugin
 from Protocols.SlidingWindow.slidingWindow import run_sw1
 
@@ -80,6 +81,10 @@ class SlidingOneBitUI(ProtocolPlugin):
             run_sw1(steps=steps, max_seq=1)
             self._ran_full = True
             return steps
+        except QueueDrained:
+            # cola vacia con la capa de red deshabilitada: la corrida termino antes de steps
+            self._ran_full = True
+            return steps
         except Exception as e:
             messagebox.showerror(self.name, str(e))
             return 0
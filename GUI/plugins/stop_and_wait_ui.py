@@ -1,8 +1,11 @@
 from __future__ import annotations
 from tkinter import ttk, messagebox
 from Simulator.config import SimConfig
+from Simulator.engine import QueueDrained
 from GUI.protocol_base import ProtocolPlugin
-from Protocols.Stop_and_wait.Stop_and_wait import sender_sw, receiver_sw
+from Events.api import wait_for_event, enable_network_layer
+from Protocols.Stop_and_wait.Stop_and_wait import SWSender, SWReceiver
+from Protocols.drivers import PairFlow
 
 
 """
@@ -45,6 +48,8 @@ class StopAndWaitUI(ProtocolPlugin):
         cfg.ack_timeout = 0.08
 
         self.runner.build_and_bind(self.name, cfg, window_size=1)
+        self.flow = PairFlow(SWSender(), SWReceiver())
+        enable_network_layer()
         self.anim.clear_packets()
 
     """
@@ -62,35 +67,30 @@ class StopAndWaitUI(ProtocolPlugin):
         return total
 
     """
-        Función que avanza en modo automático.
+        Función que avanza en modo automático: despacha una ráfaga de eventos
+        de a uno por PairFlow (DATA al receptor, ACK/NETWORK_LAYER_READY/TIMEOUT al emisor).
         Returns:
-            int: cantidad de pasos ejecutados en este ciclo.
+            int: cantidad de eventos procesados en este ciclo.
     """
     def auto_step(self):
 
         BLOCK = 200
         processed = 0
 
-        for _ in range(BLOCK):
-            try:
-                sender_sw(steps=1)
-            except IndexError:
-                break
-            except Exception as e:
-                messagebox.showerror(self.name, str(e))
-                return processed
+        try:
+            while processed < BLOCK:
+                try:
+                    ev, payload = wait_for_event()
+                except QueueDrained:
+                    break
+                self.flow.on_event(ev, payload)
+                processed += 1
 
-            try:
-                receiver_sw(steps=1)
-            except IndexError:
-                break
-            except Exception as e:
-                messagebox.showerror(self.name, str(e))
-                return processed
+            return processed
 
-            processed += 1
-
-        return processed
+        except Exception as e:
+            messagebox.showerror(self.name, str(e))
+            return processed
 
     """
         Función que decide la dirección de animación para una trama.
@@ -2,7 +2,10 @@
 from __future__ import annotations
 from tkinter import ttk, messagebox
 from Simulator.config import SimConfig
-from Protocols.Utopia.utopia import sender_utopia, receive_utopia
+from Simulator.engine import QueueDrained
+from Events.api import wait_for_event
+from Protocols.Utopia.utopia import UtopiaSender, UtopiaReceiver
+from Protocols.drivers import PairFlow
 from GUI.protocol_base import ProtocolPlugin
 
 class UtopiaUI(ProtocolPlugin):
@@ -29,35 +32,41 @@ class UtopiaUI(ProtocolPlugin):
         cfg.loss_prob = 0.0
         cfg.corrupt_prob = 0.0
         self.runner.build_and_bind(self.name, cfg, window_size=1)
+        self.flow = PairFlow(UtopiaSender(), UtopiaReceiver())
         self.anim.clear_packets()
 
 
     """
-        Funcion que ejecuta k pasos de la simulacion Utopia (emision y recepcion)
+        Funcion que ejecuta k pasos de la simulacion Utopia
         Args:
-            k (int): Numero de iteraciones a avanzar; en cada una se llama a sender_utopia y receive_utopia
+            k (int): Numero de eventos a despachar de a uno por PairFlow (READY al emisor, DATA al receptor)
         Returns:
-            int: Cantidad de pasos efectivamente ejecutados; 0 si hubo error (y se muestra un messagebox)
+            int: Cantidad de eventos efectivamente procesados; se corta si la cola queda vacia
     """
     def tick(self, k):
+        processed = 0
         try:
-            for _ in range(k):
-                sender_utopia(steps=1)
-                receive_utopia(steps=1)
-            return k
+            while processed < k:
+                try:
+                    ev, payload = wait_for_event()
+                except QueueDrained:
+                    break
+                self.flow.on_event(ev, payload)
+                processed += 1
+            return processed
         except Exception as e:
             messagebox.showerror(self.name, str(e))
-            return 0
+            return processed
 
     """
-        Funcion que avanza automaticamente un paso de simulacion
+        Funcion que avanza automaticamente una rafaga de eventos
         Args:
             (ninguno)
         Returns:
-            int: Siempre 1 si el paso se ejecuto correctamente; 0 en caso de error interno
+            int: Cantidad de eventos procesados
     """
     def auto_step(self):
-        return self.tick(1)
+        return self.tick(200)
 
     """
         Funcion que determina la direccion de animacion para un frame
@@ -1,9 +1,9 @@
 from Utils.types import Frame, FrameKind, EventType, Packet
-from Utils.util import inc, between
+from Utils.util import inc, between, pick_sender
 from Events.api import (
     wait_for_event, from_network_layer, to_physical_layer, from_physical_layer,
     to_network_layer, start_timer, stop_timer, start_ack_timer, stop_ack_timer,
-    enable_network_layer, disable_network_layer
+    enable_network_layer, disable_network_layer, network_layer_ready, batch
 )
 import random
 
@@ -95,8 +95,8 @@ class GBNPeer:
     """
     def tx_push_new(self, epoch):
 
-        p = from_network_layer()
-        p_labeled = Packet(f"{self.label}>{p.data}")
+        p = from_network_layer(self.label)
+        p_labeled = Packet(f"{self.label}>{p.data}", p.payload)
         s = self.next_to_send
 
         self.out_buf[s] = p_labeled
@@ -184,6 +184,59 @@ class GBNPeer:
             self.frame_expected = inc(self.frame_expected, self.max_seq)
 
 
+FLOW_SEQ_SPACE = 1 << 16       # numeros de secuencia de GBNFlow (ver GBNFlow)
+
+
+"""
+    Clase GBNFlow: un flujo GBN unidireccional (emisor A, receptor B) para el modo multi-flujo
+    (Simulator.flows). El receptor confirma cada DATA con un ACK acumulativo inmediato.
+    La ventana es max_seq pero los numeros de secuencia van modulo FLOW_SEQ_SPACE: con jitter el
+    canal reordena y un DATA o ACK viejo con numeros modulo max_seq+1 caeria dentro de la ventana
+    actual (el receptor entregaria otro mensaje y el emisor liberaria frames sin confirmar). Con
+    16 bits, todo frame que no sea el esperado queda fuera de la ventana y se descarta.
+"""
+class GBNFlow:
+
+    def __init__(self, max_seq):
+        self.tx = GBNPeer("A", max_seq=FLOW_SEQ_SPACE - 1)
+        self.rx = GBNPeer("B", max_seq=FLOW_SEQ_SPACE - 1)
+        self.tx.window = max_seq
+        self.epoch = 0
+
+    """
+        Función que atiende un evento del flujo.
+        Args:
+            ev (EventType): NETWORK_LAYER_READY, FRAME_ARRIVAL o TIMEOUT
+            payload: Frame recibido o id del timer vencido
+        Returns:
+            None
+    """
+    def on_event(self, ev, payload):
+        self.epoch += 1
+        tx = self.tx
+
+        if ev == EventType.NETWORK_LAYER_READY:
+            with batch():
+                while tx.tx_window_has_space() and network_layer_ready(tx.label):
+                    tx.tx_push_new(self.epoch)
+            if tx.tx_window_has_space():
+                enable_network_layer()
+            else:
+                disable_network_layer()
+
+        elif ev == EventType.FRAME_ARRIVAL:
+            if payload.kind == FrameKind.DATA:
+                self.rx.rx_handle_data(payload.seq, payload.info)
+                to_physical_layer(Frame(FrameKind.ACK, 0, self.rx.last_in_order(), Packet("ACK:B")))
+            elif payload.kind == FrameKind.ACK:
+                tx.tx_consume_ack(payload.ack)
+                if tx.tx_window_has_space():
+                    enable_network_layer()
+
+        elif ev == EventType.TIMEOUT:
+            tx.tx_timeout(self.epoch)
+
+
 """
     Función principal que ejecuta el protocolo GBN bidireccional.
     Args:
@@ -229,16 +282,20 @@ def run_gbn_bidirectional(steps, max_seq, burst_k=None, rng_seed=None):
             return 0
         budget = min(burst_k, free)
         sent = 0
-        for _ in range(budget):
-            peer.tx_push_new(epoch_val)
-            sent += 1
-
-            if (peer.label == "A" and ack_owner == "A") or (peer.label == "B" and ack_owner == "B"):
-                try:
-                    stop_ack_timer()
-                except Exception:
-                    pass
-                ack_owner = None
+        # toda la rafaga (llegadas y timers) entra a la cola del motor en una sola insercion
+        with batch():
+            for _ in range(budget):
+                if not network_layer_ready(peer.label):
+                    break
+                peer.tx_push_new(epoch_val)
+                sent += 1
+
+                if (peer.label == "A" and ack_owner == "A") or (peer.label == "B" and ack_owner == "B"):
+                    try:
+                        stop_ack_timer()
+                    except Exception:
+                        pass
+                    ack_owner = None
         return sent
 
     while processed < steps:
@@ -247,20 +304,16 @@ def run_gbn_bidirectional(steps, max_seq, burst_k=None, rng_seed=None):
         if event == EventType.NETWORK_LAYER_READY:
             sent_total = 0
 
-            winner_is_A = (random.randint(1, 100) <= 50)
-
-            if winner_is_A:
-                if A.tx_window_has_space():
-                    sent_total += burst_send(A, epoch)
-            else:
-                if B.tx_window_has_space():
-                    sent_total += burst_send(B, epoch)
+            # con fuentes de trafico el payload trae el peer que tiene datos
+            winner = pick_sender(payload, A, B, network_layer_ready)
+            if winner is not None:
+                sent_total += burst_send(winner, epoch)
 
 
             if sent_total == 0:
                 if (not A.tx_window_has_space()) and (not B.tx_window_has_space()):
                     disable_network_layer()
-                else:
+                elif payload is None or winner is not None:
                     enable_network_layer()
             else:
                 enable_network_layer()
@@ -1,6 +1,7 @@
 # Protocols/GoBackN/run_go_back_n.py
 from Simulator.engine import Engine
 from Simulator.config import SimConfig
+from Simulator.invariants import DeliveryChecker
 from Events.api import bind
 from Protocols.Go_back_n.Go_back_n  import run_gbn_bidirectional
 
@@ -12,15 +13,13 @@ def main():
         max_seq=7, nr_bufs=(7+1)//2
     )
     eng = Engine(cfg)
+    checker = eng.add_probe("delivery", DeliveryChecker())
     bind(eng)
 
 
+    # una sola llamada: cada llamada crea peers nuevos y reiniciaria las ventanas a mitad de corrida
     TOTAL_STEPS = 4000
-    BLOCK = 200
-    done = 0
-    while done < TOTAL_STEPS:
-        run_gbn_bidirectional(steps=BLOCK, max_seq=cfg.max_seq)
-        done += BLOCK
+    run_gbn_bidirectional(steps=TOTAL_STEPS, max_seq=cfg.max_seq)
 
     snap = eng.snapshot()
     tx = snap["tx"]
@@ -33,23 +32,15 @@ def main():
     print(f"TX total: {len(tx)} DATA: {len(tx_data)} ACK: {len(tx_ack)} | RX: {len(rx)}")
 
 
-    rxA = [data for _, data in rx if data.startswith("A>")]
-    rxB = [data for _, data in rx if data.startswith("B>")]
-
-    def nums(lst):
-        out = []
-        for m in lst:
-            try:
-                out.append(int(m.split(">MSG_")[1]))
-            except Exception:
-                pass
-        return out
-
-    numsA = nums(rxA)
-    numsB = nums(rxB)
-    okA = (numsA == sorted(numsA)) and (len(numsA) == len(set(numsA)))
-    okB = (numsB == sorted(numsB)) and (len(numsB) == len(set(numsB)))
+    # el checker verifica cada entrega al llegar, sin guardar la lista de recibidos
+    flows = checker.flows
+    okA = flows["A"].ok() if "A" in flows else True
+    okB = flows["B"].ok() if "B" in flows else True
     print("Orden por flujo:", f"A={'OK' if okA else 'X'}", f"B={'OK' if okB else 'X'}")
+    for flow, st in checker.summary().items():
+        if st["first_violation"]:
+            print(f"  {flow}: duplicados={st['duplicates']} huecos={st['gaps']} "
+                  f"fuera de orden={st['reordered']} primera={st['first_violation']}")
 
 
     eficiencia = len(rx) / len(tx_data) if tx_data else 0.0
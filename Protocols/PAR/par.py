@@ -35,7 +35,7 @@ class ParSender:
         if ev == EventType.NETWORK_LAYER_READY: # Si la capa de red esta lista para mandar un mensaje
             if not self.waiting_ack:            # Si no está esperando un ACK
                 packet = from_network_layer()
-                packet = Packet(f"A>{packet.data}")       #Etiqueta el mensaje
+                packet = Packet(f"A>{packet.data}", packet.payload)       #Etiqueta el mensaje
                 seq = self.next_to_send
                 self.out_buf[seq] = packet
                 to_physical_layer(Frame(FrameKind.DATA, seq, 0, packet)) # Envia el mensaje
@@ -1,9 +1,9 @@
 # Protocols/PAR/run_par.py
 from Simulator.engine import Engine
 from Simulator.config import SimConfig
-from Events.api import bind, wait_for_event, from_physical_layer
-from Utils.types import FrameKind, EventType
+from Events.api import bind, wait_for_event
 from Protocols.PAR.par import ParSender, ParReceiver
+from Protocols.drivers import PairFlow
 
 def run_par_single_thread(total_events=4000):
     # Config canal/tiempos (ajusta a gusto)
@@ -16,8 +16,8 @@ def run_par_single_thread(total_events=4000):
     env = Engine(cfg)
     bind(env)
 
-    S = ParSender()
-    R = ParReceiver()
+    # DATA -> receptor, ACK/READY/TIMEOUT -> emisor; los frames corruptos (None) se ignoran
+    flow = PairFlow(ParSender(), ParReceiver())
 
     # Activa la capa de red (ParSender la desactiva cuando tiene DATA en vuelo)
     from Events.api import enable_network_layer
@@ -26,23 +26,7 @@ def run_par_single_thread(total_events=4000):
     events_processed = 0
     while events_processed < total_events:
         ev, payload = wait_for_event()
-
-        if ev == EventType.FRAME_ARRIVAL:
-            f = from_physical_layer(payload)
-            # Si el engine indica corrupción con None, seguimos
-            if not f:
-                events_processed += 1
-                continue
-            # DATA -> receptor, ACK -> emisor
-            if f.kind == FrameKind.DATA:
-                R.on_event(ev, f)
-            else:
-                S.on_event(ev, f)
-
-        elif ev in (EventType.NETWORK_LAYER_READY, EventType.TIMEOUT):
-            S.on_event(ev, payload)
-
-        # otros eventos se ignoran (o agrégalos si los usas)
+        flow.on_event(ev, payload)
         events_processed += 1
 
     # Resumen opcional
@@ -1,6 +1,7 @@
 # Protocols/SelectiveRepeat/run_selectiveRepeat.py
 from Simulator.engine import Engine
 from Simulator.config import SimConfig
+from Simulator.invariants import DeliveryChecker
 from Events.api import bind
 from Protocols.SelectiveRepeat.selectiveRepeat import run_sr_bidirectional
 
@@ -12,15 +13,13 @@ def main():
         max_seq=7, nr_bufs=(7+1)//2
     )
     eng = Engine(cfg)
+    checker = eng.add_probe("delivery", DeliveryChecker())
     bind(eng)
 
 
+    # una sola llamada: cada llamada crea peers nuevos y reiniciaria las ventanas a mitad de corrida
     TOTAL_STEPS = 2000
-    BLOCK = 100
-    done = 0
-    while done < TOTAL_STEPS:
-        run_sr_bidirectional(steps=BLOCK, max_seq=cfg.max_seq)
-        done += BLOCK
+    run_sr_bidirectional(steps=TOTAL_STEPS, max_seq=cfg.max_seq)
 
     snap = eng.snapshot()
     tx = snap["tx"]
@@ -32,8 +31,13 @@ def main():
     print(f"TX total: {len(tx)} DATA: {len(tx_data)} ACK: {len(tx_ack)} | RX: {len(rx)}")
 
 
-    ok_orden = all(data == f"MSG_{i}" for i, (_, data) in enumerate(rx))
+    # el checker verifica cada entrega al llegar: orden, duplicados y huecos por flujo
+    ok_orden = checker.ok()
     print("Orden de RX:", "OK" if ok_orden else "X")
+    for flow, st in checker.summary().items():
+        if st["first_violation"]:
+            print(f"  {flow}: duplicados={st['duplicates']} huecos={st['gaps']} "
+                  f"fuera de orden={st['reordered']} primera={st['first_violation']}")
 
     if cfg.loss_prob == 0.0 and cfg.corrupt_prob == 0.0:
 
@@ -1,9 +1,9 @@
 from Utils.types import Frame, FrameKind, EventType, Packet
-from Utils.util import inc, between
+from Utils.util import inc, between, pick_sender
 from Events.api import (
     wait_for_event, from_network_layer, to_physical_layer, from_physical_layer,
     to_network_layer, start_timer, stop_timer, start_ack_timer, stop_ack_timer,
-    enable_network_layer, disable_network_layer
+    enable_network_layer, disable_network_layer, network_layer_ready, batch
 )
 import random
 
@@ -105,8 +105,8 @@ class SRPeerUni:
         if self._should_skip_send_this_epoch(s, epoch):
             return
 
-        p = from_network_layer()
-        p_labeled = Packet(f"{self.label}>{p.data}")
+        p = from_network_layer(self.label)
+        p_labeled = Packet(f"{self.label}>{p.data}", p.payload)
 
         self.out_buf[s] = p_labeled
         ack_pb = self.last_in_order()
@@ -244,11 +244,13 @@ def run_sr_bidirectional(steps=1000, max_seq=7, burst_k=None, rng_seed=None):
         budget = min(burst_k, free_space)
         sent_here = 0
 
-        for _ in range(budget):
-            if not peer.tx_window_has_space():
-                break
-            peer.tx_send_data(epoch_val)
-            sent_here += 1
+        # toda la rafaga (llegadas y timers) entra a la cola del motor en una sola insercion
+        with batch():
+            for _ in range(budget):
+                if not peer.tx_window_has_space() or not network_layer_ready(peer.label):
+                    break
+                peer.tx_send_data(epoch_val)
+                sent_here += 1
         return sent_here
 
     while processed < steps:
@@ -257,20 +259,16 @@ def run_sr_bidirectional(steps=1000, max_seq=7, burst_k=None, rng_seed=None):
         if ev == EventType.NETWORK_LAYER_READY:
             sent_total = 0
 
-            winner_is_A = (random.randint(1, 100) <= 50)
-            if winner_is_A:
-                if A.tx_window_has_space():
-
-                    sent_total += burst_send(A, epoch)
-            else:
-                if B.tx_window_has_space():
-                    sent_total += burst_send(B, epoch)
+            # con fuentes de trafico el payload trae el peer que tiene datos
+            winner = pick_sender(payload, A, B, network_layer_ready)
+            if winner is not None:
+                sent_total += burst_send(winner, epoch)
 
 
             if sent_total == 0:
                 if (not A.tx_window_has_space()) and (not B.tx_window_has_space()):
                     disable_network_layer()
-                else:
+                elif payload is None or winner is not None:
                     enable_network_layer()
             else:
                 enable_network_layer()
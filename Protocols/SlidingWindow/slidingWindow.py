@@ -2,11 +2,11 @@ from Utils.types import Frame, FrameKind, EventType, Packet
 from Events.api import (
     wait_for_event, from_network_layer, to_physical_layer, from_physical_layer,
     to_network_layer, start_timer, stop_timer, start_ack_timer, stop_ack_timer,
-    enable_network_layer, disable_network_layer
+    enable_network_layer, disable_network_layer, network_layer_ready
 )
-import random
 
-from Utils.util import inc
+from Utils.util import inc, pick_sender
+from Simulator.scheduler import QueueDrained
 
 OFFSET_A = 0
 OFFSET_B = 100
@@ -98,8 +98,8 @@ class SW1Peer:
         if self._should_skip_send_this_epoch(sequence, epoch): #Si ya se envio en esta epoca, se salta
             return
 
-        packet = from_network_layer()
-        p_labeled = Packet(f"{self.label}>{packet.data}") #Etiqueta el paquete
+        packet = from_network_layer(self.label)
+        p_labeled = Packet(f"{self.label}>{packet.data}", packet.payload) #Etiqueta el paquete
         self.out_buf[sequence] = p_labeled #Almacena en buffer
 
         if self.ack_pending_seq is not None: # Si hay un ACK pendiente, se manda ese
@@ -183,10 +183,11 @@ def run_sw1(steps=2000, max_seq=1):
     Indica si alguna ventana (A o B) tiene espacio.
 
     Returns:
-        bool: True si A o B pueden aceptar un nuevo paquete de la capa de red.
+        bool: True si A o B pueden aceptar un nuevo paquete de la capa de red
+              (y, con fuentes de trafico, si ese peer tiene datos).
     """
     def want_app_ready():
-        return A.tx_window_has_space() or B.tx_window_has_space()
+        return any(p.tx_window_has_space() and network_layer_ready(p.label) for p in (A, B))
 
     """
     Rearma el evento NETWORK_LAYER_READY.
@@ -205,33 +206,25 @@ def run_sw1(steps=2000, max_seq=1):
     while processed < steps:
         try:
             ev, payload = wait_for_event()
-        except IndexError:
+        except QueueDrained:
             rearm_ready()
             try:
                 ev, payload = wait_for_event()
-            except IndexError:
+            except QueueDrained:
                 break
 
         if ev == EventType.NETWORK_LAYER_READY:
-            winner_is_A = (random.randint(1, 100) <= 50)
+            # sorteo 50/50, o el peer con datos si hay fuentes de trafico
+            winner = pick_sender(payload, A, B, network_layer_ready)
             sent = False
 
-            if winner_is_A: #Manda A
-                if A.tx_window_has_space():
-                    A.tx_push_new(epoch) # A arma DATA y envía
-                    sent = True
-                    if ack_owner == "A": # Si A debía ACK puro, se cancela
-                        stop_ack_timer()
-                        ack_owner = None
-                    pb_ready += 1
-            else: #Manda B
-                if B.tx_window_has_space():
-                    B.tx_push_new(epoch)
-                    sent = True
-                    if ack_owner == "B":
-                        stop_ack_timer()
-                        ack_owner = None
-                    pb_ready += 1
+            if winner is not None:
+                winner.tx_push_new(epoch) # arma DATA y envía
+                sent = True
+                if ack_owner == winner.label: # Si debía ACK puro, se cancela
+                    stop_ack_timer()
+                    ack_owner = None
+                pb_ready += 1
 
             if want_app_ready(): #Si aún hay espacio para otro paquete
                 rearm_ready()
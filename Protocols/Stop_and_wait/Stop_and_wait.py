@@ -1,15 +1,11 @@
 from __future__ import annotations
 from Utils.types import Frame, FrameKind, EventType, Packet
 from Events.api import (
-    wait_for_event, from_network_layer, to_physical_layer, from_physical_layer,
+    from_network_layer, to_physical_layer,
     to_network_layer, enable_network_layer, disable_network_layer,
     start_timer, stop_timer,
 )
 
-num_sequence = 0
-buffer_pkt: Packet | None = None
-waiting_ack = False
-
 """
     Funcion que construye un frame de datos
     Args:
@@ -19,7 +15,7 @@ waiting_ack = False
         Frame: Frame de datos construido
 """
 def build_data_frame(seq_num, pkt):
-    return Frame(FrameKind.DATA, seq_num, 0, Packet(f"A>{pkt.data}"))
+    return Frame(FrameKind.DATA, seq_num, 0, Packet(f"A>{pkt.data}", pkt.payload))
 
 """
     Funcion que construye un frame de ACK
@@ -31,93 +27,98 @@ def build_data_frame(seq_num, pkt):
 def build_ack_frame(ack_num):
     return Frame(FrameKind.ACK, 0, ack_num, Packet("ACK:B"))
 
+
 """
-    Funcion que implementa el emisor del protocolo Stop-and-Wait
+    Clase emisor (A) del protocolo Stop-and-Wait.
+    Todo el estado vive en la instancia, asi que cada corrida (o cada hilo)
+    usa su propio emisor sin heredar nada de corridas anteriores.
+"""
+class SWSender:
+
+    """
+    Inicializa el emisor Stop-and-Wait.
+    Atributos:
+        num_sequence (int): Bit de secuencia del frame actual (0/1).
+        buffer_pkt (Packet|None): Copia del paquete en vuelo para retransmitir.
+        waiting_ack (bool): Indica si hay un DATA esperando su ACK.
+    Returns:
+        None
+    """
+    def __init__(self):
+        self.num_sequence = 0
+        self.buffer_pkt: Packet | None = None
+        self.waiting_ack = False
+
+    """
+    Procesa un evento del emisor: envia con NETWORK_LAYER_READY, valida el ACK
+    con FRAME_ARRIVAL y retransmite con TIMEOUT.
     Args:
-        steps (int): Numero de pasos a ejecutar 
+        ev (EventType): Tipo de evento.
+        payload_or_frame: Frame ya leido (FRAME_ARRIVAL) o seq del timer (TIMEOUT).
     Returns:
         None
-"""
-def sender_sw(steps):
-
-    global num_sequence, buffer_pkt, waiting_ack
-
-    if not waiting_ack:
-        enable_network_layer()
-    else:
-        disable_network_layer()
-
-    processed = 0
-    while processed < steps:
-        event, payload = wait_for_event()
-
-        if event == EventType.NETWORK_LAYER_READY and not waiting_ack:
-
-            buffer_pkt = from_network_layer()
-            frame = build_data_frame(num_sequence, buffer_pkt)
-            to_physical_layer(frame)
-
-            start_timer(num_sequence)
-            waiting_ack = True
-            disable_network_layer()
-            processed += 1
-            continue
-
-        if event == EventType.FRAME_ARRIVAL and waiting_ack:
-
-            received_frame = from_physical_layer(payload)
-            if received_frame and received_frame.kind == FrameKind.ACK:
-
-                if int(received_frame.ack) == num_sequence:
-                    stop_timer(num_sequence)
-                    num_sequence ^= 1
-                    buffer_pkt = None
-                    waiting_ack = False
+    """
+    def on_event(self, ev, payload_or_frame):
+        if ev == EventType.NETWORK_LAYER_READY:
+            if not self.waiting_ack:
+                self.buffer_pkt = from_network_layer()
+                to_physical_layer(build_data_frame(self.num_sequence, self.buffer_pkt))
+                start_timer(self.num_sequence)
+                self.waiting_ack = True
+                disable_network_layer()
+            return
+
+        if ev == EventType.FRAME_ARRIVAL and isinstance(payload_or_frame, Frame):
+            received_frame = payload_or_frame
+            if self.waiting_ack and received_frame.kind == FrameKind.ACK:
+                if int(received_frame.ack) == self.num_sequence:
+                    stop_timer(self.num_sequence)
+                    self.num_sequence ^= 1
+                    self.buffer_pkt = None
+                    self.waiting_ack = False
                     enable_network_layer()
-            processed += 1
-            continue
-
-        if event == EventType.TIMEOUT and waiting_ack:
+            return
 
-            if buffer_pkt is not None:
-                frame = build_data_frame(num_sequence, buffer_pkt)
-                to_physical_layer(frame)
-                start_timer(num_sequence)
-            processed += 1
-            continue
+        if ev == EventType.TIMEOUT:
+            if self.waiting_ack and self.buffer_pkt is not None:
+                to_physical_layer(build_data_frame(self.num_sequence, self.buffer_pkt))
+                start_timer(self.num_sequence)
+            return
 
 
-        processed += 1
-
+"""
+    Clase receptor (B) del protocolo Stop-and-Wait.
+"""
+class SWReceiver:
 
-#  Receptor B
-expected = 0
+    """
+    Inicializa el receptor Stop-and-Wait.
+    Atributos:
+        expected (int): Bit de secuencia que se espera recibir (0/1).
+    Returns:
+        None
+    """
+    def __init__(self):
+        self.expected = 0
 
-"""
-    Funcion que implementa el receptor del protocolo Stop-and-Wait
+    """
+    Recibe un DATA, lo entrega si es el esperado y responde siempre con ACK.
     Args:
-        steps (int): Numero de pasos a ejecutar
+        ev (EventType): Tipo de evento; solo se atiende FRAME_ARRIVAL.
+        payload_or_frame: Frame recibido desde la capa fisica.
     Returns:
         None
-"""
-def receiver_sw(steps):
-
-    global expected
-
-    processed = 0
-    while processed < steps:
-        event, payload = wait_for_event()
-
-        if event == EventType.FRAME_ARRIVAL:
-            received_frame = from_physical_layer(payload)
-            if received_frame and received_frame.kind == FrameKind.DATA:
-                if int(received_frame.seq) == expected:
-                    to_network_layer(received_frame.info)
-                    ack_bit = expected
-                    expected ^= 1
-                else:
-                    ack_bit = 1 - expected
-
-                to_physical_layer(build_ack_frame(ack_bit))
-
-        processed += 1
\ No newline at end of file
+    """
+    def on_event(self, ev, payload_or_frame):
+        if ev == EventType.FRAME_ARRIVAL and isinstance(payload_or_frame, Frame):
+            received_frame = payload_or_frame
+            if received_frame.kind != FrameKind.DATA:
+                return
+            if int(received_frame.seq) == self.expected:
+                to_network_layer(received_frame.info)
+                ack_bit = self.expected
+                self.expected ^= 1
+            else:
+                ack_bit = 1 - self.expected
+
+            to_physical_layer(build_ack_frame(ack_bit))
@@ -1,8 +1,9 @@
 # Protocols/StopAndWait/run_stop_and_wait.py
 from Simulator.engine import Engine
 from Simulator.config import SimConfig
-from Events.api import bind
-from Protocols.Stop_and_wait.Stop_and_wait import sender_sw, receiver_sw
+from Events.api import bind, wait_for_event, enable_network_layer
+from Protocols.Stop_and_wait.Stop_and_wait import SWSender, SWReceiver
+from Protocols.drivers import PairFlow
 
 def main():
 
@@ -17,10 +18,14 @@ def main():
     bind(eng)
 
 
-    TOTAL_STEPS = 2000
-    for _ in range(TOTAL_STEPS):
-        sender_sw(steps=1)
-        receiver_sw(steps=1)
+    # DATA -> receptor, ACK -> emisor (reparto de PairFlow)
+    flow = PairFlow(SWSender(), SWReceiver())
+    enable_network_layer()
+
+    TOTAL_EVENTS = 4000
+    for _ in range(TOTAL_EVENTS):
+        ev, payload = wait_for_event()
+        flow.on_event(ev, payload)
 
     snap = eng.snapshot()
     tx = snap["tx"]
@@ -33,7 +38,7 @@ def main():
     print(f"TX total: {len(tx)} DATA: {len(tx_data)} DUMMY/ACK: {len(tx_ack)} | RX: {len(rx)}")
 
 
-    rxS = [data for _, data in rx if data.startswith("S>")]
+    rxS = [data for _, data in rx if data.startswith("A>")]
 
     def nums(lst):
         out = []
@@ -50,7 +55,8 @@ def main():
 
 
     assert okS, "Stop-and-Wait (P2): RX fuera de orden en canal perfecto"
-    assert len(rx) == len(tx_data), f"P2 perfecto: DATA_TX({len(tx_data)}) != RX({len(rx)})"
+    # a lo sumo un DATA puede quedar en vuelo al cortar la corrida (ventana 1)
+    assert 0 <= len(tx_data) - len(rx) <= 1, f"P2 perfecto: DATA_TX({len(tx_data)}) != RX({len(rx)})"
 
 
 if __name__ == "__main__":
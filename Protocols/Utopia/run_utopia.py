@@ -1,12 +1,14 @@
 from Simulator.engine import Engine
-from Events.api import bind
-from Protocols.Utopia.utopia import sender_utopia, receive_utopia
+from Events.api import bind, wait_for_event
+from Protocols.Utopia.utopia import UtopiaSender, UtopiaReceiver
+from Protocols.drivers import PairFlow
 
 eng = Engine(); bind(eng)
+flow = PairFlow(UtopiaSender(), UtopiaReceiver())
 
-for _ in range(2000):
-    sender_utopia(steps=1)
-    receive_utopia(steps=1)
+for _ in range(4000):
+    ev, payload = wait_for_event()
+    flow.on_event(ev, payload)
 
 snap = eng.snapshot()
 print("Eventos:", snap["events"])
@@ -1,41 +1,62 @@
 from Utils.types import Frame, FrameKind, EventType
-from Events.api import (
-    wait_for_event, from_network_layer, to_physical_layer,
-    from_physical_layer, to_network_layer
-)
+from Events.api import from_network_layer, to_physical_layer, to_network_layer
+
+"""
+    Clase emisor del protocolo Utopia: envia paquetes sin ACKs ni temporizadores.
 """
-    Funcion que envia paquetes sin ACKs ni temporizadores
+class UtopiaSender:
+
+    """
+    Inicializa el emisor Utopia.
+    Atributos:
+        sent (int): Cantidad de DATA enviados por esta instancia.
+    Returns:
+        None
+    """
+    def __init__(self):
+        self.sent = 0
+
+    """
+    Con NETWORK_LAYER_READY toma un paquete de la capa de red y lo manda como
+    DATA (seq=0, ack=0) sin control de errores.
     Args:
-        steps (int): Numero maximo de eventos a procesar, cada NETWORK_LAYER_READY cuenta un envio
+        ev (EventType): Tipo de evento.
+        payload_or_frame: No se usa.
     Returns:
-        None: Toma un paquete de la capa de red y lo manda como DATA (seq=0, ack=0) sin control de errores
-"""
-def sender_utopia(steps=10):
-    processed = 0
-    while processed < steps:
-        ev, _ = wait_for_event()
+        None
+    """
+    def on_event(self, ev, payload_or_frame=None):
         if ev == EventType.NETWORK_LAYER_READY:
             p = from_network_layer()
-            f = Frame(FrameKind.DATA, seq=0, ack=0, info=p)
-            to_physical_layer(f)
-
-            processed += 1
+            to_physical_layer(Frame(FrameKind.DATA, seq=0, ack=0, info=p))
+            self.sent += 1
 
 
 """
-    Funcion que recibe y entrega datos sin validaciones
-    Args:
-        steps (int): Numero maximo de eventos a procesar, cada FRAME_ARRIVAL intenta entregar a la red
-    Returns:
-        None: Si llega un DATA valido, entrega r.info a la capa de red sin checks adicionales
+    Clase receptor del protocolo Utopia: entrega datos sin validaciones.
 """
+class UtopiaReceiver:
+
+    """
+    Inicializa el receptor Utopia.
+    Atributos:
+        delivered (int): Cantidad de paquetes entregados a la capa de red.
+    Returns:
+        None
+    """
+    def __init__(self):
+        self.delivered = 0
 
-def receive_utopia(steps=10):
-    processed = 0
-    while processed < steps:
-        ev, payload = wait_for_event()
-        if ev == EventType.FRAME_ARRIVAL:
-            r = from_physical_layer(payload)
-            if r and r.kind == FrameKind.DATA:
-                to_network_layer(r.info)
-            processed += 1
\ No newline at end of file
+    """
+    Si llega un DATA valido, entrega su info a la capa de red sin checks adicionales.
+    Args:
+        ev (EventType): Tipo de evento; solo se atiende FRAME_ARRIVAL.
+        payload_or_frame: Frame recibido desde la capa fisica.
+    Returns:
+        None
+    """
+    def on_event(self, ev, payload_or_frame):
+        if ev == EventType.FRAME_ARRIVAL and isinstance(payload_or_frame, Frame):
+            if payload_or_frame.kind == FrameKind.DATA:
+                to_network_layer(payload_or_frame.info)
+                self.delivered += 1
@@ -0,0 +1,136 @@
+import sys
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Optional, Tuple
+from Simulator.config import SimConfig
+from Utils.types import EventType, FrameKind
+from Events.api import wait_for_event, from_physical_layer, enable_network_layer
+from Protocols.Utopia.utopia import UtopiaSender, UtopiaReceiver
+from Protocols.Stop_and_wait.Stop_and_wait import SWSender, SWReceiver
+from Protocols.PAR.par import ParSender, ParReceiver
+from Protocols.SlidingWindow.slidingWindow import run_sw1
+from Protocols.Go_back_n.Go_back_n import run_gbn_bidirectional, GBNFlow
+from Protocols.SelectiveRepeat.selectiveRepeat import run_sr_bidirectional
+
+"""
+    Drivers sin GUI para cada protocolo.
+    Cada driver corre sobre el Engine ya enlazado (Events.api.bind) hasta que el
+    motor lance SimulationStopped (condicion de parada comun, Engine.set_stop)
+    o la cola quede vacia (QueueDrained). No importan tkinter.
+"""
+
+FOREVER = sys.maxsize
+
+
+"""
+    Funcion que corre un par emisor/receptor unidireccional sobre el motor enlazado
+    Args:
+        S: Emisor con on_event(ev, payload)
+        R: Receptor con on_event(ev, frame)
+    Returns:
+        None: Corre hasta SimulationStopped o QueueDrained (el reparto lo hace PairFlow)
+"""
+def _run_pair(S, R):
+    flow = PairFlow(S, R)
+    enable_network_layer()
+    while True:
+        ev, payload = wait_for_event()
+        flow.on_event(ev, payload)
+
+
+"""
+    Clase que junta un emisor y un receptor unidireccionales y les reparte los eventos
+    (DATA -> receptor, ACK -> emisor, NETWORK_LAYER_READY/TIMEOUT -> emisor).
+    La usan _run_pair, el modo multi-flujo y los plugins de la GUI (un evento por llamada).
+"""
+class PairFlow:
+
+    def __init__(self, S, R):
+        self.S = S
+        self.R = R
+
+    """
+        Funcion que despacha un evento al emisor o al receptor
+        Args:
+            ev (EventType): Evento sacado de la cola
+            payload (Any): Payload del evento (un Frame si es FRAME_ARRIVAL)
+        Returns:
+            None: Los frames ilegibles (from_physical_layer -> None) y los demas eventos se ignoran
+    """
+    def on_event(self, ev, payload):
+        if ev == EventType.FRAME_ARRIVAL:
+            f = from_physical_layer(payload)
+            if not f:
+                return
+            if f.kind == FrameKind.DATA:
+                self.R.on_event(ev, f)
+            else:
+                self.S.on_event(ev, f)
+        elif ev in (EventType.NETWORK_LAYER_READY, EventType.TIMEOUT):
+            self.S.on_event(ev, payload)
+
+
+def _run_utopia(cfg: SimConfig):
+    _run_pair(UtopiaSender(), UtopiaReceiver())
+
+
+def _run_stop_and_wait(cfg: SimConfig):
+    _run_pair(SWSender(), SWReceiver())
+
+
+def _run_par(cfg: SimConfig):
+    _run_pair(ParSender(), ParReceiver())
+
+
+def _run_sw1(cfg: SimConfig):
+    run_sw1(steps=FOREVER, max_seq=1)
+
+
+def _run_gbn(cfg: SimConfig):
+    run_gbn_bidirectional(steps=FOREVER, max_seq=cfg.max_seq)
+
+
+def _run_sr(cfg: SimConfig):
+    run_sr_bidirectional(steps=FOREVER, max_seq=cfg.max_seq)
+
+
+"""
+    Descripcion de un protocolo para el CLI
+    Atributos:
+        name (str): Nombre visible (igual al de la GUI)
+        run (Callable[[SimConfig], None]): Driver del protocolo
+        defaults (dict): Valores de SimConfig que el protocolo fija por defecto (como el reset de su plugin)
+        flows (tuple[str, ...]): Origenes de DATA ("A" y/o "B")
+        flow (Callable[[SimConfig], Callable[[], object]] | None): Para el modo multi-flujo
+            (Simulator.flows), devuelve la fabrica del emisor + receptor de un flujo; None si
+            el protocolo corre su propio loop y no se puede multiplexar
+"""
+@dataclass(frozen=True)
+class ProtocolSpec:
+    name: str
+    run: Callable[[SimConfig], None]
+    defaults: Dict[str, object] = field(default_factory=dict)
+    flows: Tuple[str, ...] = ("A",)
+    flow: Optional[Callable[[SimConfig], Callable[[], object]]] = None
+
+
+_TIMERS = dict(jitter=0.1, data_timeout=0.25, ack_timeout=0.08)
+_READY = dict(ready_on_enable=True, ready_delay=0.04)
+
+PROTOCOLS: Dict[str, ProtocolSpec] = {
+    "utopia": ProtocolSpec("Utopia", _run_utopia,
+                           dict(loss_prob=0.0, corrupt_prob=0.0),
+                           flow=lambda cfg: lambda: PairFlow(UtopiaSender(), UtopiaReceiver())),
+    "stop_and_wait": ProtocolSpec("Stop-and-Wait", _run_stop_and_wait,
+                                  dict(max_seq=1, nr_bufs=1, loss_prob=0.0, corrupt_prob=0.0, **_TIMERS),
+                                  flow=lambda cfg: lambda: PairFlow(SWSender(), SWReceiver())),
+    "par": ProtocolSpec("PAR", _run_par,
+                        dict(max_seq=1, nr_bufs=1, **_TIMERS),
+                        flow=lambda cfg: lambda: PairFlow(ParSender(), ParReceiver())),
+    "sw1": ProtocolSpec("Sliding Window 1-bit", _run_sw1,
+                        dict(max_seq=1, nr_bufs=1, **_TIMERS, **_READY), flows=("A", "B")),
+    "gbn": ProtocolSpec("Go-Back-N", _run_gbn,
+                        dict(**_TIMERS, **_READY), flows=("A", "B"),
+                        flow=lambda cfg: lambda: GBNFlow(cfg.max_seq)),
+    "sr": ProtocolSpec("Selective Repeat", _run_sr,
+                       dict(**_TIMERS, **_READY), flows=("A", "B")),
+}
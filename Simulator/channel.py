@@ -1,22 +1,399 @@
 
 import random
+from collections import deque
+from typing import Optional
+from Simulator.router import make_queue_policy
+from Simulator.loss import gilbert_from_config
+from Simulator.replay import TraceReplay
 
+"""
+    Clase enlace punto a punto en una direccion (A>B o B>A) con tasa finita.
+    Cada frame ocupa el enlace nbytes*8/bitrate segundos y espera (FIFO) a que
+    termine de salir el anterior; el retardo de propagacion se suma aparte
+    (ChannelPolicy.sample_delay).
+    Con policy el enlace es la salida de un router cuello de botella con buffer
+    finito: la politica (Simulator.router) decide si el frame entra o se descarta.
+    Args:
+        bitrate (float): Bits por segundo (> 0)
+        policy (DropTail | RedQueue, opcional): Admision al buffer; None = buffer infinito
+    Atributos:
+        free_at (float): Instante en que el enlace termina de transmitir lo encolado
+        busy (float): Segundos ocupados transmitiendo
+        frames, bytes (int): Frames y bytes transmitidos
+        wait (float): Suma de esperas en cola; max_wait la mayor
+        drops (int): Frames descartados por el buffer; max_queue la mayor ocupacion vista
+"""
+class Link:
+
+    __slots__ = ("bitrate", "free_at", "busy", "frames", "bytes", "wait", "max_wait",
+                 "policy", "drops", "max_queue", "_fin", "_last_tx")
+
+    def __init__(self, bitrate: float, policy=None):
+        if bitrate <= 0:
+            raise ValueError("bitrate debe ser > 0")
+        self.bitrate = float(bitrate)
+        self.free_at = 0.0
+        self.busy = 0.0
+        self.frames = 0
+        self.bytes = 0
+        self.wait = 0.0
+        self.max_wait = 0.0
+        self.policy = policy
+        self.drops = 0
+        self.max_queue = 0
+        self._fin = deque()          # instantes de fin de transmision de los frames en el buffer
+        self._last_tx = 0.0
+
+    """
+        Funcion que devuelve la ocupacion del buffer
+        Args:
+            now (float): Instante de la consulta
+        Returns:
+            int: Frames esperando mas el que se esta transmitiendo (solo con policy; si no, 0)
+    """
+    def occupancy(self, now: float) -> int:
+        fin = self._fin
+        while fin and fin[0] <= now:
+            fin.popleft()
+        return len(fin)
+
+    """
+        Funcion que pone un frame en el enlace
+        Args:
+            now (float): Instante en que el emisor entrega el frame
+            nbytes (int): Tamaño del frame
+        Returns:
+            float | None: Segundos desde now hasta que sale el ultimo bit (espera + serializacion);
+                          None si el buffer lo descarta
+    """
+    def transmit(self, now: float, nbytes: int) -> Optional[float]:
+        tx = nbytes * 8 / self.bitrate
+        if self.policy is not None:
+            q = self.occupancy(now)
+            idle = (now - self.free_at) / self._last_tx if q == 0 and self._last_tx else 0.0
+            if not self.policy.admit(q, now, idle):
+                self.drops += 1
+                return None
+            if q >= self.max_queue:
+                self.max_queue = q + 1
+            self._last_tx = tx
+        start = self.free_at if self.free_at > now else now
+        self.free_at = start + tx
+        if self.policy is not None:
+            self._fin.append(self.free_at)
+        w = start - now
+        self.wait += w
+        if w > self.max_wait:
+            self.max_wait = w
+        self.busy += tx
+        self.frames += 1
+        self.bytes += nbytes
+        return self.free_at - now
+
+    """
+        Funcion que resume el uso del enlace
+        Args:
+            elapsed (float): Tiempo simulado de la corrida
+        Returns:
+            dict: frames y bytes entregados al enlace, utilization (fraccion de elapsed ocupada
+                  transmitiendo), throughput en b/s, backlog (segundos de transmision aun
+                  encolados al final), espera media y maxima en cola y, con buffer finito,
+                  "queue" (descartes, ocupacion maxima y media por ley de Little)
+    """
+    def summary(self, elapsed: float) -> dict:
+        backlog = max(0.0, self.free_at - elapsed)
+        util = min(1.0, (self.busy - backlog) / elapsed) if elapsed > 0 else 0.0
+        out = {
+            "bitrate": self.bitrate,
+            "frames": self.frames,
+            "bytes": self.bytes,
+            "utilization": util,
+            "throughput_bps": util * self.bitrate,
+            "backlog": backlog,
+            "mean_wait": self.wait / self.frames if self.frames else 0.0,
+            "max_wait": self.max_wait,
+        }
+        if self.policy is not None:
+            out["queue"] = {
+                "limit": self.policy.limit,
+                "drops": self.drops,
+                "early_drops": self.policy.early_drops,
+                "max_occupancy": self.max_queue,
+                "mean_occupancy": (self.wait + self.busy) / elapsed if elapsed > 0 else 0.0,
+                **self.policy.summary(),
+            }
+        return out
+
+
+LOSS_MODELS = ("bernoulli", "gilbert")
+
+# Parametros de SimConfig que se pueden cambiar para la direccion B>A (SimConfig.reverse)
+DIRECTION_FIELDS = ("delay", "jitter", "loss_prob", "corrupt_prob", "bitrate", "channel_trace",
+                    "dup_prob", "reorder_prob", "reorder_distance", "reorder_hold")
+
+
+"""
+    Clase vista de un SimConfig con algunos campos reemplazados (canal B>A).
+    Los campos de overrides son atributos propios; el resto se lee del SimConfig
+    en cada acceso, asi los cambios posteriores al cfg (p.ej. los plugins de la
+    GUI que fijan jitter) siguen valiendo para ambas direcciones.
+    Args:
+        base (SimConfig): Configuracion de la direccion A>B
+        overrides (dict): Campo -> valor (solo DIRECTION_FIELDS)
+    Raises:
+        ValueError: Si algun campo no es de DIRECTION_FIELDS
+"""
+class _Overlay:
+
+    def __init__(self, base, overrides: dict):
+        bad = set(overrides) - set(DIRECTION_FIELDS)
+        if bad:
+            raise ValueError(f"SimConfig.reverse: campos invalidos {sorted(bad)} (validos: {', '.join(DIRECTION_FIELDS)})")
+        self._base = base
+        self.__dict__.update(overrides)
+
+    def __getattr__(self, name):
+        return getattr(self._base, name)
+
+
+def _always():
+    return True
+
+
+"""
+    Clase que retiene frames para forzar un reordenamiento de distancia fija
+    Args:
+        prob (float): Prob. de retener cada frame
+        distance (int): Frames posteriores que deben pasar a uno retenido
+        hold_time (float): Maximo de segundos retenido si no pasan suficientes frames
+    Atributos:
+        held (deque[list]): Retenidos en orden de envio: [faltan, llegada, ev, payload]
+        reordered (int): Frames retenidos; expired los liberados por hold_time
+"""
+class Reorder:
+
+    __slots__ = ("prob", "distance", "hold_time", "held", "reordered", "expired")
+
+    def __init__(self, prob: float, distance: int, hold_time: float):
+        if distance <= 0:
+            raise ValueError("reorder_distance debe ser > 0")
+        self.prob = prob
+        self.distance = distance
+        self.hold_time = hold_time
+        self.held = deque()
+        self.reordered = 0
+        self.expired = 0
+
+    def hold(self, t: float, ev, payload) -> list:
+        h = [self.distance, t, ev, payload]
+        self.held.append(h)
+        self.reordered += 1
+        return h
+
+    """
+        Funcion que registra que un frame paso a los retenidos
+        Args:
+            t (float): Llegada del frame que paso
+        Returns:
+            list[tuple]: (llegada, ev, payload) de los retenidos que ya fueron pasados distance
+                         veces; llegan despues de t (se agendan despues de ese frame)
+    """
+    def overtake(self, t: float) -> list:
+        held = self.held
+        if not held:
+            return []
+        for h in held:
+            h[0] -= 1
+            if h[1] < t:
+                h[1] = t
+        out = []
+        while held and held[0][0] <= 0:
+            h = held.popleft()
+            out.append((h[1], h[2], h[3]))
+        return out
+
+    # Quita un retenido al vencer hold_time; False si ya habia salido
+    def expire(self, h: list) -> bool:
+        try:
+            self.held.remove(h)
+        except ValueError:
+            return False
+        self.expired += 1
+        return True
+
+
+"""
+    Clase canal de una direccion: retardo, perdida, corrupcion y, con bitrate, el enlace
+    de tasa finita (y el buffer del router si hay queue_size)
+    Args:
+        cfg (SimConfig): Configuracion del canal
+        overrides (dict, opcional): Campos distintos para esta direccion (ver DIRECTION_FIELDS)
+        rng: Generador de los sorteos del canal (el del motor; el modulo random por defecto)
+"""
 class ChannelPolicy:
 
-    def __init__(self, cfg):
-        self.cfg = cfg
+    def __init__(self, cfg, overrides: Optional[dict] = None, rng=random):
+        self.cfg = _Overlay(cfg, overrides) if overrides else cfg
+        self.rng = rng
+        # Sin bitrate la transmision es instantanea; con queue_size el enlace tiene delante
+        # el buffer finito del router cuello de botella
+        rate = getattr(self.cfg, "bitrate", 0.0)
+        size = getattr(self.cfg, "queue_size", 0)
+        policy = make_queue_policy(getattr(self.cfg, "queue_policy", "droptail"), size, self.cfg, rng) if size and rate else None
+        self.link: Optional[Link] = Link(rate, policy) if rate else None
+        # Duplicacion y reordenamiento explicitos (ver Engine._impaired_send)
+        self.dup_prob = getattr(self.cfg, "dup_prob", 0.0)
+        self.duplicated = 0
+        rp = getattr(self.cfg, "reorder_prob", 0.0)
+        self.reorder: Optional[Reorder] = (Reorder(rp, getattr(self.cfg, "reorder_distance", 1),
+                                                   getattr(self.cfg, "reorder_hold", 1.0)) if rp else None)
+        self.impaired = bool(self.dup_prob) or self.reorder is not None
+        # Modelo con estado (Gilbert-Elliott o traza): reemplaza will_drop/will_corrupt de esta
+        # instancia; la traza ademas reemplaza sample_delay y tiene prioridad sobre loss_model
+        self.model = None
+        self.down = 0                # cortes activos (ver set_down)
+        kind = getattr(self.cfg, "loss_model", "bernoulli")
+        trace = getattr(self.cfg, "channel_trace", None)
+        if trace:
+            self.model = TraceReplay(trace)
+            self.will_drop = self.model.will_drop
+            self.will_corrupt = self.model.will_corrupt
+            self.sample_delay = self.model.sample_delay
+        elif kind == "gilbert":
+            self.model = gilbert_from_config(self.cfg, rng)
+            self.will_drop = self.model.will_drop
+            self.will_corrupt = self.model.will_corrupt
+        elif kind != "bernoulli":
+            raise ValueError(f"loss_model invalido '{kind}' (opciones: {', '.join(LOSS_MODELS)})")
 
     def sample_delay(self):
         if self.cfg.jitter == 0:
             return self.cfg.delay
         low = max(0.0, self.cfg.delay - self.cfg.jitter)
         high = self.cfg.delay + self.cfg.jitter
-        return random.uniform(low, high)
+        return self.rng.uniform(low, high)
 
     #Si el numero dado por el random es menor a la probabilidad dada para la perdida, devuelve true
     def will_drop(self):
-        return random.random() < self.cfg.loss_prob
+        return self.rng.random() < self.cfg.loss_prob
 
     # Si el numero dado por el random es menor a la probabilidad dada para la corrupcion, devuelve true
     def will_corrupt(self):
-        return random.random() < self.cfg.corrupt_prob
\ No newline at end of file
+        return self.rng.random() < self.cfg.corrupt_prob
+
+    """
+        Funcion que cambia un parametro solo en esta direccion (escenarios, ver Simulator.scenario)
+        Args:
+            name (str): Campo de SimConfig (delay, jitter, loss_prob, corrupt_prob)
+            value: Valor nuevo
+        Returns:
+            Valor anterior (para restaurarlo)
+    """
+    def set_param(self, name: str, value):
+        if not isinstance(self.cfg, _Overlay):
+            self.cfg = _Overlay(self.cfg, {})
+        old = getattr(self.cfg, name)
+        setattr(self.cfg, name, value)
+        return old
+
+    """
+        Funcion que corta o restablece el enlace: cortado, todo frame se pierde
+        Args:
+            down (bool): True corta; False deshace un corte (los cortes solapados se cuentan)
+    """
+    def set_down(self, down: bool):
+        self.down += 1 if down else -1
+        if self.down > 0:
+            self.will_drop = _always
+        elif self.model is not None:
+            self.will_drop = self.model.will_drop
+        else:
+            self.__dict__.pop("will_drop", None)
+
+    # Espera en cola + serializacion del frame en el enlace (0 sin bitrate, None si el buffer lo descarta)
+    def transmission_delay(self, now, nbytes):
+        return self.link.transmit(now, nbytes) if self.link is not None else 0.0
+
+    # Libera el modelo de perdida si tiene recursos (el mmap de TraceReplay); sus contadores siguen disponibles
+    def close(self):
+        close = getattr(self.model, "close", None)
+        if close is not None:
+            close()
+
+
+"""
+    Funcion que arma los canales de ambas direcciones
+    Args:
+        cfg (SimConfig): Configuracion; cfg.reverse (dict, opcional) reemplaza campos para B>A
+        rng: Generador de los sorteos (ver Engine, seed)
+    Returns:
+        dict[str, ChannelPolicy]: Emisor -> canal ("A" = A>B, "B" = B>A); si ambas direcciones
+                                  reproducen el mismo archivo de traza, B>A arranca en su mitad
+    Raises:
+        ValueError: Si reverse tiene campos invalidos o hay queue_size sin ningun enlace con bitrate
+"""
+def make_channels(cfg, rng=random):
+    fwd = ChannelPolicy(cfg, None, rng)
+    try:
+        back = ChannelPolicy(cfg, getattr(cfg, "reverse", None), rng)
+    except Exception:
+        fwd.close()
+        raise
+    chans = {"A": fwd, "B": back}
+    if isinstance(fwd.model, TraceReplay) and isinstance(back.model, TraceReplay) and fwd.model.path == back.model.path:
+        # misma traza en ambas direcciones: desfasada media traza para no perder en espejo
+        back.model.seek(back.model.records // 2)
+    if getattr(cfg, "queue_size", 0) and all(ch.link is None for ch in chans.values()):
+        fwd.close()
+        back.close()
+        raise ValueError("queue_size necesita bitrate > 0 (sin tasa finita la cola nunca crece)")
+    return chans
+
+
+"""
+    Funcion que resume los enlaces con tasa finita
+    Args:
+        chans (dict[str, ChannelPolicy]): Canales por emisor (ver make_channels)
+        elapsed (float): Tiempo simulado de la corrida
+    Returns:
+        dict | None: {"A>B": ..., "B>A": ...} (ver Link.summary) para las direcciones con bitrate; None si ninguna
+"""
+def link_summary(chans, elapsed):
+    out = {f"{s}>{'B' if s == 'A' else 'A'}": ch.link.summary(elapsed)
+           for s, ch in chans.items() if ch.link is not None}
+    return out or None
+
+
+"""
+    Funcion que resume los modelos de perdida con estado
+    Args:
+        chans (dict[str, ChannelPolicy]): Canales por emisor (ver make_channels)
+    Returns:
+        dict | None: {"A>B": ..., "B>A": ...} (ver GilbertElliott.summary y TraceReplay.summary);
+                     None con perdidas independientes
+"""
+def loss_summary(chans):
+    out = {f"{s}>{'B' if s == 'A' else 'A'}": ch.model.summary()
+           for s, ch in chans.items() if ch.model is not None}
+    return out or None
+
+
+"""
+    Funcion que resume la duplicacion y el reordenamiento
+    Args:
+        chans (dict[str, ChannelPolicy]): Canales por emisor (ver make_channels)
+    Returns:
+        dict | None: Por direccion: duplicated, reordered, expired (liberados por reorder_hold);
+                     None sin estas alteraciones
+"""
+def impairment_summary(chans):
+    out = {}
+    for s, ch in chans.items():
+        if ch.impaired:
+            r = ch.reorder
+            out[f"{s}>{'B' if s == 'A' else 'A'}"] = {
+                "duplicated": ch.duplicated,
+                "reordered": r.reordered if r is not None else 0,
+                "expired": r.expired if r is not None else 0,
+            }
+    return out or None
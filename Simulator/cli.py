@@ -0,0 +1,544 @@
+import argparse, json, random, sys
+from dataclasses import fields
+from typing import Callable, Dict, List, Optional
+from Simulator.config import SimConfig
+from Simulator.engine import Engine, SimulationStopped, QueueDrained
+from Simulator.scheduler import SCHEDULERS
+from Simulator.router import QUEUE_POLICIES
+from Simulator.channel import LOSS_MODELS, make_channels, link_summary, loss_summary, impairment_summary
+from Simulator.trace import JsonlTraceWriter, CsvTraceWriter, BinaryTraceWriter, TRACE_LEVELS, attach_writer
+from Simulator.traffic import parse_source, offered_rate
+from Simulator.stream import parse_stream
+from Simulator.framing import slot_size_for
+from Simulator.scenario import Scenario, parse_scenario
+from Simulator.flows import FlowMux, flow_names
+from Simulator.metrics import Counters, LatencyTracker
+from Simulator.invariants import DeliveryChecker, DeliveryViolation
+from Events.api import bind
+from Protocols.drivers import PROTOCOLS, ProtocolSpec
+
+"""
+    Punto de entrada unico sin GUI para todos los protocolos.
+    Uso (desde la raiz del repo):
+        python -m Simulator.cli gbn --loss 0.1 --seed 1 --max-events 20000 --format jsonl --out gbn.jsonl
+    No importa tkinter, asi que sirve para corridas por lotes a maxima velocidad.
+"""
+
+DEFAULT_MAX_EVENTS = 10000
+DELIVER_EVENTS_PER_MSG = 1000      # tope de seguridad de --deliver sin otra condicion (p.ej. Utopia con perdidas)
+
+# opcion del CLI -> campo de SimConfig
+_CFG_ARGS = {
+    "delay": "delay",
+    "jitter": "jitter",
+    "loss": "loss_prob",
+    "corrupt": "corrupt_prob",
+    "data_timeout": "data_timeout",
+    "ack_timeout": "ack_timeout",
+    "max_seq": "max_seq",
+    "ready_delay": "ready_delay",
+    "trace_level": "trace_level",
+    "trace_sample": "trace_sample",
+    "scheduler": "scheduler",
+    "bit_accurate": "bit_accurate",
+    "frame_mtu": "frame_mtu",
+    "corrupt_bits": "corrupt_bits",
+    "bitrate": "bitrate",
+    "frame_bytes": "frame_bytes",
+    "ack_bytes": "ack_bytes",
+    "queue_size": "queue_size",
+    "queue_policy": "queue_policy",
+    "red_min": "red_min",
+    "red_max": "red_max",
+    "red_max_p": "red_max_p",
+    "loss_model": "loss_model",
+    "channel_trace": "channel_trace",
+    "dup": "dup_prob",
+    "reorder": "reorder_prob",
+    "reorder_distance": "reorder_distance",
+    "reorder_hold": "reorder_hold",
+}
+
+_GE_FIELDS = ("ge_p", "ge_r", "ge_loss_good", "ge_loss_bad", "ge_corrupt_good", "ge_corrupt_bad")
+
+_RATE_SUFFIX = {"k": 1e3, "m": 1e6, "g": 1e9}
+
+
+"""
+    Funcion que interpreta una tasa de bits con sufijo opcional
+    Args:
+        text (str): p.ej. "64000", "512k", "10M", "1G"
+    Returns:
+        float: Bits por segundo
+    Raises:
+        argparse.ArgumentTypeError: Si no es un numero >= 0
+"""
+def parse_bitrate(text: str) -> float:
+    mult = _RATE_SUFFIX.get(text[-1:].lower(), 1.0)
+    try:
+        v = float(text[:-1] if mult != 1.0 else text) * mult
+    except ValueError:
+        v = -1.0
+    if v < 0:
+        raise argparse.ArgumentTypeError(f"tasa invalida: {text!r}")
+    return v
+
+
+"""
+    Funcion que construye el parser de argumentos del CLI
+    Returns:
+        argparse.ArgumentParser
+"""
+def build_parser() -> argparse.ArgumentParser:
+    p = argparse.ArgumentParser(prog="python -m Simulator.cli",
+                                description="Simulador de protocolos de enlace sin GUI")
+    p.add_argument("protocol", choices=sorted(PROTOCOLS), help="protocolo a simular")
+
+    ch = p.add_argument_group("canal y temporizadores (por defecto los del protocolo)")
+    ch.add_argument("--delay", type=float)
+    ch.add_argument("--jitter", type=float)
+    ch.add_argument("--loss", type=float, help="probabilidad de perdida (0-1)")
+    ch.add_argument("--corrupt", type=float, help="probabilidad de corrupcion (0-1)")
+    ch.add_argument("--data-timeout", type=float)
+    ch.add_argument("--ack-timeout", type=float)
+    ch.add_argument("--max-seq", type=int)
+    ch.add_argument("--ready-delay", type=float)
+    ch.add_argument("--bit-accurate", action="store_true", default=None,
+                    help="serializar frames con CRC32 y corromper bits reales (la deteccion la hace el CRC)")
+    ch.add_argument("--corrupt-bits", type=int, help="bits invertidos por frame corrupto en --bit-accurate")
+    ch.add_argument("--frame-mtu", type=int, metavar="BYTES",
+                    help="bytes por slot de frame serializado en --bit-accurate (por defecto 2048, o lo "
+                         "que pida --segment)")
+    ch.add_argument("--bitrate", type=parse_bitrate, metavar="BPS",
+                    help="tasa de cada enlace en bits/s (sufijos k, M, G): cada frame paga su "
+                         "serializacion y espera a los anteriores; 0 = instantaneo")
+    ch.add_argument("--frame-bytes", type=int, help="tamaño de un frame DATA en el cable (sin --bit-accurate)")
+    ch.add_argument("--ack-bytes", type=int, help="tamaño de un frame ACK en el cable (sin --bit-accurate)")
+    ch.add_argument("--loss-model", choices=LOSS_MODELS,
+                    help="perdidas independientes (bernoulli, usa --loss/--corrupt) o en rafagas (gilbert)")
+    ch.add_argument("--ge", metavar="P,R[,LG,LB[,CG,CB]]",
+                    help="parametros de Gilbert-Elliott: prob. Good->Bad, Bad->Good, perdida en Good/Bad y "
+                         "corrupcion en Good/Bad (implica --loss-model gilbert; ajustables con python -m Simulator.loss)")
+    ch.add_argument("--channel-trace", metavar="ARCHIVO",
+                    help="reproducir delay/perdida/corrupcion por frame desde una traza binaria "
+                         "(python -m Simulator.replay convert); reemplaza --delay/--jitter/--loss/--corrupt")
+    ch.add_argument("--dup", type=float, help="probabilidad de duplicar un frame (0-1)")
+    ch.add_argument("--reorder", type=float, help="probabilidad de retener un frame para reordenarlo (0-1)")
+    ch.add_argument("--reorder-distance", type=int, metavar="N",
+                    help="frames posteriores que pasan a uno retenido (por defecto 1)")
+    ch.add_argument("--reorder-hold", type=float, metavar="S",
+                    help="maximo de segundos retenido si no pasan N frames (por defecto 1)")
+    ch.add_argument("--reverse", metavar="CLAVE=VALOR,...",
+                    help="canal B>A distinto del A>B, p.ej. 'delay=0.2,loss=0.3,bitrate=64k' "
+                         "(claves: delay, jitter, loss, corrupt, bitrate, trace, dup, reorder, "
+                         "reorder_distance, reorder_hold; lo demas igual que A>B)")
+    ch.add_argument("--queue-size", type=int, metavar="FRAMES",
+                    help="buffer del router cuello de botella por direccion (requiere --bitrate)")
+    ch.add_argument("--queue-policy", choices=sorted(QUEUE_POLICIES), help="admision al buffer (por defecto droptail)")
+    ch.add_argument("--red-min", type=float, help="umbral minimo de RED (fraccion del buffer)")
+    ch.add_argument("--red-max", type=float, help="umbral maximo de RED (fraccion del buffer)")
+    ch.add_argument("--red-max-p", type=float, help="probabilidad de descarte de RED en el umbral maximo")
+
+    tr = p.add_argument_group("trafico (por defecto fuente saturada: siempre hay datos)")
+    tr.add_argument("--source", action="append", default=[], metavar="PEER=SPEC",
+                    help="fuente para un peer, p.ej. A=poisson:rate=50, B=onoff:rate=200,on=0.5,off=1, "
+                         "A=fixed:rate=20 o A=file:n=500 (repetible)")
+
+    tr.add_argument("--stream", action="append", default=[], metavar="PEER=SPEC",
+                    help="flujo de bytes para un peer: A=gen:1000000 (bytes pseudoaleatorios) o A=ruta/archivo; "
+                         "se segmenta, se reensambla en el receptor y se verifica byte a byte (repetible)")
+    tr.add_argument("--segment", type=int, default=1024, metavar="BYTES",
+                    help="bytes por segmento de --stream (por defecto 1024)")
+    tr.add_argument("--flows", type=int, metavar="K",
+                    help="K flujos A>B independientes sobre el mismo canal (utopia, stop_and_wait, par, gbn); "
+                         "con --source A=SPEC cada flujo tiene su propia fuente")
+
+    sc = p.add_argument_group("escenario (cambios del canal en el tiempo)")
+    sc.add_argument("--scenario", action="append", default=[], metavar="PASO",
+                    help="T[+D][@DIR]:accion,... p.ej. '5:loss=0.3', '10+2:outage', '15+1:delay=0.5', "
+                         "'20@B>A:corrupt=0.1'; '@archivo' lee un paso por linea (repetible)")
+    sc.add_argument("--recovery-window", type=float, default=2.0, metavar="S",
+                    help="ventana para el goodput de referencia y la recuperacion (por defecto 2 s)")
+    sc.add_argument("--recovery-frac", type=float, default=0.9,
+                    help="fraccion del goodput de referencia que cuenta como recuperado (por defecto 0.9)")
+
+    run = p.add_argument_group("corrida")
+    run.add_argument("--seed", type=int, help="semilla de random (reproducibilidad)")
+    run.add_argument("--scheduler", choices=sorted(SCHEDULERS),
+                     help="cola de eventos pendientes (por defecto heap)")
+    run.add_argument("--strict", action="store_true",
+                     help="abortar en la primera entrega duplicada, fuera de orden o con hueco (implica --check)")
+    run.add_argument("--check", action="store_true",
+                     help="verificar cada entrega (orden, duplicados, huecos): delivery_ok/delivery_check")
+    run.add_argument("--latency", action="store_true",
+                     help="medir latencia y retransmisiones por mensaje (latency, by_flow, retx_per_msg)")
+    run.add_argument("--max-events", type=int,
+                     help=f"parar tras N eventos (por defecto {DEFAULT_MAX_EVENTS} si no hay otra condicion)")
+    run.add_argument("--until", type=float, help="parar en este tiempo simulado (s)")
+    run.add_argument("--deliver", type=int, metavar="N",
+                     help="transferencia finita: parar cuando cada flujo entrego en orden N mensajes "
+                          "(reporta completion_time)")
+
+    out = p.add_argument_group("salida")
+    out.add_argument("--format", choices=("jsonl", "csv", "bin"), default="jsonl")
+    out.add_argument("--out", default="-", help="archivo de salida ('-' = stdout)")
+    out.add_argument("--records", default="tx,rx",
+                     help="registros a volcar: lista de tx,rx,ev o 'none' (solo resumen)")
+    out.add_argument("--trace-level", choices=TRACE_LEVELS,
+                     help="detalle de la traza: off/counters (solo resumen), sample (cada registro con "
+                          "prob. 1/--trace-sample) o full (por defecto)")
+    out.add_argument("--trace-sample", type=int, metavar="N",
+                     help="nivel sample: 1 de cada N registros en promedio, al azar (por defecto 100)")
+    return p
+
+
+"""
+    Funcion que arma la configuracion: SimConfig por defecto, luego los valores
+    propios del protocolo y por ultimo lo que se paso por linea de comandos
+    Args:
+        spec (ProtocolSpec): Protocolo elegido
+        args (argparse.Namespace): Argumentos parseados
+    Returns:
+        SimConfig
+    Raises:
+        ValueError: Si --ge o --reverse no son validos
+"""
+def build_config(spec: ProtocolSpec, args) -> SimConfig:
+    cfg = SimConfig()
+    for k, v in spec.defaults.items():
+        setattr(cfg, k, v)
+    for arg, attr in _CFG_ARGS.items():
+        v = getattr(args, arg, None)
+        if v is not None:
+            setattr(cfg, attr, v)
+    if getattr(args, "max_seq", None) is not None:
+        cfg.nr_bufs = (cfg.max_seq + 1) // 2
+    if getattr(args, "ge", None):
+        vals = [float(x) for x in args.ge.split(",")]
+        if len(vals) not in (2, 4, 6):
+            raise ValueError("--ge espera P,R o P,R,LG,LB o P,R,LG,LB,CG,CB")
+        for attr, v in zip(_GE_FIELDS, vals):
+            setattr(cfg, attr, v)
+        if args.loss_model is None:
+            cfg.loss_model = "gilbert"
+    if getattr(args, "reverse", None):
+        cfg.reverse = parse_reverse(args.reverse)
+    return cfg
+
+
+_REVERSE_KEYS = {"delay": ("delay", float), "jitter": ("jitter", float), "loss": ("loss_prob", float),
+                 "corrupt": ("corrupt_prob", float), "bitrate": ("bitrate", parse_bitrate),
+                 "trace": ("channel_trace", str), "dup": ("dup_prob", float),
+                 "reorder": ("reorder_prob", float), "reorder_distance": ("reorder_distance", int),
+                 "reorder_hold": ("reorder_hold", float)}
+
+
+"""
+    Funcion que interpreta --reverse
+    Args:
+        text (str): "clave=valor,..." con claves de _REVERSE_KEYS (delay, loss, bitrate, dup...)
+    Returns:
+        dict: Campos de SimConfig para la direccion B>A (SimConfig.reverse)
+    Raises:
+        ValueError: Si una clave o un valor no son validos
+"""
+def parse_reverse(text: str) -> Dict[str, float]:
+    out = {}
+    for item in text.split(","):
+        key, eq, val = item.partition("=")
+        key = key.strip()
+        if not eq or key not in _REVERSE_KEYS:
+            raise ValueError(f"--reverse {item!r}: se esperaba clave=valor con clave en {', '.join(_REVERSE_KEYS)}")
+        attr, conv = _REVERSE_KEYS[key]
+        try:
+            out[attr] = conv(val.strip())
+        except (ValueError, argparse.ArgumentTypeError) as e:
+            raise ValueError(f"--reverse {item!r}: {e}")
+    return out
+
+
+"""
+    Funcion que interpreta las opciones --source
+    Args:
+        items (list[str]): Valores "PEER=SPEC"
+        spec (ProtocolSpec): Protocolo (los peers validos son sus flows)
+    Returns:
+        dict[str, TrafficSource]: peer -> fuente
+    Raises:
+        ValueError: Si el formato, el peer o la fuente no son validos
+"""
+def parse_sources(items: List[str], spec: ProtocolSpec) -> Dict[str, object]:
+    out = {}
+    for item in items:
+        peer, eq, text = item.partition("=")
+        peer = peer.strip().upper()
+        if not eq:
+            raise ValueError(f"--source {item!r}: se esperaba PEER=SPEC")
+        if peer not in spec.flows:
+            raise ValueError(f"--source: {spec.name} solo origina datos en {', '.join(spec.flows)}")
+        out[peer] = parse_source(text)
+    return out
+
+
+"""
+    Funcion que arma las fuentes del modo multi-flujo
+    Args:
+        items (list[str]): Valores de --source; solo "A=SPEC" (todos los flujos van de A a B)
+        k (int): Cantidad de flujos
+    Returns:
+        dict[str, TrafficSource]: Una fuente independiente por flujo ("f0", "f1", ...)
+    Raises:
+        ValueError: Si el formato, el peer o la fuente no son validos
+"""
+def parse_flow_sources(items: List[str], k: int) -> Dict[str, object]:
+    if not items:
+        return {}
+    if len(items) > 1:
+        raise ValueError("--flows admite un solo --source A=SPEC")
+    peer, eq, text = items[0].partition("=")
+    if not eq or peer.strip().upper() != "A":
+        raise ValueError(f"--source {items[0]!r}: con --flows se espera A=SPEC")
+    return {name: parse_source(text) for name in flow_names(k)}
+
+
+"""
+    Funcion que interpreta las opciones --stream
+    Args:
+        items (list[str]): Valores "PEER=SPEC"
+        spec (ProtocolSpec): Protocolo (los peers validos son sus flows)
+        segment (int): Bytes por segmento
+        seed (int, opcional): Semilla de los bytes generados con gen:N
+    Returns:
+        dict[str, ByteStream]: peer -> flujo
+    Raises:
+        ValueError, OSError: Si el formato, el peer o el archivo no son validos
+"""
+def parse_streams(items: List[str], spec: ProtocolSpec, segment: int, seed: Optional[int] = None) -> Dict[str, object]:
+    rng = random.Random(seed)
+    out = {}
+    for item in items:
+        peer, eq, text = item.partition("=")
+        peer = peer.strip().upper()
+        if not eq:
+            raise ValueError(f"--stream {item!r}: se esperaba PEER=SPEC")
+        if peer not in spec.flows:
+            raise ValueError(f"--stream: {spec.name} solo origina datos en {', '.join(spec.flows)}")
+        out[peer] = parse_stream(text.strip(), segment, rng)
+    return out
+
+
+"""
+    Funcion que ejecuta un protocolo hasta la condicion de parada
+    Args:
+        spec (ProtocolSpec): Protocolo a correr
+        cfg (SimConfig): Configuracion de la simulacion
+        seed (int, opcional): Semilla del generador del motor (Engine.rng)
+        max_events (int, opcional): Maximo de eventos
+        until (float, opcional): Tiempo simulado maximo
+        sources (dict[str, TrafficSource], opcional): Fuentes de trafico por peer
+        deliver (int | dict[str, int], opcional): Mensajes a entregar en orden por flujo antes de parar
+            (con streams y sin deliver: todos los segmentos de cada flujo)
+        streams (dict[str, ByteStream], opcional): Flujos de bytes por peer
+        scenario (Scenario, opcional): Cambios del canal en el tiempo (ver Simulator.scenario)
+        flows (int): Con K > 0, K flujos independientes del protocolo (spec.flow) sobre el mismo
+            motor (ver Simulator.flows); sources y deliver se refieren a los peers "f0".."f{K-1}"
+        latency (bool): Medir latencia por mensaje (probe "latency")
+        check (bool): Verificar cada entrega (probe "delivery")
+        strict (bool): Abortar en la primera violacion de entrega (stop_reason "violation"); implica check
+        setup (Callable[[Engine], None], opcional): Se llama con el motor antes de correr
+            (p.ej. para suscribir un escritor de traza)
+    Returns:
+        Engine: El motor al final de la corrida, ya cerrado (Engine.close; stop_reason indica por
+                que termino); su probe "counters" (y "latency"/"delivery" si se pidieron) tiene las metricas
+"""
+def run_protocol(spec: ProtocolSpec, cfg: SimConfig, seed: Optional[int] = None,
+                 max_events: Optional[int] = None, until: Optional[float] = None,
+                 sources: Optional[Dict[str, object]] = None, deliver=None,
+                 streams: Optional[Dict[str, object]] = None, scenario: Optional[Scenario] = None,
+                 flows: int = 0, latency: bool = False, check: bool = False,
+                 strict: bool = False, setup: Optional[Callable[[Engine], None]] = None) -> Engine:
+    # sin logs en memoria: por defecto solo contadores (nada por mensaje); latencia y
+    # verificacion de entregas siguen cada mensaje y se piden aparte. Con semilla el motor
+    # sortea con su propio generador (corridas en paralelo reproducibles)
+    eng = Engine(cfg, record=False, seed=seed)
+    try:
+        eng.add_probe("counters", Counters())
+        if latency:
+            eng.add_probe("latency", LatencyTracker())
+        if check or strict:
+            eng.add_probe("delivery", DeliveryChecker(strict=strict))
+        if setup is not None:
+            setup(eng)
+        mux = None
+        if flows:
+            if spec.flow is None:
+                raise ValueError(f"{spec.name} no soporta el modo multi-flujo")
+            mux = eng.attach_flows(FlowMux(spec.flow(cfg), flows))
+            peers = mux.names
+        else:
+            # con fuentes o flujos de bytes solo esos peers originan datos
+            peers = tuple(dict.fromkeys([*(sources or {}), *(streams or {})])) or spec.flows
+        if streams and deliver is None:
+            deliver = {peer: st.segments for peer, st in streams.items()}
+        eng.set_stop(max_events=max_events, until=until, deliver=deliver, flows=peers)
+        bind(eng)
+        for peer, src in (sources or {}).items():
+            eng.attach_source(peer, src)
+        for peer, st in (streams or {}).items():
+            eng.attach_stream(peer, st)
+        if scenario is not None:
+            eng.attach_scenario(scenario)
+        try:
+            if mux is not None:
+                # los protocolos llaman a Events.api: cada llamada va al flujo que atiende el evento
+                bind(mux)
+                mux.run()
+            else:
+                spec.run(cfg)
+            eng.stop_reason = eng.stop_reason or "protocol_done"
+        except SimulationStopped:
+            pass
+        except DeliveryViolation as e:
+            eng.stop_reason = "violation"
+            print(e, file=sys.stderr)
+        except QueueDrained:
+            # cola vacia con la capa de red deshabilitada: nadie puede avanzar
+            eng.stop_reason = "drained"
+    finally:
+        # la corrida termino: libera los mmap de --channel-trace (los resumenes no los usan)
+        eng.close()
+    return eng
+
+
+"""
+    Funcion que resume una corrida en un diccionario serializable
+    Args:
+        key (str): Clave del protocolo en PROTOCOLS
+        eng (Engine): Motor al final de la corrida
+        seed (int, opcional): Semilla usada
+    Returns:
+        dict
+"""
+def summarize(key: str, eng: Engine, seed: Optional[int]) -> dict:
+    counters = eng.probes["counters"]
+    checker = eng.probes.get("delivery")
+    tracker = eng.probes.get("latency")
+    n_data = counters.tx_data
+    n_rx = counters.rx
+    t = eng.now
+    return {
+        "protocol": key,
+        "seed": seed,
+        "stop_reason": eng.stop_reason,
+        "time": t,
+        "events": eng.events_processed,
+        **counters.summary(),
+        "efficiency": (n_rx / n_data) if n_data else 0.0,
+        "goodput_pkts_s": (n_rx / t) if t > 0 else 0.0,
+        "in_order": dict(eng.in_order),
+        "completion_time": t if eng.stop_reason == "delivered" else None,
+        "completed_at": dict(eng.completed_at),
+        **(tracker.summary() if tracker is not None else {}),
+        **({"delivery_ok": checker.ok(), "delivery_check": checker.summary()} if checker is not None else {}),
+        "framing": eng.codec.summary() if eng.codec is not None else None,
+        "links": link_summary(eng.chans, eng.now),
+        "loss_model": loss_summary(eng.chans),
+        "impairments": impairment_summary(eng.chans),
+        "streams": {peer: eng.probes[f"stream_{peer}"].summary() for peer in eng.streams},
+        "scenario": eng.probes["scenario"].summary() if "scenario" in eng.probes else None,
+        "flows": eng.probes["flows"].summary() if "flows" in eng.probes else None,
+        "sources": {peer: {"model": src.describe(), "offered_pkts_s": offered_rate(src),
+                           "arrived": eng.arrivals[peer], "backlog": len(eng.backlog[peer])}
+                    for peer, src in eng.sources.items()},
+        "config": {f.name: getattr(eng.cfg, f.name) for f in fields(eng.cfg)},
+    }
+
+
+def _open_writer(fmt: str, path: str):
+    if fmt == "bin":
+        out = sys.stdout.buffer if path == "-" else open(path, "wb")
+        return BinaryTraceWriter(out), out
+    out = sys.stdout if path == "-" else open(path, "w", newline="", encoding="utf-8")
+    return (CsvTraceWriter(out) if fmt == "csv" else JsonlTraceWriter(out)), out
+
+
+"""
+    Funcion principal del CLI
+    Args:
+        argv (list[str], opcional): Argumentos (por defecto sys.argv[1:])
+    Returns:
+        int: Codigo de salida
+"""
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    spec = PROTOCOLS[args.protocol]
+    try:
+        cfg = build_config(spec, args)
+        make_channels(cfg)      # valida canal, cola y modelo de perdidas antes de abrir la salida
+    except (ValueError, OSError) as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    try:
+        if args.flows is not None:
+            if args.flows <= 0 or spec.flow is None:
+                raise ValueError(f"--flows: necesita K > 0 y un protocolo que lo soporte "
+                                 f"({', '.join(k for k, s in PROTOCOLS.items() if s.flow is not None)})")
+            if args.stream:
+                raise ValueError("--stream no se combina con --flows")
+            sources = parse_flow_sources(args.source, args.flows)
+        else:
+            sources = parse_sources(args.source, spec)
+        streams = parse_streams(args.stream, spec, args.segment, args.seed)
+        if cfg.bit_accurate:
+            # cada frame serializado tiene que entrar en un slot: sin --frame-mtu el slot se agranda
+            # lo que pida el segmento; con --frame-mtu un segmento mas grande es un error
+            need = slot_size_for(args.segment if streams else 0)
+            if args.frame_mtu is None:
+                cfg.frame_mtu = max(cfg.frame_mtu, need)
+            elif cfg.frame_mtu < need:
+                raise ValueError(f"--frame-mtu {cfg.frame_mtu}: con --bit-accurate un frame ocupa hasta "
+                                 f"{need} bytes" + (f" (--segment {args.segment})" if streams else ""))
+        scenario = (Scenario(parse_scenario(args.scenario), args.recovery_window, args.recovery_frac)
+                    if args.scenario else None)
+    except (ValueError, OSError) as e:
+        print(e, file=sys.stderr)
+        return 2
+
+    max_events = args.max_events
+    if max_events is None and args.until is None:
+        if args.deliver is not None:
+            max_events = DELIVER_EVENTS_PER_MSG * args.deliver * (args.flows or 1)
+        elif streams:
+            max_events = DELIVER_EVENTS_PER_MSG * max(st.segments for st in streams.values())
+        else:
+            max_events = DEFAULT_MAX_EVENTS
+
+    records = set() if args.records == "none" else {r.strip() for r in args.records.split(",") if r.strip()}
+    unknown = records - {"tx", "rx", "ev"}
+    if unknown:
+        print(f"--records: desconocidos {sorted(unknown)}", file=sys.stderr)
+        return 2
+
+    writer, out = _open_writer(args.format, args.out)
+    try:
+        # la traza se escribe mientras corre, sin acumularla en el motor
+        eng = run_protocol(spec, cfg, seed=args.seed, max_events=max_events, until=args.until,
+                           sources=sources, deliver=args.deliver, streams=streams, scenario=scenario,
+                           flows=args.flows or 0, latency=args.latency, check=args.check,
+                           strict=args.strict,
+                           setup=lambda e: attach_writer(e, writer, records,
+                                                         cfg.trace_level, cfg.trace_sample))
+        summary = summarize(args.protocol, eng, args.seed)
+        writer.write_summary(summary)
+        writer.close()
+    finally:
+        if out not in (sys.stdout, sys.stdout.buffer):
+            out.close()
+
+    print(json.dumps(summary), file=sys.stderr)
+    return 1 if eng.stop_reason == "violation" else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Any, Dict, Optional
 
 @dataclass
 class SimConfig:
@@ -11,4 +12,32 @@ class SimConfig:
     max_seq: int = 7
     nr_bufs: int = (7 + 1)//2
     ready_on_enable: bool = False
-    ready_delay: float = 0.005
\ No newline at end of file
+    ready_delay: float = 0.005
+    trace_level: str = "full"     # logs del motor: "off", "counters", "sample" (prob. 1/trace_sample) o "full"
+    trace_sample: int = 100
+    scheduler: str = "heap"       # cola de eventos: "heap" o "ladder" (ver Simulator.scheduler)
+    bit_accurate: bool = False    # serializar frames con CRC32 y corromper bits reales (ver Simulator.framing)
+    corrupt_bits: int = 1         # bits invertidos por frame corrupto en modo bit a bit
+    frame_mtu: int = 2048         # bytes por buffer de frame serializado
+    bitrate: float = 0.0          # bits/s de cada enlace (A>B y B>A); 0 = transmision instantanea
+    frame_bytes: int = 1500       # tamaño de un frame DATA en el cable (en modo bit a bit se usa el real)
+    ack_bytes: int = 64           # tamaño de un frame ACK/NAK en el cable
+    queue_size: int = 0           # buffer del router cuello de botella en frames por direccion (0 = infinito, requiere bitrate)
+    queue_policy: str = "droptail"  # admision al buffer: "droptail" o "red" (ver Simulator.router)
+    red_min: float = 0.25         # umbrales de RED como fraccion de queue_size
+    red_max: float = 0.75
+    red_max_p: float = 0.1        # prob. de descarte de RED al llegar a red_max
+    red_weight: float = 0.002     # peso del promedio exponencial de ocupacion de RED
+    reverse: Optional[Dict[str, Any]] = None  # canal B>A distinto (ver Simulator.channel.DIRECTION_FIELDS)
+    loss_model: str = "bernoulli" # "bernoulli" (loss_prob/corrupt_prob independientes) o "gilbert" (ver Simulator.loss)
+    ge_p: float = 0.01            # Gilbert-Elliott: prob. Good->Bad por frame
+    ge_r: float = 0.3             # Gilbert-Elliott: prob. Bad->Good por frame
+    ge_loss_good: float = 0.0
+    ge_loss_bad: float = 1.0
+    ge_corrupt_good: float = 0.0
+    ge_corrupt_bad: float = 0.0
+    channel_trace: Optional[str] = None  # traza binaria de delay/perdida/corrupcion por frame (ver Simulator.replay)
+    dup_prob: float = 0.0         # prob. de que el canal entregue una copia extra de un frame
+    reorder_prob: float = 0.0     # prob. de retener un frame para que lo pasen los siguientes
+    reorder_distance: int = 1     # frames posteriores que pasan a uno retenido
+    reorder_hold: float = 1.0     # maximo de segundos retenido si no pasan suficientes frames
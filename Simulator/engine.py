@@ -1,29 +1,363 @@
-import heapq, itertools
-from typing import Any, Dict, Tuple, Optional
-from Utils.types import EventType, Packet, Frame, FrameKind
+import heapq, itertools, random
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Tuple, Optional
+from Utils.types import EventType, Packet, Frame, FrameKind, TxRecord, RxRecord
 from Simulator.config import SimConfig
-from Simulator.channel import ChannelPolicy
+from Simulator.channel import make_channels
+from Simulator.scheduler import make_scheduler, QueueDrained
+from Simulator.framing import FrameCodec, wire_size, slot_size_for
+from Simulator.stream import ByteStream, StreamSink
+from Simulator.traffic import FileTransferSource
+from Simulator.metrics import Counters
+from Simulator.trace import sample_rate, sample_every
+from Utils.util import split_msg, frame_sender
 
+"""
+    Excepcion que lanza wait_for_event cuando se cumple la condicion de parada
+    configurada con Engine.set_stop (el motivo queda en Engine.stop_reason)
+"""
+class SimulationStopped(Exception):
+    pass
+
+# Evento interno (no llega a los protocolos): llegada de un paquete de una fuente de trafico
+_ARRIVAL = "ARRIVAL"
+# Evento interno del modo bit a bit: llega un frame serializado (payload = (slot, largo) del FrameCodec)
+_WIRE = "WIRE"
+
+"""
+    Clase context manager de Engine.batch (una instancia por motor, reentrante)
+"""
+class _Batch:
+
+    __slots__ = ("eng",)
+
+    def __init__(self, eng):
+        self.eng = eng
+
+    def __enter__(self):
+        eng = self.eng
+        if eng._batch_depth == 0:
+            eng._batch = []
+        eng._batch_depth += 1
+        return eng
+
+    def __exit__(self, *exc):
+        eng = self.eng
+        eng._batch_depth -= 1
+        if eng._batch_depth == 0:
+            items, eng._batch = eng._batch, None
+            if items:
+                eng.queue.push_many(items)
+        return False
+
+"""
+    Motor de eventos discretos.
+    Args:
+        cfg (SimConfig, opcional): Configuracion de canal y temporizadores
+        record (bool): Si es True (por defecto) guarda logs_transmit/logs_receive/logs_events
+                       segun cfg.trace_level ("full" para los scripts, "sample" guarda
+                       1 de cada cfg.trace_sample, "counters" solo el probe "counters", "off" nada);
+                       con False no registra nada por evento y cada consumidor se engancha con
+                       subscribe/add_probe (ruta rapida; la GUI usa "counters" y su
+                       propio suscriptor acotado)
+        seed (int, opcional): Con semilla el motor sortea todo (canal, duplicados, reordenamiento,
+                       RED, fuentes, pick_sender) con su propio random.Random(seed), asi corridas
+                       en paralelo son reproducibles; sin ella usa el modulo random (random.seed)
+"""
 class Engine:
-    def __init__(self, cfg: Optional[SimConfig] = None):
+    def __init__(self, cfg: Optional[SimConfig] = None, record: bool = True, seed: Optional[int] = None):
         self.cfg = cfg or SimConfig()
-        self.chan = ChannelPolicy(self.cfg)
+        self.rng = random.Random(seed) if seed is not None else random
+        # Canal por emisor ("A" = A>B, "B" = B>A; cfg.reverse cambia B>A). Si ambas direcciones
+        # comparten parametros y no hay enlaces ni modelos de perdida con estado se usa siempre self.chan
+        self.chans = make_channels(self.cfg, self.rng)
+        self.chan = self.chans["A"]
+        back = self.chans["B"]
+        self._per_dir = (back.cfg is not self.chan.cfg or self.chan.link is not None
+                         or back.link is not None or self.chan.model is not None or self.chan.impaired)
+        # Modo bit a bit: frames serializados con CRC32 en buffers preasignados (ver Simulator.framing)
+        self.codec: Optional[FrameCodec] = (FrameCodec(getattr(self.cfg, "frame_mtu", 2048))
+                                            if getattr(self.cfg, "bit_accurate", False) else None)
         self.now: float = 0.0
-        self.queue = []
+        self.queue = make_scheduler(getattr(self.cfg, "scheduler", "heap"))   # (time, eid, ev, payload)
         self.ids = itertools.count()
+        self._batch: Optional[List[tuple]] = None     # items retenidos dentro de batch()
+        self._batch_depth = 0
+        self._batch_cm = _Batch(self)
+        self._calls: List[tuple] = []            # (time, eid, fn) de call_at, fuera de la cola de eventos
         self.net_enabled = True
-        self.msg_i = 0
+        self.msg_i = 0                           # total de paquetes producidos
+        self.msg_next: Dict[str, int] = {}       # siguiente id de mensaje por peer (ids contiguos por flujo)
 
         self.timers: Dict[int, Tuple[float,int]] = {}
         self.ack_timer: Optional[Tuple[float,int]] = None
 
+        # Suscriptores por tipo de suceso (ver subscribe); listas vacias = costo nulo por evento
+        self._sub_tx: List[Callable] = []          # fn(t, frame)
+        self._sub_rx: List[Callable] = []          # fn(t, packet)
+        self._sub_event: List[Callable] = []       # fn(t, ev, payload)
+        self._sub_produce: List[Callable] = []     # fn(t, peer, packet, born)
+        self.probes: Dict[str, Any] = {}           # consumidores con nombre (ver add_probe)
+
         self.logs_transmit = []
-        self.logs_receive = []
+        self.logs_receive: List[RxRecord] = []
         self.logs_events = []
+        self._tx_records: List[TxRecord] = []   # memo de logs_transmit por indice
+        level = self.cfg.trace_level if record else "off"
+        n = sample_rate(level, self.cfg.trace_sample)
+        if n is not None:
+            self.subscribe(tx=sample_every(self._log_tx, n, 1), rx=sample_every(self._log_rx, n, 2),
+                           event=sample_every(self._log_event, n, 3))
+        elif level == "counters":
+            self.add_probe("counters", Counters())
 
         self.ready_on_enable: bool = getattr(self.cfg, "ready_on_enable", False)
         self.ready_delay: float = getattr(self.cfg, "ready_delay", 0.0)
 
+        # Condicion de parada (comun a todos los protocolos, ver set_stop)
+        self.events_processed = 0
+        self.max_events: Optional[int] = None
+        self.until: Optional[float] = None
+        self.stop_reason: Optional[str] = None
+        self.deliver_target: Optional[int] = None
+        self.deliver_flows: Tuple[str, ...] = ()
+        self._deliver_of: Dict[str, int] = {}        # mensajes a entregar por flujo
+
+        # Progreso de entrega en orden por flujo ("A", "B") cuando hay parada por entrega:
+        # in_order[f] = cuantos mensajes 0..k-1 ya se entregaron; los adelantados esperan en _ahead
+        self.in_order: Dict[str, int] = {}
+        self._ahead: Dict[str, set] = {}
+        self.completed_at: Dict[str, float] = {}
+
+        # Fuentes de trafico por peer (ver attach_source); sin fuentes la capa de red esta saturada
+        self.sources: Dict[str, Any] = {}
+        self.backlog: Dict[str, Deque[Tuple[float, Packet]]] = {}   # (instante de llegada, paquete)
+        self.arrivals: Dict[str, int] = {}           # paquetes llegados por peer
+        self._ready_pending = False
+        # Flujos de bytes por peer (ver attach_stream): el segmento i viaja en el payload de MSG_i
+        self.streams: Dict[str, ByteStream] = {}
+        # Modo multi-flujo (ver attach_flows): el FlowMux reparte READY por flujo y recibe las llegadas
+        self.flows = None
+
+    """
+        Funcion que engancha consumidores a los sucesos del motor
+        Args:
+            tx (Callable[[float, Frame], None], opcional): Cada frame que sale a la capa fisica
+            rx (Callable[[float, Packet], None], opcional): Cada paquete entregado a la capa de red
+            event (Callable[[float, EventType, Any], None], opcional): Cada evento entregado a los protocolos
+            produce (Callable[[float, str, Packet, float|None], None], opcional): Cada paquete que
+                la capa de red entrega al emisor (peer, paquete e instante de llegada si hay fuentes)
+        Returns:
+            tuple: Token para unsubscribe
+    """
+    def subscribe(self, tx: Optional[Callable] = None, rx: Optional[Callable] = None,
+                  event: Optional[Callable] = None, produce: Optional[Callable] = None):
+        token = []
+        for lst, fn in ((self._sub_tx, tx), (self._sub_rx, rx),
+                        (self._sub_event, event), (self._sub_produce, produce)):
+            if fn is not None:
+                lst.append(fn)
+                token.append((lst, fn))
+        return tuple(token)
+
+    """
+        Funcion que desengancha lo registrado con subscribe
+        Args:
+            token (tuple): Valor devuelto por subscribe
+    """
+    def unsubscribe(self, token):
+        for lst, fn in token:
+            if fn in lst:
+                lst.remove(fn)
+
+    """
+        Funcion que registra un consumidor con nombre (tracker, checker, contadores...)
+        Args:
+            name (str): Nombre con el que queda en self.probes
+            probe: Objeto con attach(engine) que se suscribe a lo que necesita
+        Returns:
+            El mismo probe
+    """
+    def add_probe(self, name: str, probe):
+        probe.attach(self)
+        self.probes[name] = probe
+        return probe
+
+    # Registro en listas (record=True, trace_level "sample" o "full")
+    def _log_tx(self, t, f):
+        self.logs_transmit.append((t, f))
+
+    def _log_rx(self, t, p):
+        self.logs_receive.append(RxRecord(t, p.data))
+
+    def _log_event(self, t, ev, payload):
+        self.logs_events.append((t, ev.name))
+
+    """
+        Funcion que fija la condicion de parada de la corrida
+        Args:
+            max_events (int, opcional): Maximo de eventos entregados a los protocolos
+            until (float, opcional): Tiempo simulado maximo (segundos)
+            deliver (int | dict[str, int], opcional): Parar cuando cada flujo de flows entrego en orden
+                sus primeros N mensajes; con un dict, N por flujo (y los flujos son sus claves)
+            flows (tuple[str, ...]): Flujos (peer origen) que deben completar la entrega
+        Returns:
+            None: Cuando se cumple alguna, wait_for_event lanza SimulationStopped
+    """
+    def set_stop(self, max_events: Optional[int] = None, until: Optional[float] = None,
+                 deliver=None, flows: Tuple[str, ...] = ("A",)):
+        self.max_events = max_events
+        self.until = until
+        self.deliver_target = deliver
+        if isinstance(deliver, dict):
+            flows = tuple(deliver)
+        self.deliver_flows = tuple(flows)
+        self._deliver_of = (dict(deliver) if isinstance(deliver, dict)
+                            else {f: deliver for f in flows} if deliver is not None else {})
+        self.stop_reason = None
+
+    """
+        Funcion que marca el fin de la corrida y lanza SimulationStopped
+        Args:
+            reason (str): Motivo de la parada ("max_events", "until", ...)
+    """
+    def _stop(self, reason: str):
+        self.stop_reason = reason
+        raise SimulationStopped(reason)
+
+    """
+        Funcion que engancha una fuente de trafico a un peer
+        Args:
+            peer (str): Peer que origina los datos ("A" o "B")
+            src (TrafficSource): Fuente (ver Simulator.traffic)
+        Returns:
+            None: Agenda su primera llegada. Desde ese momento el motor solo genera
+                  NETWORK_LAYER_READY cuando algun peer tiene paquetes en su backlog
+                  y los peers sin fuente no tienen datos.
+    """
+    def attach_source(self, peer: str, src):
+        # una fuente sin generador propio sortea con el del motor
+        if getattr(src, "rng", None) is random:
+            src.rng = self.rng
+        self.sources[peer] = src
+        self.backlog[peer] = deque()
+        self.arrivals[peer] = 0
+        t = src.next_arrival(self.now)
+        if t is not None:
+            self.schedule(t - self.now, _ARRIVAL, peer)
+
+    """
+        Funcion que engancha un flujo de bytes a un peer
+        Args:
+            peer (str): Peer que envia el flujo
+            stream (ByteStream): Flujo ya segmentado (ver Simulator.stream)
+            rate (float, opcional): Segmentos por segundo si el peer no tiene fuente (None = todo disponible)
+        Returns:
+            StreamSink: Receptor que reensambla el flujo (queda en probes["stream_<peer>"])
+        Raises:
+            ValueError: Si en modo bit a bit un segmento no entra en un slot (cfg.frame_mtu)
+        Detalles:
+            - Si el peer no tiene fuente se le engancha una FileTransferSource de stream.segments
+              paquetes, asi la capa de red se queda sin datos al terminar el flujo.
+    """
+    def attach_stream(self, peer: str, stream: ByteStream, rate: Optional[float] = None) -> StreamSink:
+        if self.codec is not None and slot_size_for(stream.segment_size) > self.codec.pool.slot_size:
+            raise ValueError(f"segmentos de {stream.segment_size} bytes no entran en frame_mtu "
+                             f"{self.codec.pool.slot_size} (hace falta {slot_size_for(stream.segment_size)})")
+        self.streams[peer] = stream
+        if peer not in self.sources:
+            self.attach_source(peer, FileTransferSource(stream.segments, rate))
+        return self.add_probe(f"stream_{peer}", StreamSink(peer, stream))
+
+    """
+        Funcion que agenda una llamada en un instante de tiempo simulado
+        Args:
+            t (float): Instante absoluto (si ya paso, se ejecuta en el proximo wait_for_event)
+            fn (Callable[[], None]): Funcion a llamar; corre dentro de wait_for_event y no cuenta como evento
+        Returns:
+            tuple: Item agendado (time, eid, fn)
+        Detalles:
+            - Las llamadas van en un heap aparte y no en la cola de eventos: la cola sigue
+              "vacia" para los protocolos saturados (que reciben NETWORK_LAYER_READY cuando
+              no hay nada pendiente) aunque haya llamadas en el futuro.
+    """
+    def call_at(self, t: float, fn: Callable[[], None]):
+        item = (max(t, self.now), next(self.ids), fn)
+        heapq.heappush(self._calls, item)
+        return item
+
+    """
+        Funcion que engancha un escenario de cambios del canal
+        Args:
+            scenario (Scenario): Pasos ya interpretados (ver Simulator.scenario)
+        Returns:
+            Scenario: El mismo (queda en probes["scenario"], con su metrica de recuperacion)
+        Detalles:
+            - Cada direccion pasa a usar su propio canal, asi un paso puede cambiar solo A>B o B>A.
+    """
+    def attach_scenario(self, scenario):
+        self._per_dir = True
+        return self.add_probe("scenario", scenario)
+
+    """
+        Funcion que pone el motor en modo multi-flujo
+        Args:
+            mux (FlowMux): Multiplexor de flujos (ver Simulator.flows)
+        Returns:
+            FlowMux: El mismo (queda en probes["flows"]); se corre con mux.run()
+        Detalles:
+            - La capa de red global queda deshabilitada: el motor ya no genera READY por su
+              cuenta y cada flujo agenda los suyos (con el indice del flujo en el payload).
+            - Las llegadas de las fuentes (peers "f0", "f1"...) se avisan al mux.
+    """
+    def attach_flows(self, mux):
+        self.flows = mux
+        self.net_enabled = False
+        return self.add_probe("flows", mux)
+
+    """
+        Funcion que procesa una llegada: encola el paquete en el backlog del peer,
+        agenda la siguiente llegada de su fuente y avisa a la capa de enlace
+        Args:
+            peer (str): Peer cuya fuente produjo el paquete
+    """
+    def _on_arrival(self, peer: str):
+        self.backlog[peer].append((self.now, self._new_packet(peer)))
+        self.arrivals[peer] += 1
+        t = self.sources[peer].next_arrival(self.now)
+        if t is not None:
+            self.schedule(t - self.now, _ARRIVAL, peer)
+        if self.flows is not None:
+            self.flows.on_arrival(peer)
+        elif self.net_enabled:
+            self._kick_ready()
+
+    """
+        Funcion que agenda un unico NETWORK_LAYER_READY pendiente si hay datos en algun backlog
+    """
+    def _kick_ready(self):
+        if not self._ready_pending and self.network_layer_ready(None):
+            self._ready_pending = True
+            self.schedule(0.0, EventType.NETWORK_LAYER_READY, None)
+
+    """
+        Funcion que elige el peer al que se entrega un NETWORK_LAYER_READY
+        Args:
+            hint (str|None): Peer sugerido en el payload del evento
+        Returns:
+            str|None: hint si tiene datos; si no, el peer con el paquete mas antiguo; None si no hay datos
+    """
+    def _ready_peer(self, hint):
+        if hint in self.backlog and self.backlog[hint]:
+            return hint
+        best, best_t = None, None
+        for peer, q in self.backlog.items():
+            if q:
+                t = q[0][0]
+                if best is None or t < best_t:
+                    best, best_t = peer, t
+        return best
+
     """
         Funcion que agenda un evento en la cola temporal del simulador
         Args:
@@ -31,14 +365,47 @@ class Engine:
             ev (EventType): Tipo de evento a programar (NETWORK_LAYER_READY, FRAME_ARRIVAL, TIMEOUT, etc.)
             payload (Any, opcional): Datos asociados al evento (id de timer/seq para TIMEOUT)
         Returns:
-            tuple: Item insertado en el heap (time, eid, ev, payload) donde 'time' es tiempo absoluto y 'eid' un id unico
+            tuple: Item insertado en la cola (time, eid, ev, payload) donde 'time' es tiempo absoluto y 'eid' un id unico
     """
     def schedule(self, dt, ev, payload: Any=None):
         time = self.now + max(0.0, dt)
         item = (time, next(self.ids), ev, payload)
-        heapq.heappush(self.queue, item)
+        if self._batch is not None:
+            self._batch.append(item)
+        else:
+            self.queue.push(item)
         return item
 
+    """
+        Funcion que agenda varios eventos en una sola insercion en la cola
+        Args:
+            entries (Iterable[tuple]): Tuplas (dt, ev, payload) relativas al tiempo actual
+        Returns:
+            list[tuple]: Items insertados (time, eid, ev, payload), en el mismo orden
+    """
+    def schedule_many(self, entries):
+        now, ids = self.now, self.ids
+        items = [(now + max(0.0, dt), next(ids), ev, payload) for dt, ev, payload in entries]
+        if self._batch is not None:
+            self._batch.extend(items)
+        else:
+            self.queue.push_many(items)
+        return items
+
+    """
+        Funcion que agrupa lo que se agenda dentro de un bloque with (llegadas de
+        to_physical_layer, start_timer, start_ack_timer...) y lo inserta en la cola de
+        una sola vez al salir, con push_many
+        Returns:
+            _Batch: Context manager
+        Detalles:
+            - Los eid se asignan igual que sin batch, asi que el orden de los eventos no cambia.
+            - No se debe llamar a wait_for_event dentro del bloque (los items aun no estan en la cola).
+            - Se puede anidar; la insercion ocurre al cerrar el bloque exterior.
+    """
+    def batch(self):
+        return self._batch_cm
+
     """
         Funcion que obtiene el siguiente evento valido del simulador
         Args:
@@ -46,20 +413,58 @@ class Engine:
         Returns:
             tuple[EventType, Any]: El evento aprobado y su payload asociado
         Detalles:
-            - Si la cola esta vacia y la capa de red esta habilitada, agenda NETWORK_LAYER_READY inmediato.
-            - Extrae el siguiente item del heap y avanza self.now.
+            - Si la cola esta vacia y la capa de red esta habilitada, agenda NETWORK_LAYER_READY inmediato
+              (tambien si se vacia al descartar timers vencidos). Con fuentes de trafico solo lo hace
+              si hay datos en algun backlog.
+            - Las llegadas de las fuentes se procesan internamente; con fuentes, NETWORK_LAYER_READY
+              lleva en el payload el peer que tiene datos y se descarta si no hay datos o la capa
+              de red esta deshabilitada.
+            - Si se cumplio la condicion de parada (set_stop), lanza SimulationStopped.
+            - Extrae el siguiente item de la cola (heap o ladder, ver cfg.scheduler) y avanza self.now;
+              con la cola vacia (nadie puede avanzar) lanza QueueDrained.
             - Para TIMEOUT: valida que el (time,eid) coincida con el registro en self.timers[seq]; si no, descarta.
             - Para ACK_TIMEOUT: valida que coincida con self.ack_timer; si no, descarta.
-            - Registra el evento en self.logs_events y lo retorna.
+            - Avisa a los suscriptores de eventos (p.ej. logs_events) y lo retorna.
     """
     def wait_for_event(self):
-        if not self.queue and self.net_enabled:
-            self.schedule(0.0, EventType.NETWORK_LAYER_READY, None)
+        if self.max_events is not None and self.events_processed >= self.max_events:
+            self._stop("max_events")
+        if self.deliver_target is not None and self._transfer_complete():
+            self._stop("delivered")
         while True:
-            time, eid, ev, payload = heapq.heappop(self.queue)
+            if not self.queue and self.net_enabled and self.network_layer_ready(None):
+                self.schedule(0.0, EventType.NETWORK_LAYER_READY, None)
+                self._ready_pending = True
+            calls = self._calls
+            if calls and (not self.queue or calls[0][0] <= self.queue.peek_time()):
+                if self.until is not None and calls[0][0] > self.until:
+                    self.now = self.until
+                    self._stop("until")
+                t, _, fn = heapq.heappop(calls)
+                self.now = max(self.now, t)
+                fn()
+                continue
+            if self.until is not None and self.queue and self.queue.peek_time() > self.until:
+                self.now = self.until
+                self._stop("until")
+            time, eid, ev, payload = self.queue.pop()
             self.now = time
 
-            if ev == EventType.TIMEOUT:
+            if ev is _ARRIVAL:
+                self._on_arrival(payload)
+                continue
+            if ev is _WIRE:
+                payload = self.codec.receive(payload)
+                ev = EventType.FRAME_ARRIVAL if payload is not None else EventType.CKSUM_ERR
+
+            if ev == EventType.NETWORK_LAYER_READY:
+                self._ready_pending = False
+            if ev == EventType.NETWORK_LAYER_READY and self.sources and self.flows is None:
+                payload = self._ready_peer(payload) if self.net_enabled else None
+                if payload is None:
+                    continue
+
+            elif ev == EventType.TIMEOUT:
                 seq = payload
                 valid = self.timers.get(seq)
                 if valid is None or valid != (time, eid):
@@ -73,48 +478,202 @@ class Engine:
                     continue
                 self.ack_timer = None
 
-            self.logs_events.append((self.now, ev.name))
+            self.events_processed += 1
+            for fn in self._sub_event:
+                fn(time, ev, payload)
             return ev, payload
 
     """
         Funcion que genera un paquete nuevo desde la capa de red
         Args:
-            (ninguno): Usa el contador interno self.msg_i para etiquetar el mensaje
+            peer (str): Peer que pide datos ("A" por defecto); solo importa si hay fuentes de trafico
+        Returns:
+            Packet: Sin fuentes, un paquete nuevo "MSG_{i}" numerado por peer (siempre hay datos). Con fuentes,
+                    el paquete mas antiguo del backlog de ese peer.
+        Raises:
+            RuntimeError: Si hay fuentes y el peer no tiene datos (ver network_layer_ready)
+    """
+    def from_network_layer(self, peer: str = "A"):
+        if self.sources:
+            q = self.backlog.get(peer)
+            if not q:
+                raise RuntimeError(f"capa de red de {peer} sin datos")
+            born, p = q.popleft()
+        else:
+            born, p = None, self._new_packet(peer)
+        for fn in self._sub_produce:
+            fn(self.now, peer, p, born)
+        return p
+
+    """
+        Funcion que crea el siguiente paquete "MSG_{i}" de un peer
+        Args:
+            peer (str): Peer origen; cada peer numera sus mensajes desde 0
         Returns:
-            Packet: Paquete con datos "MSG_{i}" e incremento de self.msg_i para la siguiente emision
+            Packet
     """
-    def from_network_layer(self):
-        p = Packet(f"MSG_{self.msg_i}")
+    def _new_packet(self, peer: str) -> Packet:
+        i = self.msg_next.get(peer, 0)
+        self.msg_next[peer] = i + 1
         self.msg_i += 1
+        p = Packet(f"MSG_{i}")
+        if self.streams:
+            st = self.streams.get(peer)
+            if st is not None and i < st.segments:
+                p.payload = st.segment(i)
         return p
 
+    """
+        Funcion que indica si la capa de red tiene datos para entregar
+        Args:
+            peer (str|None): Peer a consultar (None = cualquiera)
+        Returns:
+            bool: Siempre True sin fuentes; con fuentes, si el backlog del peer (o alguno) no esta vacio
+    """
+    def network_layer_ready(self, peer: Optional[str] = None) -> bool:
+        if not self.sources:
+            return True
+        if peer is None:
+            return any(self.backlog.values())
+        return bool(self.backlog.get(peer))
+
     """
         Funcion que entrega un paquete a la capa de red (registro de recepcion)
         Args:
             p (Packet): Paquete recibido desde la capa de enlace
         Returns:
-            None: Agrega una entrada (tiempo actual, contenido) al log de recepciones
+            None: Avisa a los suscriptores de rx (p.ej. logs_receive) y, si hay parada por
+                  entrega (set_stop deliver=N), actualiza el progreso en orden de su flujo
     """
     def to_network_layer(self, p: Packet):
-        self.logs_receive.append((self.now, p.data))
+        for fn in self._sub_rx:
+            fn(self.now, p)
+        if self.deliver_target is None:
+            return
+        flow, mid = split_msg(p.data)
+        if mid is None:
+            return
+        k = self.in_order.get(flow, 0)
+        if mid == k:
+            k += 1
+            ahead = self._ahead.get(flow)
+            while ahead and k in ahead:
+                ahead.discard(k)
+                k += 1
+            self.in_order[flow] = k
+            target = self._deliver_of.get(flow)
+            if target is not None and k >= target and flow not in self.completed_at:
+                self.completed_at[flow] = self.now
+        elif mid > k:
+            self._ahead.setdefault(flow, set()).add(mid)
 
     """
-        Funcion que envía un frame a la capa fisica aplicando la politica del canal
+        Funcion que indica si todos los flujos pedidos completaron la transferencia
+        Returns:
+            bool: True si cada flujo de deliver_flows entrego en orden los mensajes pedidos
+    """
+    def _transfer_complete(self) -> bool:
+        return all(f in self.completed_at for f in self.deliver_flows)
+
+    """
+        Funcion que envía un frame a la capa fisica aplicando la politica del canal de su direccion
         Args:
             f (Frame): Trama a transmitir (DATA o ACK)
         Returns:
-            None: Registra la transmision, si el canal decide drop, no agenda nada.
+            None: Avisa a los suscriptores de tx, si el canal decide drop, no agenda nada.
                   Si decide corrupt, agenda CKSUM_ERR tras un retardo muestreado.
                   En caso normal, agenda FRAME_ARRIVAL tras el retardo del canal.
+                  En modo bit a bit (cfg.bit_accurate) serializa el frame, la corrupcion
+                  invierte cfg.corrupt_bits bits reales y el receptor decide con el CRC32.
+                  Con cfg.bitrate el frame primero espera su turno en el enlace del emisor y
+                  paga la serializacion (tambien si despues se pierde: ocupo el enlace);
+                  con cfg.queue_size el buffer del router puede descartarlo antes.
+                  Con dup_prob/reorder_prob el canal ademas duplica o retiene frames (ver _impaired_send).
     """
     def to_physical_layer(self, f: Frame):
-        self.logs_transmit.append((self.now, f))
-        if self.chan.will_drop():
+        for fn in self._sub_tx:
+            fn(self.now, f)
+        chan = self.chans[frame_sender(f)] if self._per_dir else self.chan
+        tx = 0.0
+        if chan.link is not None:
+            tx = chan.transmission_delay(self.now, self._frame_size(f))
+            if tx is None:
+                return
+        if chan.will_drop():
+            return
+        if chan.impaired:
+            self._impaired_send(chan, f, tx)
             return
-        if self.chan.will_corrupt():
-            self.schedule(self.chan.sample_delay(), EventType.CKSUM_ERR, None)
+        if self.codec is not None:
+            wire = self.codec.send(f)
+            if chan.will_corrupt():
+                self.codec.corrupt(wire, self.cfg.corrupt_bits, self.rng)
+            self.schedule(tx + chan.sample_delay(), _WIRE, wire)
             return
-        self.schedule(self.chan.sample_delay(), EventType.FRAME_ARRIVAL, f)
+        if chan.will_corrupt():
+            self.schedule(tx + chan.sample_delay(), EventType.CKSUM_ERR, None)
+            return
+        self.schedule(tx + chan.sample_delay(), EventType.FRAME_ARRIVAL, f)
+
+    """
+        Funcion que entrega un frame a un canal con duplicacion y/o reordenamiento
+        Args:
+            chan (ChannelPolicy): Canal de la direccion del frame
+            f (Frame): Frame que ya paso el enlace y la perdida
+            tx (float): Espera + serializacion en el enlace
+        Detalles:
+            - Con prob. dup_prob viaja una copia extra con su propia corrupcion y retardo
+              (en modo bit a bit, serializada en otro slot). Con un modelo con estado
+              (Gilbert-Elliott o traza) la copia avanza el modelo y toma su propio frame/registro;
+              su marca de perdida no se aplica (la duplicacion ocurre despues de la perdida).
+            - Con prob. reorder_prob la copia queda retenida hasta que la pasen reorder_distance
+              frames posteriores de la misma direccion (llega justo despues del ultimo) o hasta
+              reorder_hold segundos, lo que ocurra primero.
+    """
+    def _impaired_send(self, chan, f: Frame, tx: float):
+        copies = 1
+        if chan.dup_prob and chan.rng.random() < chan.dup_prob:
+            copies = 2
+            chan.duplicated += 1
+        r = chan.reorder
+        for k in range(copies):
+            if k and chan.model is not None:
+                chan.model.advance()
+            if self.codec is not None:
+                ev, payload = _WIRE, self.codec.send(f)
+                if chan.will_corrupt():
+                    self.codec.corrupt(payload, self.cfg.corrupt_bits, self.rng)
+            elif chan.will_corrupt():
+                ev, payload = EventType.CKSUM_ERR, None
+            else:
+                ev, payload = EventType.FRAME_ARRIVAL, f
+            t = self.now + tx + chan.sample_delay()
+            if r is None:
+                self.schedule(t - self.now, ev, payload)
+            elif r.prob and chan.rng.random() < r.prob:
+                h = r.hold(t, ev, payload)
+                self.call_at(self.now + r.hold_time, lambda h=h: self._release_held(chan.reorder, h))
+            else:
+                self.schedule(t - self.now, ev, payload)
+                for t2, ev2, p2 in r.overtake(t):
+                    self.schedule(t2 - self.now, ev2, p2)
+
+    # Libera un frame retenido al vencer reorder_hold si nadie lo paso a tiempo
+    def _release_held(self, r, h):
+        if r.expire(h):
+            self.schedule(max(h[1], self.now) - self.now, h[2], h[3])
+
+    """
+        Funcion que devuelve el tamaño de un frame en el cable
+        Args:
+            f (Frame): Frame a transmitir
+        Returns:
+            int: El serializado real en modo bit a bit; si no, cfg.frame_bytes (DATA) o cfg.ack_bytes
+    """
+    def _frame_size(self, f: Frame) -> int:
+        if self.codec is not None:
+            return wire_size(f)
+        return self.cfg.frame_bytes if f.kind == FrameKind.DATA else self.cfg.ack_bytes
 
     """
         Funcion que obtiene el frame entregado por la capa fisica
@@ -173,11 +732,16 @@ class Engine:
         Args:
             (ninguno): Lee flags ready_on_enable y ready_delay para agendar NETWORK_LAYER_READY
         Returns:
-            None: Activa net_enabled y, si corresponde, agenda NETWORK_LAYER_READY tras ready_delay
+            None: Activa net_enabled y, si corresponde, agenda NETWORK_LAYER_READY tras ready_delay.
+                  Con fuentes de trafico agenda un READY inmediato solo si hay datos esperando.
     """
     def enable_network_layer(self):
         self.net_enabled = True
-        if self.ready_on_enable:
+        if self.sources:
+            self._kick_ready()
+            return
+        if self.ready_on_enable and not self._ready_pending:
+            self._ready_pending = True
             self.schedule(self.ready_delay, EventType.NETWORK_LAYER_READY, None)
 
     """
@@ -190,6 +754,40 @@ class Engine:
     def disable_network_layer(self):
         self.net_enabled = False
 
+    """
+        Funcion que devuelve los registros tipados de transmision desde un indice
+        Args:
+            start (int): Indice de la primera fila pedida (0 = todas)
+            limit (int, opcional): Maximo de filas a devolver (None = hasta el final)
+        Returns:
+            list[TxRecord]: Filas (t, kind, seq, ack, info). Cada fila de logs_transmit se
+                            convierte una sola vez (y solo cuando se pide) y queda memorizada por su indice.
+    """
+    def tx_since(self, start: int = 0, limit: Optional[int] = None) -> List[TxRecord]:
+        memo = self._tx_records
+        stop = len(self.logs_transmit) if limit is None else min(len(self.logs_transmit), start + limit)
+        for t, f in self.logs_transmit[len(memo):stop]:
+            memo.append(TxRecord(t, f.kind.name, f.seq, f.ack, f.info.data))
+        return memo[start:stop]
+
+    """
+        Funcion que devuelve la cantidad de transmisiones registradas
+        Returns:
+            int: Largo del log de transmisiones
+    """
+    def tx_count(self) -> int:
+        return len(self.logs_transmit)
+
+    """
+        Funcion que devuelve las entregas registradas desde un indice
+        Args:
+            start (int): Indice de la primera fila pedida (0 = todas)
+        Returns:
+            list[RxRecord]: Filas (t, data)
+    """
+    def rx_since(self, start: int = 0) -> List[RxRecord]:
+        return self.logs_receive[start:]
+
     """
         Funcion que toma una captura del estado y los registros de la simulacion
         Args:
@@ -198,13 +796,25 @@ class Engine:
             dict: Estructura con:
                 - "time" (float): Tiempo simulado actual (self.now)
                 - "events" (list[tuple]): Historial de eventos (tiempo, nombre_evento)
-                - "tx" (list[tuple]): Log de transmisiones como (t, kind, seq, ack, info)
-                - "rx" (list[tuple]): Log de recepciones como (t, data)
+                - "tx" (list[TxRecord]): Log de transmisiones como (t, kind, seq, ack, info)
+                - "rx" (list[RxRecord]): Log de recepciones como (t, data)
     """
     def snapshot(self):
         return {
             "time": self.now,
             "events": list(self.logs_events),
-            "tx": [(t, f.kind.name, f.seq, f.ack, f.info.data) for t, f in self.logs_transmit],
+            "tx": self.tx_since(0),
             "rx": list(self.logs_receive),
-        }
\ No newline at end of file
+        }
+
+    """
+        Funcion que libera los recursos de los canales al terminar la corrida
+        Args:
+            (ninguno)
+        Returns:
+            None: Cierra los mmap de --channel-trace de ambas direcciones; los resumenes
+                  (loss_summary, probes) siguen disponibles. Se puede llamar mas de una vez
+    """
+    def close(self):
+        for ch in self.chans.values():
+            ch.close()
@@ -0,0 +1,242 @@
+from typing import Callable, Dict, List, Optional
+from Utils.types import EventType, FrameKind, Packet
+
+"""
+    Modo multi-flujo: un mismo Engine lleva K pares emisor/receptor independientes
+    que comparten el canal (y el enlace/cola si hay bitrate). Cada flujo tiene su
+    propio estado de protocolo, su capa de red (peer "f0", "f1", ... del motor,
+    asi que fuentes, ids de mensaje, entrega en orden y latencia ya quedan por
+    flujo), sus temporizadores y sus contadores.
+    FlowMux se enlaza en Events.api en lugar del motor: los protocolos siguen
+    llamando from_network_layer, start_timer, to_physical_layer... y FlowMux lo
+    traduce para el flujo que esta atendiendo el evento:
+        - DATA viaja como "f3>MSG_0" y los ACK como "ACK:f3" (frame_sender los
+          cuenta como A>B y B>A); al llegar, el prefijo dice a que flujo va.
+        - El timer seq del flujo 3 es el timer (3, seq) del motor.
+        - Cada flujo habilita/deshabilita su capa de red; el NETWORK_LAYER_READY
+          lleva el indice del flujo (a ready_delay de habilitarse, o apenas
+          llegan datos si hay fuentes de trafico).
+    Solo sirve para protocolos cuyo estado vive en objetos con on_event (ver
+    ProtocolSpec.flow); los que corren su propio loop de wait_for_event no.
+"""
+
+
+"""
+    Clase estado de un flujo del modo multi-flujo
+    Atributos:
+        name (str): Peer del motor que origina los datos ("f3")
+        idx (int): Indice del flujo (payload de sus READY y parte de sus timers)
+        handler: Objeto con on_event(ev, payload) (emisor + receptor del protocolo)
+        enabled (bool): Capa de red habilitada por el protocolo
+        tx_data, tx_ack, timeouts, delivered (int): Contadores del flujo
+"""
+class Flow:
+
+    __slots__ = ("name", "idx", "handler", "ack_tag", "enabled", "pending",
+                 "tx_data", "tx_ack", "timeouts", "delivered", "last_rx")
+
+    def __init__(self, name: str, idx: int, handler):
+        self.name = name
+        self.idx = idx
+        self.handler = handler
+        self.ack_tag = f"ACK:{name}"
+        self.enabled = False
+        self.pending = False         # READY agendado y aun no atendido
+        self.tx_data = 0
+        self.tx_ack = 0
+        self.timeouts = 0
+        self.delivered = 0
+        self.last_rx: Optional[float] = None
+
+    def summary(self) -> dict:
+        return {"delivered": self.delivered, "tx_data": self.tx_data, "tx_ack": self.tx_ack,
+                "timeouts": self.timeouts, "last_rx": self.last_rx}
+
+
+"""
+    Funcion que devuelve los peers del motor de K flujos
+    Args:
+        k (int): Cantidad de flujos
+    Returns:
+        tuple[str, ...]: ("f0", "f1", ..., "f{k-1}")
+"""
+def flow_names(k: int):
+    return tuple(f"f{i}" for i in range(k))
+
+
+"""
+    Funcion que calcula el indice de equidad de Jain
+    Args:
+        xs (list[float]): Valor por flujo (p.ej. mensajes entregados)
+    Returns:
+        float: (sum x)^2 / (n * sum x^2); 1.0 = reparto perfecto, 1/n = un solo flujo se lleva todo
+"""
+def jain_index(xs: List[float]) -> float:
+    sq = sum(x * x for x in xs)
+    return (sum(xs) ** 2) / (len(xs) * sq) if sq else 1.0
+
+
+"""
+    Clase que multiplexa K flujos sobre un motor (se engancha con Engine.attach_flows)
+    Args:
+        make_handler (Callable[[], object]): Crea el emisor + receptor de un flujo (ProtocolSpec.flow)
+        k (int): Cantidad de flujos
+    Atributos:
+        flows (list[Flow]): Flujos por indice
+        names (tuple[str, ...]): Peers del motor de cada flujo ("f0", "f1", ...)
+"""
+class FlowMux:
+
+    def __init__(self, make_handler: Callable[[], object], k: int):
+        if k <= 0:
+            raise ValueError("la cantidad de flujos debe ser > 0")
+        self.names = flow_names(k)
+        self.flows: List[Flow] = [Flow(name, i, make_handler()) for i, name in enumerate(self.names)]
+        self._by_name: Dict[str, Flow] = {fl.name: fl for fl in self.flows}
+        self.cur: Optional[Flow] = None
+        self.unrouted = 0            # frames que llegaron sin un flujo conocido en el dato
+        self.eng = None
+
+    def attach(self, engine):
+        self.eng = engine
+
+    """
+        Funcion que corre los flujos hasta la condicion de parada del motor
+        Returns:
+            None: Termina con SimulationStopped o QueueDrained (cola vacia), igual que los drivers
+        Detalles:
+            - Un flujo con la capa de red habilitada recibe READY cada ready_delay (o con cada
+              llegada de su fuente) hasta que el protocolo la deshabilite.
+            - CKSUM_ERR no tiene dueño (el frame llego ilegible) y se descarta, como en los
+              drivers de pares; el emisor se entera por su timeout.
+    """
+    def run(self):
+        eng = self.eng
+        wait = eng.wait_for_event
+        flows, by_name = self.flows, self._by_name
+        arrival, timeout, ready = EventType.FRAME_ARRIVAL, EventType.TIMEOUT, EventType.NETWORK_LAYER_READY
+        data_kind = FrameKind.DATA
+        for fl in flows:
+            self.cur = fl
+            self.enable_network_layer()
+        while True:
+            ev, payload = wait()
+            if ev is arrival:
+                data = payload.info.data
+                fl = by_name.get(data.partition(">")[0] if payload.kind is data_kind else data[4:])
+                if fl is None:
+                    self.unrouted += 1
+                    continue
+                self.cur = fl
+                fl.handler.on_event(ev, payload)
+            elif ev is timeout:
+                fl = self.cur = flows[payload[0]]
+                fl.timeouts += 1
+                fl.handler.on_event(ev, payload[1])
+            elif ev is ready:
+                fl = flows[payload]
+                fl.pending = False
+                if fl.enabled and eng.network_layer_ready(fl.name):
+                    self.cur = fl
+                    fl.handler.on_event(ev, None)
+                    # si el protocolo no deshabilito su capa de red sigue recibiendo READY
+                    # (como con el motor solo, p.ej. Utopia)
+                    if fl.enabled:
+                        self.enable_network_layer()
+
+    """
+        Funcion que agenda el READY de un flujo si no tiene uno pendiente y hay datos
+        Args:
+            fl (Flow): Flujo
+            dt (float): Retardo
+    """
+    def _kick(self, fl: Flow, dt: float):
+        eng = self.eng
+        if not fl.pending and eng.network_layer_ready(fl.name):
+            fl.pending = True
+            eng.schedule(dt, EventType.NETWORK_LAYER_READY, fl.idx)
+
+    # Llamado por el motor cuando una fuente deja un paquete en el backlog de un flujo
+    def on_arrival(self, peer: str):
+        fl = self._by_name[peer]
+        if fl.enabled:
+            self._kick(fl, 0.0)
+
+    # --- Interfaz de Events.api para el flujo que atiende el evento (self.cur) ---
+
+    def wait_for_event(self):
+        raise RuntimeError("en modo multi-flujo los eventos los reparte FlowMux.run")
+
+    def from_network_layer(self, peer: str = "A"):
+        return self.eng.from_network_layer(self.cur.name)
+
+    def network_layer_ready(self, peer: Optional[str] = None) -> bool:
+        return self.eng.network_layer_ready(self.cur.name)
+
+    def to_network_layer(self, p: Packet):
+        fl = self.cur
+        fl.delivered += 1
+        fl.last_rx = self.eng.now
+        self.eng.to_network_layer(p)
+
+    def from_physical_layer(self, payload):
+        return payload
+
+    """
+        Funcion que etiqueta un frame con su flujo y lo envia por el canal compartido
+        Args:
+            f (Frame): Frame del protocolo ("A>MSG_3" / "MSG_3" o un ACK con cualquier etiqueta)
+        Returns:
+            None: El frame sale como "f3>MSG_3" o "ACK:f3" (se cambia su info, no el paquete
+                  que el protocolo guarda para retransmitir)
+    """
+    def to_physical_layer(self, f):
+        fl = self.cur
+        info = f.info
+        if f.kind is FrameKind.DATA:
+            fl.tx_data += 1
+            _, sep, rest = info.data.partition(">")
+            f.info = Packet(f"{fl.name}>{rest if sep else info.data}", info.payload)
+        else:
+            fl.tx_ack += 1
+            f.info = Packet(fl.ack_tag)
+        self.eng.to_physical_layer(f)
+
+    def start_timer(self, seq: int):
+        self.eng.start_timer((self.cur.idx, seq))
+
+    def stop_timer(self, seq: int):
+        self.eng.stop_timer((self.cur.idx, seq))
+
+    def enable_network_layer(self):
+        fl = self.cur
+        fl.enabled = True
+        eng = self.eng
+        self._kick(fl, 0.0 if eng.sources else eng.ready_delay)
+
+    def disable_network_layer(self):
+        self.cur.enabled = False
+
+    def batch(self):
+        return self.eng.batch()
+
+    @property
+    def rng(self):
+        return self.eng.rng
+
+    """
+        Funcion que resume los flujos
+        Returns:
+            dict: count, delivered total/min/mean/max por flujo, fairness (indice de Jain de lo
+                  entregado), timeouts, unrouted y per_flow con los contadores de cada flujo
+    """
+    def summary(self) -> dict:
+        got = [fl.delivered for fl in self.flows]
+        return {
+            "count": len(self.flows),
+            "delivered": {"total": sum(got), "min": min(got), "mean": sum(got) / len(got), "max": max(got)},
+            "fairness": jain_index(got),
+            "timeouts": sum(fl.timeouts for fl in self.flows),
+            "unrouted": self.unrouted,
+            "per_flow": {fl.name: fl.summary() for fl in self.flows},
+        }
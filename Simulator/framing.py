@@ -0,0 +1,230 @@
+import random, struct, zlib
+from typing import List, Optional, Tuple
+from Utils.types import Frame, FrameKind, Packet
+
+"""
+    Modo bit a bit del canal (SimConfig.bit_accurate).
+    Cada frame se serializa en un slot de un BufferPool (bytearray preasignado, sin
+    copias: se escribe con pack_into sobre un memoryview) con el formato
+
+        kind (u8) | seq (i32) | ack (i32) | largo de info (u16) | largo de payload (u32)
+        | info | payload | CRC32 (u32)
+
+    todo little-endian. Si el canal decide corromper, se invierten bits reales del
+    slot; el receptor recalcula el CRC32 y, si no coincide, el motor entrega
+    CKSUM_ERR en lugar de FRAME_ARRIVAL (los protocolos no cambian).
+    El payload de aplicacion (Packet.payload) se copia al slot al serializar y sale
+    como bytes al reconstruir: el slot vuelve al pool apenas se recibe el frame.
+"""
+
+HEADER = struct.Struct("<BiiHI")
+CRC = struct.Struct("<I")
+OVERHEAD = HEADER.size + CRC.size
+INFO_RESERVE = 64                # bytes reservados para la info ("A>MSG_123456", "ACK:f3"...)
+
+_KINDS = {k.value: k for k in FrameKind}
+
+
+"""
+    Clase pool de buffers de tamaño fijo sobre bytearrays preasignados
+    Args:
+        slot_size (int): Bytes por slot (MTU maxima de un frame serializado)
+        slots (int): Slots iniciales; si se agotan se agrega otro bloque del mismo tamaño
+"""
+class BufferPool:
+
+    def __init__(self, slot_size: int = 2048, slots: int = 64):
+        self.slot_size = slot_size
+        self._blocks: List[bytearray] = []
+        self._views: List[memoryview] = []
+        self._free: List[int] = []
+        self._grow(max(1, slots))
+
+    def _grow(self, n: int):
+        block = bytearray(n * self.slot_size)
+        mv = memoryview(block)
+        base = len(self._views)
+        s = self.slot_size
+        self._blocks.append(block)
+        self._views.extend(mv[i * s:(i + 1) * s] for i in range(n))
+        self._free.extend(range(base + n - 1, base - 1, -1))
+
+    """
+        Funcion que toma un slot libre
+        Returns:
+            int: Indice del slot (ver view)
+    """
+    def acquire(self) -> int:
+        if not self._free:
+            self._grow(len(self._views))
+        return self._free.pop()
+
+    def release(self, i: int):
+        self._free.append(i)
+
+    def view(self, i: int) -> memoryview:
+        return self._views[i]
+
+    def capacity(self) -> int:
+        return len(self._views)
+
+    def in_use(self) -> int:
+        return len(self._views) - len(self._free)
+
+
+"""
+    Funcion que serializa un frame en un buffer
+    Args:
+        f (Frame): Frame a serializar
+        buf (memoryview): Destino (con espacio para OVERHEAD + info)
+    Returns:
+        int: Bytes escritos (incluye el CRC32)
+    Raises:
+        ValueError: Si la info no entra en el buffer
+"""
+def encode_into(f: Frame, buf: memoryview) -> int:
+    data = f.info.data.encode("utf-8") if f.info is not None else b""
+    payload = f.info.payload if f.info is not None else None
+    plen = len(payload) if payload is not None else 0
+    m = HEADER.size + len(data)
+    n = m + plen
+    if n + CRC.size > len(buf):
+        raise ValueError(f"frame de {n + CRC.size} bytes no entra en un slot de {len(buf)}")
+    HEADER.pack_into(buf, 0, f.kind.value, f.seq, f.ack, len(data), plen)
+    buf[HEADER.size:m] = data
+    if plen:
+        buf[m:n] = payload
+    CRC.pack_into(buf, n, zlib.crc32(buf[:n]))
+    return n + CRC.size
+
+
+"""
+    Funcion que calcula el slot necesario para frames con un payload dado
+    Args:
+        payload (int): Bytes de payload (p.ej. el segmento de un flujo de bytes)
+    Returns:
+        int: OVERHEAD + INFO_RESERVE + payload
+"""
+def slot_size_for(payload: int) -> int:
+    return OVERHEAD + INFO_RESERVE + payload
+
+
+"""
+    Funcion que calcula el tamaño serializado de un frame sin serializarlo
+    Args:
+        f (Frame): Frame
+    Returns:
+        int: Bytes en el cable (encabezado + info + payload + CRC32), lo mismo que devuelve encode_into
+"""
+def wire_size(f: Frame) -> int:
+    if f.info is None:
+        return OVERHEAD
+    n = OVERHEAD + len(f.info.data.encode("utf-8"))
+    return n + len(f.info.payload) if f.info.payload is not None else n
+
+
+"""
+    Funcion que verifica el CRC32 y reconstruye el frame
+    Args:
+        buf (memoryview): Frame serializado (exactamente n bytes)
+    Returns:
+        Frame | None: None si el CRC no coincide o el encabezado no es valido
+"""
+def decode(buf: memoryview) -> Optional[Frame]:
+    n = len(buf) - CRC.size
+    if n < HEADER.size or zlib.crc32(buf[:n]) != CRC.unpack_from(buf, n)[0]:
+        return None
+    code, seq, ack, ln, plen = HEADER.unpack_from(buf, 0)
+    kind = _KINDS.get(code)
+    m = HEADER.size + ln
+    if kind is None or m + plen != n:
+        return None
+    try:
+        data = str(buf[HEADER.size:m], "utf-8")
+    except UnicodeDecodeError:
+        return None
+    return Frame(kind, seq, ack, Packet(data, bytes(buf[m:n]) if plen else None))
+
+
+"""
+    Funcion que invierte bits al azar de un buffer
+    Args:
+        buf (memoryview): Bytes a corromper
+        nbits (int): Cantidad de bits a invertir (posiciones al azar, pueden repetirse)
+        rng: Generador (random por defecto, asi random.seed reproduce la corrida)
+"""
+def flip_bits(buf: memoryview, nbits: int, rng=random):
+    total = len(buf) * 8
+    for _ in range(nbits):
+        pos = rng.randrange(total)
+        buf[pos >> 3] ^= 1 << (pos & 7)
+
+
+"""
+    Clase que lleva los frames del motor a bytes y de vuelta
+    Args:
+        slot_size (int): MTU de un frame serializado
+        slots (int): Slots iniciales del pool
+    Atributos:
+        frames (int): Frames serializados
+        bytes (int): Bytes serializados (con encabezado y CRC)
+        corrupted (int): Frames con bits invertidos por el canal
+        crc_errors (int): Frames rechazados por el receptor
+        undetected (int): Frames corruptos que pasaron el CRC32
+"""
+class FrameCodec:
+
+    def __init__(self, slot_size: int = 2048, slots: int = 64):
+        self.pool = BufferPool(slot_size, slots)
+        self.frames = 0
+        self.bytes = 0
+        self.corrupted = 0
+        self.crc_errors = 0
+        self.undetected = 0
+        self._dirty = set()          # slots con bits invertidos aun en vuelo
+
+    """
+        Funcion que serializa un frame en un slot del pool
+        Returns:
+            tuple[int, int]: (slot, largo) para corrupt/receive
+    """
+    def send(self, f: Frame) -> Tuple[int, int]:
+        i = self.pool.acquire()
+        n = encode_into(f, self.pool.view(i))
+        self.frames += 1
+        self.bytes += n
+        return i, n
+
+    def corrupt(self, wire: Tuple[int, int], nbits: int = 1, rng=random):
+        i, n = wire
+        flip_bits(self.pool.view(i)[:n], nbits, rng)
+        self.corrupted += 1
+        self._dirty.add(i)
+
+    """
+        Funcion que recibe un frame serializado y libera su slot
+        Returns:
+            Frame | None: None si el CRC32 no coincide
+    """
+    def receive(self, wire: Tuple[int, int]) -> Optional[Frame]:
+        i, n = wire
+        f = decode(self.pool.view(i)[:n])
+        self.pool.release(i)
+        if f is None:
+            self.crc_errors += 1
+        if i in self._dirty:
+            self._dirty.discard(i)
+            if f is not None:
+                self.undetected += 1
+        return f
+
+    def summary(self) -> dict:
+        return {
+            "frames": self.frames,
+            "bytes": self.bytes,
+            "corrupted": self.corrupted,
+            "crc_errors": self.crc_errors,
+            "undetected": self.undetected,
+            "pool_slots": self.pool.capacity(),
+            "in_flight": self.pool.in_use(),
+        }
@@ -0,0 +1,141 @@
+from typing import Dict, Optional, Tuple
+from Utils.util import split_msg
+
+"""
+    Verificacion en linea de las garantias de entrega (en orden, sin duplicados, sin huecos).
+    DeliveryChecker se suscribe a las entregas del motor (Engine.add_probe) y revisa cada una al llegar,
+    con memoria constante por flujo: solo recuerda el siguiente id esperado y el
+    ultimo hueco abierto, sin guardar la lista de mensajes recibidos.
+"""
+
+
+"""
+    Excepcion que lanza DeliveryChecker en modo estricto ante la primera violacion
+"""
+class DeliveryViolation(AssertionError):
+    pass
+
+
+"""
+    Clase con el estado de verificacion de un flujo (peer origen)
+    Atributos:
+        expected (int): Siguiente id que deberia entregarse
+        delivered (int): Entregas vistas
+        duplicates (int): Entregas de un id ya entregado
+        gaps (int): Veces que se salto al menos un id
+        skipped (int): Ids saltados en total (pueden llegar luego, fuera de orden)
+        reordered (int): Ids entregados tarde que caen en el ultimo hueco (aproximado: con memoria
+                         constante no se distingue un id del hueco que llega dos veces)
+        first_violation (tuple|None): (t, tipo, id) de la primera violacion
+"""
+class FlowCheck:
+
+    __slots__ = ("expected", "delivered", "duplicates", "gaps", "skipped", "reordered",
+                 "_gap_lo", "_gap_hi", "first_violation")
+
+    def __init__(self):
+        self.expected = 0
+        self.delivered = 0
+        self.duplicates = 0
+        self.gaps = 0
+        self.skipped = 0
+        self.reordered = 0
+        self._gap_lo = 0          # ultimo hueco abierto [lo, hi)
+        self._gap_hi = 0
+        self.first_violation: Optional[Tuple[float, str, int]] = None
+
+    def ok(self) -> bool:
+        return self.first_violation is None
+
+    def as_dict(self) -> dict:
+        return {
+            "expected": self.expected,
+            "delivered": self.delivered,
+            "duplicates": self.duplicates,
+            "gaps": self.gaps,
+            "skipped": self.skipped,
+            "reordered": self.reordered,
+            "first_violation": self.first_violation,
+        }
+
+
+"""
+    Clase que verifica cada entrega de la capa de enlace a la capa de red
+    Args:
+        strict (bool): Si es True lanza DeliveryViolation en la primera violacion
+"""
+class DeliveryChecker:
+
+    def __init__(self, strict: bool = False):
+        self.strict = strict
+        self.flows: Dict[str, FlowCheck] = {}
+
+    """
+        Funcion que revisa una entrega
+        Args:
+            flow (str): Flujo del mensaje ("A", "B")
+            mid (int): Id del mensaje dentro del flujo
+            t (float): Instante de la entrega
+        Returns:
+            str: "ok", "duplicate", "gap" o "reordered"
+        Raises:
+            DeliveryViolation: En modo estricto, si la entrega no es la esperada
+    """
+    def check(self, flow: str, mid: int, t: float = 0.0) -> str:
+        fc = self.flows.get(flow)
+        if fc is None:
+            fc = self.flows[flow] = FlowCheck()
+        fc.delivered += 1
+        if mid == fc.expected:
+            fc.expected += 1
+            return "ok"
+        if mid > fc.expected:
+            fc.gaps += 1
+            fc.skipped += mid - fc.expected
+            fc._gap_lo, fc._gap_hi = fc.expected, mid
+            fc.expected = mid + 1
+            kind = "gap"
+        elif fc._gap_lo <= mid < fc._gap_hi:
+            # rellena el ultimo hueco: llego tarde, no repetido
+            fc.reordered += 1
+            fc.skipped -= 1
+            if mid == fc._gap_lo:
+                fc._gap_lo += 1
+            kind = "reordered"
+        else:
+            fc.duplicates += 1
+            kind = "duplicate"
+        if fc.first_violation is None:
+            fc.first_violation = (t, kind, mid)
+        if self.strict:
+            raise DeliveryViolation(f"flujo {flow}: {kind} en t={t:.6f} (id={mid}, esperado={fc.expected})")
+        return kind
+
+    """
+        Funcion que revisa el dato entregado (p.ej. "A>MSG_12")
+        Args:
+            data (str): Dato del paquete entregado
+            t (float): Instante de la entrega
+        Returns:
+            str | None: Resultado de check, o None si el dato no tiene id de mensaje
+    """
+    def check_data(self, data: str, t: float = 0.0) -> Optional[str]:
+        flow, mid = split_msg(data)
+        if mid is None:
+            return None
+        return self.check(flow, mid, t)
+
+    """
+        Funcion que suscribe el verificador a las entregas de un motor
+    """
+    def attach(self, engine):
+        engine.subscribe(rx=self.on_deliver)
+
+    def on_deliver(self, t: float, p):
+        self.check_data(p.data, t)
+
+    def ok(self) -> bool:
+        return all(fc.ok() for fc in self.flows.values())
+
+    def summary(self) -> dict:
+        return {flow: fc.as_dict() for flow, fc in sorted(self.flows.items())}
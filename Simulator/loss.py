@@ -0,0 +1,264 @@
+import json, math, random, sys
+from typing import Iterable, List, Optional
+
+"""
+    Modelo de perdidas en rafagas de Gilbert-Elliott (SimConfig.loss_model = "gilbert").
+    El canal tiene dos estados, Good y Bad, y cambia de estado una vez por frame:
+    G->B con probabilidad p y B->G con probabilidad r. En cada estado un frame se
+    pierde con su propia probabilidad (loss_good, loss_bad) y se corrompe con
+    (corrupt_good, corrupt_bad). Con loss_good = 0 y loss_bad = 1 es el modelo de
+    Gilbert simple: las perdidas llegan en rafagas de largo medio 1/r.
+    Para no sortear varios random por frame, los estados y las decisiones se
+    generan por bloques: la permanencia en un estado es geometrica, asi que se
+    sortea el largo de cada racha (un random por racha) y dentro de ella la
+    distancia hasta la proxima perdida/corrupcion (un random por suceso).
+    fit_gilbert_elliott estima p, r y loss_bad de una traza observada de 0/1.
+"""
+
+
+"""
+    Funcion que sortea una variable geometrica (fracasos antes del primer exito)
+    Args:
+        log_q (float): log(1 - prob. de exito), < 0
+        rng: Generador
+    Returns:
+        int: Cantidad de fracasos (0, 1, 2, ...)
+"""
+def _geometric(log_q: float, rng) -> int:
+    return int(math.log(1.0 - rng.random()) / log_q)
+
+
+"""
+    Funcion que marca con 1 los sucesos de probabilidad q en flags[a:b]
+    Args:
+        flags (bytearray): Destino (ya en 0)
+        a, b (int): Rango a sortear
+        q (float): Probabilidad por posicion
+        rng: Generador
+"""
+def _mark(flags: bytearray, a: int, b: int, q: float, rng):
+    if q <= 0.0 or a >= b:
+        return
+    if q >= 1.0:
+        flags[a:b] = b"\x01" * (b - a)
+        return
+    log_q = math.log1p(-q)
+    j = a + _geometric(log_q, rng)
+    while j < b:
+        flags[j] = 1
+        j += 1 + _geometric(log_q, rng)
+
+
+"""
+    Clase canal de Gilbert-Elliott con muestreo por bloques
+    Args:
+        p (float): Prob. de pasar de Good a Bad en cada frame
+        r (float): Prob. de pasar de Bad a Good en cada frame
+        loss_good, loss_bad (float): Prob. de perdida en cada estado
+        corrupt_good, corrupt_bad (float): Prob. de corrupcion en cada estado
+        block (int): Frames que se generan por bloque
+        rng: Generador (random por defecto, asi random.seed reproduce la corrida)
+    Atributos:
+        frames (int): Frames que pasaron por el canal
+        bad_frames (int): Frames generados en estado Bad (incluye los del bloque aun no consumidos)
+"""
+class GilbertElliott:
+
+    def __init__(self, p: float, r: float, loss_good: float = 0.0, loss_bad: float = 1.0,
+                 corrupt_good: float = 0.0, corrupt_bad: float = 0.0, block: int = 1024, rng=random):
+        for name, v in (("p", p), ("r", r), ("loss_good", loss_good), ("loss_bad", loss_bad),
+                        ("corrupt_good", corrupt_good), ("corrupt_bad", corrupt_bad)):
+            if not 0.0 <= v <= 1.0:
+                raise ValueError(f"{name} debe estar en [0, 1]")
+        self.p, self.r = p, r
+        self.loss = (loss_good, loss_bad)
+        self.corrupt = (corrupt_good, corrupt_bad)
+        self.block = block
+        self.rng = rng
+        self.bad = False             # estado del ultimo frame generado
+        self._run = 0                # frames que le quedan a la racha actual
+        self._drops = bytearray()
+        self._corrupts = bytearray()
+        self._i = -1
+        self._done = 0               # frames de bloques ya consumidos
+        self.bad_frames = 0
+        self._run = self._draw_run()
+
+    """
+        Funcion que sortea el largo de una racha en el estado actual
+        Returns:
+            int: Frames (>= 1) hasta salir del estado; un valor enorme si la salida tiene prob. 0
+    """
+    def _draw_run(self) -> int:
+        leave = self.r if self.bad else self.p
+        if leave >= 1.0:
+            return 1
+        if leave <= 0.0:
+            return sys.maxsize
+        return 1 + _geometric(math.log1p(-leave), self.rng)
+
+    """
+        Funcion que genera el siguiente bloque de decisiones de perdida y corrupcion
+    """
+    def _refill(self):
+        n = self.block
+        drops = bytearray(n)
+        corrupts = bytearray(n)
+        rng = self.rng
+        i = 0
+        while i < n:
+            if self._run == 0:
+                self.bad = not self.bad
+                self._run = self._draw_run()
+            k = min(self._run, n - i)
+            s = 1 if self.bad else 0
+            _mark(drops, i, i + k, self.loss[s], rng)
+            _mark(corrupts, i, i + k, self.corrupt[s], rng)
+            if s:
+                self.bad_frames += k
+            self._run -= k
+            i += k
+        self._done += len(self._drops)
+        self._drops, self._corrupts = drops, corrupts
+        self._i = -1
+
+    # Avanza un frame y devuelve 1 si se pierde (0 si no)
+    def will_drop(self) -> int:
+        i = self._i = self._i + 1
+        try:
+            return self._drops[i]
+        except IndexError:
+            self._refill()
+            self._i = 0
+            return self._drops[0]
+
+    # Avanza un frame sin aplicar su perdida (la copia de un frame duplicado, ver Engine._impaired_send)
+    def advance(self):
+        self.will_drop()
+
+    # Corrupcion del frame actual (el ultimo que paso por will_drop)
+    def will_corrupt(self) -> int:
+        return self._corrupts[self._i] if self._i >= 0 else 0
+
+    @property
+    def frames(self) -> int:
+        return self._done + self._i + 1
+
+    """
+        Funcion que calcula las tasas de largo plazo del modelo
+        Returns:
+            dict: pi_bad (fraccion del tiempo en Bad), loss y corrupt medios y largo medio de una racha Bad
+    """
+    def stationary(self) -> dict:
+        pi_bad = self.p / (self.p + self.r) if self.p + self.r > 0 else 0.0
+        return {
+            "pi_bad": pi_bad,
+            "loss": (1 - pi_bad) * self.loss[0] + pi_bad * self.loss[1],
+            "corrupt": (1 - pi_bad) * self.corrupt[0] + pi_bad * self.corrupt[1],
+            "mean_bad_run": 1.0 / self.r if self.r > 0 else math.inf,
+        }
+
+    def summary(self) -> dict:
+        return {"model": "gilbert", "p": self.p, "r": self.r, "frames": self.frames, **self.stationary()}
+
+
+"""
+    Funcion que crea el modelo con los campos ge_* de un SimConfig
+    Args:
+        cfg (SimConfig): Configuracion (ge_p, ge_r, ge_loss_good, ge_loss_bad, ge_corrupt_good, ge_corrupt_bad)
+        rng: Generador (random por defecto)
+    Returns:
+        GilbertElliott
+"""
+def gilbert_from_config(cfg, rng=random) -> GilbertElliott:
+    return GilbertElliott(cfg.ge_p, cfg.ge_r, cfg.ge_loss_good, cfg.ge_loss_bad,
+                          cfg.ge_corrupt_good, cfg.ge_corrupt_bad, rng=rng)
+
+
+"""
+    Funcion que estima los parametros de Gilbert-Elliott de una traza de perdidas
+    Args:
+        trace (Iterable[int]): 1 = frame perdido, 0 = recibido, en orden de envio
+    Returns:
+        dict: p, r, loss_good (siempre 0), loss_bad y method:
+              - "gilbert-elliott": metodo de Gilbert con las frecuencias de 1, 11 y 111/101
+                (a = P(1), b = P(1|1), c = P(111)/(P(101)+P(111)); 1-r = (ac-b^2)/(2ac-b(a+c)),
+                loss_bad = b/(1-r), p = a r/(loss_bad-a))
+              - "gilbert": si lo anterior no da parametros validos (traza corta o sin rafagas),
+                Gilbert simple con loss_bad = 1: p = P(1|0), r = P(0|1)
+    Raises:
+        ValueError: Si la traza tiene menos de 2 frames
+"""
+def fit_gilbert_elliott(trace: Iterable[int]) -> dict:
+    xs: List[int] = [1 if x else 0 for x in trace]
+    n = len(xs)
+    if n < 2:
+        raise ValueError("la traza necesita al menos 2 frames")
+    ones = sum(xs)
+    n01 = n10 = n11 = 0
+    for prev, cur in zip(xs, xs[1:]):
+        if prev and cur:
+            n11 += 1
+        elif prev:
+            n10 += 1
+        elif cur:
+            n01 += 1
+    n111 = n101 = 0
+    for x0, x1, x2 in zip(xs, xs[1:], xs[2:]):
+        if x0 and x2:
+            if x1:
+                n111 += 1
+            else:
+                n101 += 1
+    ones_prev = n10 + n11
+    zeros_prev = (n - 1) - ones_prev
+    a = ones / n
+    b = n11 / ones_prev if ones_prev else 0.0
+    c = n111 / (n111 + n101) if n111 + n101 else 0.0
+    den = 2 * a * c - b * (a + c)
+    if den != 0.0:
+        x = (a * c - b * b) / den
+        r = 1.0 - x
+        if 0.0 < x < 1.0 and 0.0 < r:
+            loss_bad = b / x
+            if a < loss_bad <= 1.0:
+                p = a * r / (loss_bad - a)
+                if 0.0 <= p <= 1.0:
+                    return {"p": p, "r": r, "loss_good": 0.0, "loss_bad": loss_bad, "method": "gilbert-elliott"}
+    p = n01 / zeros_prev if zeros_prev else 0.0
+    r = n10 / ones_prev if ones_prev else 1.0
+    return {"p": p, "r": r, "loss_good": 0.0, "loss_bad": 1.0, "method": "gilbert"}
+
+
+"""
+    Funcion que lee una traza de perdidas de texto
+    Args:
+        path (str): Archivo con caracteres '0'/'1' (1 = perdido); se ignora todo lo demas
+    Returns:
+        list[int]
+"""
+def load_loss_trace(path: str) -> List[int]:
+    with open(path, "rb") as f:
+        data = f.read()
+    return [1 if ch == 0x31 else 0 for ch in data if ch in (0x30, 0x31)]
+
+
+"""
+    Funcion principal: ajusta el modelo a una traza y muestra los parametros
+    Uso (desde la raiz del repo):
+        python -m Simulator.loss traza.txt
+"""
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) != 1:
+        print("uso: python -m Simulator.loss TRAZA (archivo de 0/1, 1 = perdido)", file=sys.stderr)
+        return 2
+    fit = fit_gilbert_elliott(load_loss_trace(argv[0]))
+    print(json.dumps(fit))
+    print(f"--loss-model gilbert --ge {fit['p']:.6g},{fit['r']:.6g},{fit['loss_good']:.6g},{fit['loss_bad']:.6g}",
+          file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+import math
+from typing import Dict, Optional, Tuple
+from Utils.types import FrameKind
+from Utils.util import split_msg
+
+"""
+    Metricas de latencia extremo a extremo por mensaje y contadores de la corrida.
+    LatencyTracker guarda, por id de mensaje (flujo, i), el instante en que
+    from_network_layer lo produjo y cuantas veces salio como DATA; al entregarse
+    con to_network_layer vuelca la latencia a un LatencyHistogram y libera la
+    entrada, asi que la memoria es proporcional a los mensajes en vuelo.
+    Ambos son opcionales: se enganchan con Engine.add_probe(nombre, objeto).
+"""
+
+
+"""
+    Clase histograma con buckets logaritmicos (error relativo acotado por precision)
+    Args:
+        lowest (float): Menor valor distinguible; lo que cae por debajo va al bucket 0
+        highest (float): Mayor valor esperado; lo que lo supera va al ultimo bucket
+        precision (float): Ancho relativo de cada bucket (0.01 = 1%)
+"""
+class LatencyHistogram:
+
+    def __init__(self, lowest: float = 1e-6, highest: float = 1e6, precision: float = 0.01):
+        self.lowest = lowest
+        self._log_g = math.log1p(precision)
+        self._n = int(math.ceil(math.log(highest / lowest) / self._log_g)) + 2
+        self.counts = [0] * self._n
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    """
+        Funcion que calcula el bucket de un valor
+        Args:
+            x (float): Valor (segundos)
+        Returns:
+            int: Indice; 0 para x < lowest
+    """
+    def _index(self, x: float) -> int:
+        if x < self.lowest:
+            return 0
+        i = int(math.log(x / self.lowest) / self._log_g) + 1
+        return i if i < self._n else self._n - 1
+
+    """
+        Funcion que devuelve el valor representativo de un bucket (media geometrica de sus bordes)
+    """
+    def _value(self, i: int) -> float:
+        if i == 0:
+            return 0.0
+        return self.lowest * math.exp((i - 0.5) * self._log_g)
+
+    def add(self, x: float):
+        self.counts[self._index(x)] += 1
+        self.count += 1
+        self.total += x
+        if x < self.min:
+            self.min = x
+        if x > self.max:
+            self.max = x
+
+    def __len__(self):
+        return self.count
+
+    def mean(self) -> float:
+        return (self.total / self.count) if self.count else 0.0
+
+    """
+        Funcion que estima un cuantil
+        Args:
+            q (float): Cuantil en [0, 1] (0.99 = p99)
+        Returns:
+            float: Valor aproximado (dentro de la precision del histograma), acotado por min y max
+    """
+    def quantile(self, q: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(1, int(math.ceil(q * self.count)))
+        acc = 0
+        for i, c in enumerate(self.counts):
+            acc += c
+            if acc >= rank:
+                return min(self.max, max(self.min, self._value(i)))
+        return self.max
+
+    """
+        Funcion que suma otro histograma con la misma configuracion
+    """
+    def merge(self, other: "LatencyHistogram"):
+        for i, c in enumerate(other.counts):
+            if c:
+                self.counts[i] += c
+        self.count += other.count
+        self.total += other.total
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+
+    """
+        Funcion que resume el histograma
+        Returns:
+            dict: count, mean, min, max, p50, p99, p999 (segundos)
+    """
+    def summary(self) -> dict:
+        if not self.count:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": self.mean(),
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.50),
+            "p99": self.quantile(0.99),
+            "p999": self.quantile(0.999),
+        }
+
+
+"""
+    Clase que sigue cada mensaje desde que la capa de red lo produce hasta que se entrega
+    Atributos:
+        latency (LatencyHistogram): Latencias de todos los flujos
+        by_flow (dict[str, LatencyHistogram]): Latencias por flujo ("A", "B")
+        queueing (LatencyHistogram): Latencia desde la llegada a la fuente (solo con fuentes de trafico)
+        retx (dict[int, int]): Retransmisiones por mensaje entregado -> cantidad de mensajes
+"""
+class LatencyTracker:
+
+    def __init__(self):
+        self._pending: Dict[Tuple[str, int], list] = {}     # (flujo, id) -> [t_envio, t_llegada|None, tx]
+        self.latency = LatencyHistogram()
+        self.by_flow: Dict[str, LatencyHistogram] = {}
+        self.queueing = LatencyHistogram()
+        self.retx: Dict[int, int] = {}
+        self.delivered = 0
+        self.duplicates = 0
+
+    """
+        Funcion que suscribe el tracker a un motor
+        Args:
+            engine (Engine): Motor a observar (produce, tx y rx)
+    """
+    def attach(self, engine):
+        engine.subscribe(produce=self.on_produce, tx=self.on_transmit, rx=self.on_deliver)
+
+    """
+        Funcion que registra un mensaje recien producido por la capa de red
+        Args:
+            t (float): Instante de from_network_layer
+            peer (str): Peer origen (flujo)
+            p (Packet): Paquete producido ("MSG_i")
+            born (float, opcional): Instante de llegada a la fuente de trafico
+    """
+    def on_produce(self, t: float, peer: str, p, born: Optional[float] = None):
+        _, mid = split_msg(p.data)
+        if mid is not None:
+            self._pending[(peer, mid)] = [t, born, 0]
+
+    """
+        Funcion que cuenta una transmision de DATA del mensaje
+        Args:
+            t (float): Instante de to_physical_layer
+            f (Frame): Frame transmitido (solo cuenta DATA, p.ej. "A>MSG_3")
+    """
+    def on_transmit(self, t: float, f):
+        if f.kind != FrameKind.DATA:
+            return
+        entry = self._pending.get(split_msg(f.info.data))
+        if entry is not None:
+            entry[2] += 1
+
+    """
+        Funcion que registra la entrega de un mensaje y su latencia
+        Args:
+            t (float): Instante de to_network_layer
+            p (Packet): Paquete entregado
+    """
+    def on_deliver(self, t: float, p):
+        key = split_msg(p.data)
+        if key[1] is None:
+            return
+        entry = self._pending.pop(key, None)
+        if entry is None:
+            self.duplicates += 1
+            return
+        sent, born, tx = entry
+        lat = t - sent
+        self.latency.add(lat)
+        h = self.by_flow.get(key[0])
+        if h is None:
+            h = self.by_flow[key[0]] = LatencyHistogram()
+        h.add(lat)
+        if born is not None:
+            self.queueing.add(t - born)
+        r = max(0, tx - 1)
+        self.retx[r] = self.retx.get(r, 0) + 1
+        self.delivered += 1
+
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    """
+        Funcion que resume el estado (se puede llamar durante la corrida o al final)
+        Returns:
+            dict: latency, by_flow, queueing (si aplica), retx por mensaje, delivered, in_flight, duplicates
+    """
+    def summary(self) -> dict:
+        out = {
+            "latency": self.latency.summary(),
+            "by_flow": {f: h.summary() for f, h in sorted(self.by_flow.items())},
+            "retx_per_msg": {str(k): v for k, v in sorted(self.retx.items())},
+            "delivered": self.delivered,
+            "in_flight": self.in_flight(),
+            "duplicates": self.duplicates,
+        }
+        if self.queueing.count:
+            out["queueing"] = self.queueing.summary()
+        return out
+
+
+"""
+    Clase con contadores agregados de la corrida (lo minimo para el resumen de la CLI)
+    Atributos:
+        tx (int): Frames enviados a la capa fisica
+        tx_data (int): De ellos, DATA
+        tx_ack (int): De ellos, ACK
+        rx (int): Paquetes entregados a la capa de red
+"""
+class Counters:
+
+    def __init__(self):
+        self.tx = 0
+        self.tx_data = 0
+        self.tx_ack = 0
+        self.rx = 0
+
+    def attach(self, engine):
+        engine.subscribe(tx=self.on_transmit, rx=self.on_deliver)
+
+    def on_transmit(self, t: float, f):
+        self.tx += 1
+        if f.kind == FrameKind.DATA:
+            self.tx_data += 1
+        elif f.kind == FrameKind.ACK:
+            self.tx_ack += 1
+
+    def on_deliver(self, t: float, p):
+        self.rx += 1
+
+    def summary(self) -> dict:
+        return {"tx": self.tx, "tx_data": self.tx_data, "tx_ack": self.tx_ack, "rx": self.rx}
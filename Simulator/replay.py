@@ -0,0 +1,233 @@
+import mmap, struct, sys
+from array import array
+from typing import Iterable, List, Optional, Tuple
+
+"""
+    Canal guiado por traza (SimConfig.channel_trace): en lugar de sortear, cada
+    frame que entra al canal consume el siguiente registro de un archivo binario
+    con las decisiones observadas en un enlace real:
+
+        "CHTRACE1" (8 bytes) | registros de 5 bytes: delay (f32, segundos) | flags (u8)
+
+    flags: bit 0 = perdido, bit 1 = corrupto; todo little-endian. El archivo se
+    recorre con mmap por bloques (no se carga entero, sirve para trazas de
+    cualquier tamaño) y al terminar vuelve a empezar. El delay del registro
+    reemplaza a delay/jitter de SimConfig para ese frame.
+    Cada direccion (A>B, B>A) abre su propio TraceReplay. Si ambas usan el mismo
+    archivo, B>A arranca en la mitad (make_channels -> seek(records // 2)) para que
+    no repitan la misma secuencia de perdidas al mismo tiempo; las direcciones siguen
+    correlacionadas con ese desfase (para independizarlas, SimConfig.reverse con
+    otra traza). El mmap se libera con close() (Engine.close al terminar la corrida).
+    Para armar un archivo desde texto (una linea "delay,drop,corrupt" por frame,
+    p.ej. exportada de una captura):
+        python -m Simulator.replay convert entrada.csv salida.bin
+        python -m Simulator.replay info salida.bin
+"""
+
+MAGIC = b"CHTRACE1"
+RECORD = struct.Struct("<fB")
+DROP = 1
+CORRUPT = 2
+
+
+"""
+    Clase que reproduce una traza de canal desde un archivo mapeado en memoria
+    Args:
+        path (str): Archivo en el formato de este modulo
+        block (int): Registros que se decodifican por vez
+    Atributos:
+        records (int): Registros en el archivo
+        frames (int): Frames que consumieron un registro
+        wraps (int): Veces que la traza volvio a empezar
+    Raises:
+        ValueError: Si el archivo no tiene el encabezado o no tiene registros completos
+"""
+class TraceReplay:
+
+    def __init__(self, path: str, block: int = 4096):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(self._mm, "madvise") and hasattr(mmap, "MADV_SEQUENTIAL"):
+            self._mm.madvise(mmap.MADV_SEQUENTIAL)
+        if self._mm[:len(MAGIC)] != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path}: no es una traza de canal (falta el encabezado {MAGIC!r})")
+        self.records = (len(self._mm) - len(MAGIC)) // RECORD.size
+        if self.records == 0:
+            self._mm.close()
+            raise ValueError(f"{path}: la traza no tiene registros")
+        self.block = block
+        self._next = 0               # siguiente registro del archivo a decodificar
+        self._delays = memoryview(bytearray()).cast("f")
+        self._flags = b""
+        self._i = -1
+        self._done = 0
+        self.wraps = 0
+        self.drops = 0
+        self.corrupts = 0
+        self._corrupt_at = -1        # ultimo registro ya contado en corrupts
+
+    """
+        Funcion que decodifica el siguiente bloque de registros (vuelve al inicio al terminar)
+    """
+    def _refill(self):
+        if self._next >= self.records:
+            self._next = 0
+            self.wraps += 1
+        n = min(self.block, self.records - self._next)
+        off = len(MAGIC) + self._next * RECORD.size
+        end = off + n * RECORD.size
+        mm = self._mm
+        # slicing con paso 5 separa las columnas sin un loop en Python: los 4 bytes de cada
+        # delay se entrelazan en un buffer contiguo que se ve como float32
+        raw = bytearray(4 * n)
+        for k in range(4):
+            raw[k::4] = mm[off + k:end:RECORD.size]
+        self._done += len(self._flags)
+        if sys.byteorder == "little":
+            self._delays = memoryview(raw).cast("f")
+        else:
+            self._delays = array("f", raw)
+            self._delays.byteswap()
+        self._flags = mm[off + 4:end:RECORD.size]
+        self._next += n
+        self._i = -1
+
+    """
+        Funcion que hace que el proximo frame consuma el registro dado (modulo records)
+        Args:
+            record (int): Indice del registro
+        Returns:
+            None: Descarta el bloque decodificado; los contadores no cambian
+    """
+    def seek(self, record: int):
+        self._done += self._i + 1
+        self._next = record % self.records
+        self._delays = memoryview(bytearray()).cast("f")
+        self._flags = b""
+        self._i = -1
+
+    # Avanza un frame y devuelve 1 si la traza dice que se perdio (0 si no)
+    def will_drop(self) -> int:
+        i = self._i = self._i + 1
+        try:
+            d = self._flags[i] & DROP
+        except IndexError:
+            self._refill()
+            i = self._i = 0
+            d = self._flags[0] & DROP
+        self.drops += d
+        return d
+
+    # Avanza un registro sin aplicar su perdida (la copia de un frame duplicado, ver Engine._impaired_send)
+    def advance(self):
+        self._i += 1
+        if self._i >= len(self._flags):
+            self._refill()
+            self._i = 0
+
+    # Corrupcion del frame actual (el ultimo que paso por will_drop); cuenta una vez por registro
+    def will_corrupt(self) -> bool:
+        i = self._i
+        if i < 0 or not self._flags[i] & CORRUPT:
+            return False
+        n = self._done + i
+        if n != self._corrupt_at:
+            self._corrupt_at = n
+            self.corrupts += 1
+        return True
+
+    # Retardo del frame actual segun la traza
+    def sample_delay(self) -> float:
+        return self._delays[self._i] if self._i >= 0 else 0.0
+
+    @property
+    def frames(self) -> int:
+        return self._done + self._i + 1
+
+    def close(self):
+        self._mm.close()
+
+    def summary(self) -> dict:
+        n = self.frames
+        return {
+            "model": "trace",
+            "path": self.path,
+            "records": self.records,
+            "frames": n,
+            "wraps": self.wraps,
+            "loss": self.drops / n if n else 0.0,
+            "corrupt": self.corrupts / n if n else 0.0,
+        }
+
+
+"""
+    Funcion que escribe una traza de canal
+    Args:
+        path (str): Archivo de salida
+        records (Iterable[tuple[float, bool, bool]]): (delay, perdido, corrupto) por frame
+    Returns:
+        int: Registros escritos
+"""
+def write_channel_trace(path: str, records: Iterable[Tuple[float, bool, bool]]) -> int:
+    n = 0
+    pack = RECORD.pack
+    with open(path, "wb") as f:
+        f.write(MAGIC)
+        for delay, drop, corrupt in records:
+            f.write(pack(delay, (DROP if drop else 0) | (CORRUPT if corrupt else 0)))
+            n += 1
+    return n
+
+
+"""
+    Funcion que lee registros de texto "delay,drop,corrupt" (drop y corrupt 0/1, corrupt opcional)
+    Args:
+        lines (Iterable[str]): Lineas; se ignoran las vacias y las que empiezan con '#'
+    Returns:
+        Iterator[tuple[float, bool, bool]]
+    Raises:
+        ValueError: Si una linea no tiene el formato
+"""
+def parse_text_records(lines: Iterable[str]):
+    for k, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        parts = line.split(",")
+        if len(parts) not in (2, 3):
+            raise ValueError(f"linea {k}: se esperaba delay,drop[,corrupt]")
+        yield float(parts[0]), parts[1].strip() == "1", len(parts) == 3 and parts[2].strip() == "1"
+
+
+"""
+    Funcion principal: convierte texto a traza binaria o resume una traza
+    Uso (desde la raiz del repo):
+        python -m Simulator.replay convert entrada.csv salida.bin
+        python -m Simulator.replay info traza.bin
+"""
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) == 3 and argv[0] == "convert":
+        with open(argv[1], "r", encoding="utf-8") as f:
+            n = write_channel_trace(argv[2], parse_text_records(f))
+        print(f"{n} registros -> {argv[2]}")
+        return 0
+    if len(argv) == 2 and argv[0] == "info":
+        tr = TraceReplay(argv[1])
+        delay = drops = corrupts = 0
+        for _ in range(tr.records):
+            drops += tr.will_drop()
+            corrupts += tr.will_corrupt()
+            delay += tr.sample_delay()
+        n = tr.records
+        print(f"registros={n} loss={drops / n:.4g} corrupt={corrupts / n:.4g} delay_medio={delay / n:.6g}s")
+        tr.close()
+        return 0
+    print("uso: python -m Simulator.replay convert ENTRADA.csv SALIDA.bin | info TRAZA.bin", file=sys.stderr)
+    return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+import random
+
+"""
+    Politicas de admision de la cola del router cuello de botella.
+    Cada enlace con tasa finita (Simulator.channel.Link) puede tener delante un
+    buffer de SimConfig.queue_size frames; cuando llega un frame la politica
+    decide si entra mirando la ocupacion actual (frames esperando + el que se
+    esta transmitiendo):
+      - DropTail: descarta solo si el buffer esta lleno.
+      - RedQueue: Random Early Detection (Floyd y Jacobson, 1993). Mantiene un
+        promedio exponencial de la ocupacion y descarta con probabilidad creciente
+        entre red_min y red_max (fracciones del buffer); por encima de red_max
+        descarta todo. Ademas respeta el limite fisico del buffer.
+    Se elige con SimConfig.queue_policy ("droptail" o "red").
+"""
+
+
+"""
+    Clase politica drop-tail
+    Args:
+        limit (int): Frames que caben en el buffer
+"""
+class DropTail:
+
+    name = "droptail"
+
+    def __init__(self, limit: int, cfg=None, rng=random):
+        self.limit = limit
+        self.early_drops = 0
+
+    """
+        Funcion que decide si un frame entra al buffer
+        Args:
+            q (int): Ocupacion actual (frames)
+            now (float): Instante de llegada
+            idle (float): Frames que el enlace pudo haber transmitido mientras estuvo vacio
+                          (tiempo vacio / tiempo de transmision de un frame; 0 si esta ocupado)
+        Returns:
+            bool: True si se acepta
+    """
+    def admit(self, q: int, now: float, idle: float) -> bool:
+        return q < self.limit
+
+    def summary(self) -> dict:
+        return {"policy": self.name}
+
+
+"""
+    Clase politica RED
+    Args:
+        limit (int): Frames que caben en el buffer
+        cfg (SimConfig): Lee red_min, red_max (fracciones de limit), red_max_p y red_weight
+        rng: Generador de los descartes probabilisticos (random por defecto)
+    Atributos:
+        avg (float): Promedio exponencial de la ocupacion
+        early_drops (int): Descartes probabilisticos (avg entre min y max) o por avg >= max
+"""
+class RedQueue:
+
+    name = "red"
+
+    def __init__(self, limit: int, cfg=None, rng=random):
+        self.limit = limit
+        self.rng = rng
+        self.min_th = limit * getattr(cfg, "red_min", 0.25)
+        self.max_th = limit * getattr(cfg, "red_max", 0.75)
+        if not 0 <= self.min_th < self.max_th:
+            raise ValueError("RED necesita 0 <= red_min < red_max")
+        self.max_p = getattr(cfg, "red_max_p", 0.1)
+        self.w = getattr(cfg, "red_weight", 0.002)
+        self.avg = 0.0
+        self.count = -1              # frames aceptados desde el ultimo descarte temprano
+        self.early_drops = 0
+
+    def admit(self, q: int, now: float, idle: float) -> bool:
+        w = self.w
+        if q == 0 and idle > 0:
+            # con la cola vacia el promedio decae como si hubieran llegado idle frames a una cola vacia
+            self.avg *= (1.0 - w) ** idle
+        else:
+            self.avg += w * (q - self.avg)
+        if q >= self.limit:
+            return False
+        avg = self.avg
+        if avg < self.min_th:
+            self.count = -1
+            return True
+        if avg >= self.max_th:
+            self.count = 0
+            self.early_drops += 1
+            return False
+        self.count += 1
+        pb = self.max_p * (avg - self.min_th) / (self.max_th - self.min_th)
+        pa = pb / (1.0 - self.count * pb) if self.count * pb < 1.0 else 1.0
+        if self.rng.random() < pa:
+            self.count = 0
+            self.early_drops += 1
+            return False
+        return True
+
+    def summary(self) -> dict:
+        return {"policy": self.name, "avg": self.avg, "min_th": self.min_th, "max_th": self.max_th}
+
+
+QUEUE_POLICIES = {"droptail": DropTail, "red": RedQueue}
+
+
+"""
+    Funcion que crea la politica de la cola por nombre
+    Args:
+        kind (str): "droptail" o "red"
+        limit (int): Frames que caben en el buffer
+        cfg (SimConfig, opcional): Parametros de RED
+        rng: Generador de los descartes de RED (random por defecto)
+    Returns:
+        DropTail | RedQueue
+    Raises:
+        ValueError: Si el nombre no existe o el buffer no es positivo
+"""
+def make_queue_policy(kind: str, limit: int, cfg=None, rng=random):
+    cls = QUEUE_POLICIES.get(kind)
+    if cls is None:
+        raise ValueError(f"queue_policy invalida '{kind}' (opciones: {', '.join(QUEUE_POLICIES)})")
+    if limit <= 0:
+        raise ValueError("queue_size debe ser > 0")
+    return cls(limit, cfg, rng)
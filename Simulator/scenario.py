@@ -0,0 +1,225 @@
+import math
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+"""
+    Escenarios: cambios del canal a lo largo de la corrida (SimConfig queda fijo,
+    los cambios se aplican sobre el canal de cada direccion) y metrica de
+    recuperacion de los protocolos despues de cada perturbacion.
+    Cada paso se escribe "T[+D][@DIR]:accion[,accion...]":
+        5:loss=0.3              desde t=5 s la perdida pasa a 0.3 (ambas direcciones)
+        10+2:outage             enlace cortado de t=10 a t=12 (todo frame se pierde)
+        15+1:delay=0.5          pico de retardo de 1 s
+        20@B>A:corrupt=0.1      solo la direccion de los ACK
+    Acciones: delay, jitter, loss, corrupt (valor) y outage (sin valor). Con +D el
+    cambio se deshace al final; sin +D queda hasta el final de la corrida. Si los
+    pasos se solapan sobre el mismo campo manda el que empezo mas tarde y, al
+    terminar, el campo vuelve al del paso activo mas reciente o al original.
+    Los pasos se agendan como eventos del motor (Engine.call_at), asi que valen
+    para cualquier protocolo. Con un canal guiado por traza (channel_trace) solo
+    outage tiene efecto; con loss_model "gilbert" loss y corrupt no cambian nada.
+"""
+
+# accion -> campo de SimConfig
+_ACTIONS = {"delay": "delay", "jitter": "jitter", "loss": "loss_prob", "corrupt": "corrupt_prob"}
+_DIRS = {"A>B": ("A",), "B>A": ("B",), "": ("A", "B")}
+
+
+"""
+    Registro de un paso del escenario
+    Atributos:
+        at (float): Instante de inicio (s)
+        duration (float | None): Duracion; None = permanente
+        senders (tuple[str, ...]): Emisores afectados ("A" = A>B, "B" = B>A)
+        params (dict[str, float]): Campo de SimConfig -> valor
+        outage (bool): Corte del enlace
+        text (str): Paso tal como se escribio
+"""
+class Step(NamedTuple):
+    at: float
+    duration: Optional[float]
+    senders: Tuple[str, ...]
+    params: Dict[str, float]
+    outage: bool
+    text: str
+
+
+"""
+    Funcion que interpreta un paso "T[+D][@DIR]:accion,..."
+    Args:
+        text (str): Paso
+    Returns:
+        Step
+    Raises:
+        ValueError: Si el formato, la direccion o alguna accion no son validos
+"""
+def parse_step(text: str) -> Step:
+    when, sep, actions = text.strip().partition(":")
+    if not sep or not actions:
+        raise ValueError(f"paso {text!r}: se esperaba T[+D][@DIR]:accion[,accion...]")
+    when, _, direction = when.partition("@")
+    direction = direction.strip().upper()
+    if direction not in _DIRS:
+        raise ValueError(f"paso {text!r}: direccion invalida {direction!r} (A>B o B>A)")
+    start, plus, dur = when.partition("+")
+    try:
+        at = float(start)
+        duration = float(dur) if plus else None
+    except ValueError:
+        raise ValueError(f"paso {text!r}: tiempo invalido")
+    if at < 0 or (duration is not None and duration <= 0):
+        raise ValueError(f"paso {text!r}: T debe ser >= 0 y D > 0")
+    params, outage = {}, False
+    for item in actions.split(","):
+        key, eq, val = item.strip().partition("=")
+        if key == "outage" and not eq:
+            outage = True
+        elif key in _ACTIONS and eq:
+            try:
+                params[_ACTIONS[key]] = float(val)
+            except ValueError:
+                raise ValueError(f"paso {text!r}: valor invalido para {key}")
+        else:
+            raise ValueError(f"paso {text!r}: accion invalida {item!r} "
+                             f"(validas: {', '.join(_ACTIONS)}=valor, outage)")
+    return Step(at, duration, _DIRS[direction], params, outage, text.strip())
+
+
+"""
+    Funcion que lee los pasos de un escenario
+    Args:
+        items (list[str]): Pasos; "@archivo" lee un paso por linea (se ignoran vacias y '#')
+    Returns:
+        list[Step]: Ordenados por inicio
+    Raises:
+        ValueError, OSError: Si un paso o el archivo no son validos
+"""
+def parse_scenario(items: List[str]) -> List[Step]:
+    steps = []
+    for item in items:
+        if item.startswith("@"):
+            with open(item[1:], "r", encoding="utf-8") as f:
+                lines = [ln.strip() for ln in f]
+            steps.extend(parse_step(ln) for ln in lines if ln and not ln.startswith("#"))
+        else:
+            steps.append(parse_step(item))
+    return sorted(steps, key=lambda s: s.at)
+
+
+"""
+    Clase escenario enganchable al motor (Engine.attach_scenario)
+    Args:
+        steps (list[Step]): Pasos (ver parse_scenario)
+        window (float): Segundos para medir el goodput de referencia antes de cada
+                        perturbacion y la ventana movil con la que se busca la recuperacion
+        frac (float): Fraccion del goodput de referencia que cuenta como recuperado
+    Atributos:
+        applied (list[tuple[float, str]]): (instante, paso) de cada cambio aplicado o deshecho
+"""
+class Scenario:
+
+    def __init__(self, steps: List[Step], window: float = 2.0, frac: float = 0.9):
+        if window <= 0 or not 0 < frac <= 1:
+            raise ValueError("window debe ser > 0 y frac en (0, 1]")
+        self.steps = list(steps)
+        self.window = window
+        self.frac = frac
+        self.bin = window / 10.0
+        self.counts: List[int] = []      # entregas por intervalo de largo bin
+        self.applied: List[Tuple[float, str]] = []
+        # valor original de cada (emisor, campo) y pasos activos que lo cambian, en orden de inicio
+        self._base: Dict[Tuple[str, str], float] = {}
+        self._active: Dict[Tuple[str, str], List[Tuple[int, float]]] = {}
+        self._eng = None
+
+    def attach(self, engine):
+        self._eng = engine
+        engine.subscribe(rx=self.on_deliver)
+        for i, st in enumerate(self.steps):
+            engine.call_at(st.at, lambda i=i: self._start(i))
+            if st.duration is not None:
+                engine.call_at(st.at + st.duration, lambda i=i: self._end(i))
+
+    def on_deliver(self, t: float, p):
+        b = int(t / self.bin)
+        counts = self.counts
+        if b >= len(counts):
+            counts.extend([0] * (b + 1 - len(counts)))
+        counts[b] += 1
+
+    def _start(self, i: int):
+        st = self.steps[i]
+        for s in st.senders:
+            chan = self._eng.chans[s]
+            for name, v in st.params.items():
+                key = (s, name)
+                old = chan.set_param(name, v)
+                self._base.setdefault(key, old)
+                self._active.setdefault(key, []).append((i, v))
+            if st.outage:
+                chan.set_down(True)
+        self.applied.append((self._eng.now, st.text))
+
+    """
+        Funcion que deshace un paso: cada campo vuelve al valor del paso activo mas reciente
+        que lo cambie (los pasos pueden solaparse) o, si no queda ninguno, al valor original
+    """
+    def _end(self, i: int):
+        st = self.steps[i]
+        for s in st.senders:
+            chan = self._eng.chans[s]
+            for name in st.params:
+                key = (s, name)
+                active = [a for a in self._active.get(key, []) if a[0] != i]
+                self._active[key] = active
+                chan.set_param(name, active[-1][1] if active else self._base[key])
+        if st.outage:
+            for s in st.senders:
+                self._eng.chans[s].set_down(False)
+        self.applied.append((self._eng.now, f"fin {st.text}"))
+
+    """
+        Funcion que calcula el goodput medio (entregas/s) en [t0, t1)
+    """
+    def _rate(self, t0: float, t1: float) -> float:
+        if t1 <= t0:
+            return 0.0
+        b0, b1 = max(0, int(t0 / self.bin)), int(math.ceil(t1 / self.bin))
+        return sum(self.counts[b0:b1]) / ((b1 - b0) * self.bin)
+
+    """
+        Funcion que mide la recuperacion despues de cada paso
+        Returns:
+            list[dict]: Por paso: at, end, baseline (entregas/s en la ventana previa), during
+                        (entregas/s mientras duro; None si es permanente) y recovery: segundos desde el
+                        fin del paso (o su inicio si es permanente) hasta que el goodput en una ventana
+                        movil vuelve a frac * baseline; None si no se recupero o no hay referencia
+    """
+    def recovery(self) -> List[dict]:
+        out = []
+        now = self._eng.now if self._eng is not None else 0.0
+        for st in self.steps:
+            if st.at > now:
+                continue
+            end = st.at + st.duration if st.duration is not None else st.at
+            base = self._rate(max(0.0, st.at - self.window), st.at)
+            rec = None
+            if base > 0 and end <= now:
+                k = 0
+                while end + k * self.bin + self.window <= now:
+                    t = end + k * self.bin
+                    if self._rate(t, t + self.window) >= self.frac * base:
+                        rec = round(k * self.bin, 9)
+                        break
+                    k += 1
+            out.append({
+                "step": st.text,
+                "at": st.at,
+                "end": end if st.duration is not None else None,
+                "baseline": base,
+                "during": self._rate(st.at, min(end, now)) if st.duration is not None else None,
+                "recovery": rec,
+            })
+        return out
+
+    def summary(self) -> dict:
+        return {"window": self.window, "frac": self.frac, "steps": self.recovery()}
@@ -0,0 +1,284 @@
+import heapq, math
+from collections import deque
+from typing import List, Optional
+
+"""
+    Colas de eventos pendientes del motor.
+    Ambas guardan items (time, eid, ev, payload) ordenados por (time, eid) y exponen
+    la misma interfaz: push(item), push_many(items), pop(), peek_time() y len(). pop() lanza QueueDrained
+    con la cola vacia (el motor lo usa para detectar que nadie puede avanzar).
+      - HeapScheduler: heap binario, O(log n) por operacion (el de siempre).
+      - LadderQueue: cola calendario de varios niveles (ladder queue), O(1) amortizado
+        para agendar/extraer; conviene con cientos de miles de eventos pendientes
+        (ventanas grandes, muchos flujos, READY/TIMEOUT duplicados).
+    Se elige con SimConfig.scheduler ("heap" o "ladder").
+"""
+
+
+"""
+    Excepcion de pop() con la cola vacia. Es subclase de IndexError por compatibilidad, pero los
+    drivers atrapan solo esta: un IndexError de un protocolo o modelo es un error, no una cola vacia.
+"""
+class QueueDrained(IndexError):
+    pass
+
+
+"""
+    Clase cola de eventos sobre un heap binario
+"""
+class HeapScheduler:
+
+    def __init__(self):
+        self._heap: List[tuple] = []
+
+    def push(self, item: tuple):
+        heapq.heappush(self._heap, item)
+
+    """
+        Funcion que inserta varios items de una vez (rafaga de una ventana)
+        Args:
+            items (list[tuple]): Items (time, eid, ev, payload)
+        Detalles:
+            - heappush de tiempos futuros sube pocos niveles (O(1) en promedio), asi que
+              extend + heapify (O(n + k)) solo conviene si la rafaga es al menos tan grande
+              como lo que ya esta pendiente; si no, heappush en un loop sin llamadas a push.
+    """
+    def push_many(self, items: List[tuple]):
+        heap = self._heap
+        if len(items) >= len(heap):
+            heap.extend(items)
+            heapq.heapify(heap)
+        else:
+            for it in items:
+                heapq.heappush(heap, it)
+
+    def pop(self) -> tuple:
+        try:
+            return heapq.heappop(self._heap)
+        except IndexError:
+            raise QueueDrained("pop de una cola de eventos vacia") from None
+
+    def peek_time(self) -> Optional[float]:
+        return self._heap[0][0] if self._heap else None
+
+    def __len__(self):
+        return len(self._heap)
+
+
+"""
+    Clase peldaño de la LadderQueue: n buckets de ancho width desde start
+    (n = eventos / FILL, asi cada bucket arranca con ~FILL eventos)
+"""
+class _Rung:
+
+    __slots__ = ("start", "width", "inv", "n", "buckets", "cur")
+    FILL = 32
+
+    def __init__(self, items: List[tuple], lo: float, hi: float):
+        self.start = lo
+        n = self.n = max(1, len(items) // self.FILL)
+        self.width = (hi - lo) / n
+        inv = self.inv = n / (hi - lo)
+        buckets = self.buckets = [[] for _ in range(n)]
+        self.cur = 0                      # primer bucket sin consumir
+        last = n - 1
+        # mismo calculo que index, sin una llamada por item
+        for it in items:
+            i = int((it[0] - lo) * inv)
+            buckets[i if i < last else last].append(it)
+
+    """
+        Funcion que calcula el bucket de un tiempo (monotona en t, acotada al ultimo bucket)
+    """
+    def index(self, t: float) -> int:
+        i = int((t - self.start) * self.inv)
+        return i if i < self.n else self.n - 1
+
+
+"""
+    Clase ladder queue (Tang, Goh y Thng, 2005): variante de la cola calendario que
+    no depende de estimar un ancho de bucket fijo.
+      - top: lista sin ordenar con los eventos lejanos (t >= top_start), O(1) al agendar.
+      - peldaños: cuando hace falta, el top se reparte en buckets de ancho (max-min)/n;
+        un bucket con mas de THRES eventos se vuelve a repartir en un peldaño mas fino.
+      - bottom: heap chico con los proximos eventos (un bucket de a lo sumo THRES). Lo que se
+        agenda antes del peldaño en curso cae aca; si el bottom pasa de THRES se reparte en un
+        peldaño nuevo (el mas fino), asi no degenera en un heap grande.
+      - flat: un bucket grande con todos sus eventos en el mismo instante no se puede repartir
+        por tiempo; ordenado por eid es una fila FIFO (los que se agregan en ese instante van
+        al final), y pop toma el menor entre su frente y el del bottom.
+    Cada evento se mueve un numero acotado de veces, asi que agendar y extraer son
+    O(1) amortizado aun con distribuciones sesgadas (rafagas en el mismo instante,
+    mezclas de eventos cercanos y lejanos).
+"""
+class LadderQueue:
+
+    THRES = 100          # tamaño maximo de un bucket que pasa directo al bottom
+    MAX_RUNGS = 8
+
+    def __init__(self):
+        self._size = 0
+        self._top: List[tuple] = []
+        self._top_start = -math.inf
+        self._top_min = math.inf
+        self._top_max = -math.inf
+        self._rungs: List[_Rung] = []
+        self._bottom: List[tuple] = []
+        self._bottom_cap = self.THRES     # al pasarlo se intenta repartir el bottom (ver _spawn_bottom)
+        self._flat = deque()              # eventos de un mismo instante en orden de eid
+        self._flat_t = None
+
+    def push(self, item: tuple):
+        self._size += 1
+        t = item[0]
+        if t >= self._top_start:
+            self._top.append(item)
+            if t < self._top_min:
+                self._top_min = t
+            if t > self._top_max:
+                self._top_max = t
+            return
+        flat = self._flat
+        if flat and t == self._flat_t and item > flat[-1]:
+            flat.append(item)
+            return
+        for r in self._rungs:
+            if t >= r.start:
+                i = int((t - r.start) * r.inv)
+                if i >= r.n:
+                    i = r.n - 1
+                if i >= r.cur:
+                    r.buckets[i].append(item)
+                    return
+        bottom = self._bottom
+        heapq.heappush(bottom, item)
+        if len(bottom) > self._bottom_cap:
+            self._spawn_bottom()
+
+    """
+        Funcion que reparte un bottom que crecio en un peldaño nuevo
+        Detalles:
+            - Todo lo del bottom es anterior a lo que queda en los peldaños y el top, asi que el
+              peldaño nuevo va al final (es el primero que se consume).
+            - Si no se puede (todos en el mismo instante o ya hay MAX_RUNGS) el bottom sigue
+              como heap y el limite se duplica, para no recorrerlo en cada push.
+    """
+    def _spawn_bottom(self):
+        bottom = self._bottom
+        if len(self._rungs) < self.MAX_RUNGS:
+            lo = bottom[0][0]
+            hi = max(it[0] for it in bottom)
+            if hi > lo:
+                self._rungs.append(_Rung(bottom, lo, hi))
+                self._bottom = []
+                self._bottom_cap = self.THRES
+                return
+        self._bottom_cap = 2 * len(bottom)
+
+    """
+        Funcion que inserta varios items de una vez; si todos van al top (caso tipico de
+        una rafaga: llegadas y timers en el futuro) es un solo extend
+        Args:
+            items (list[tuple]): Items (time, eid, ev, payload)
+    """
+    def push_many(self, items: List[tuple]):
+        if not items:
+            return
+        lo = min(items)[0]
+        if lo < self._top_start:
+            for it in items:
+                self.push(it)
+            return
+        self._top.extend(items)
+        self._size += len(items)
+        hi = max(items)[0]
+        if lo < self._top_min:
+            self._top_min = lo
+        if hi > self._top_max:
+            self._top_max = hi
+
+    """
+        Funcion que deja en el bottom (o en flat) los proximos eventos (reparte top/buckets si hace falta)
+        Raises:
+            QueueDrained: Si la cola esta vacia
+    """
+    def _refill(self):
+        while not self._bottom:
+            if self._rungs:
+                r = self._rungs[-1]
+                buckets, i = r.buckets, r.cur
+                while i < r.n and not buckets[i]:
+                    i += 1
+                if i == r.n:
+                    self._rungs.pop()
+                    continue
+                items = buckets[i]
+                buckets[i] = []
+                r.cur = i + 1
+            elif self._top:
+                items = self._top
+                lo, hi = self._top_min, self._top_max
+                self._top = []
+                self._top_start = hi
+                self._top_min, self._top_max = math.inf, -math.inf
+                if len(items) > self.THRES and hi > lo:
+                    self._rungs.append(_Rung(items, lo, hi))
+                    continue
+            else:
+                raise QueueDrained("pop de una LadderQueue vacia")
+            if len(items) > self.THRES:
+                lo, hi = min(items)[0], max(items)[0]
+                if hi > lo and len(self._rungs) < self.MAX_RUNGS:
+                    self._rungs.append(_Rung(items, lo, hi))
+                    continue
+                if hi == lo:
+                    items.sort()
+                    self._flat = deque(items)
+                    self._flat_t = lo
+                    return
+            heapq.heapify(items)
+            self._bottom = items
+            self._bottom_cap = max(self.THRES, len(items))
+
+    def pop(self) -> tuple:
+        bottom, flat = self._bottom, self._flat
+        if not bottom and not flat:
+            self._refill()
+            bottom, flat = self._bottom, self._flat
+        self._size -= 1
+        if flat and (not bottom or flat[0] < bottom[0]):
+            return flat.popleft()
+        return heapq.heappop(bottom)
+
+    def peek_time(self) -> Optional[float]:
+        if not self._size:
+            return None
+        bottom, flat = self._bottom, self._flat
+        if not bottom and not flat:
+            self._refill()
+            bottom, flat = self._bottom, self._flat
+        if flat and (not bottom or flat[0] < bottom[0]):
+            return flat[0][0]
+        return bottom[0][0]
+
+    def __len__(self):
+        return self._size
+
+
+SCHEDULERS = {"heap": HeapScheduler, "ladder": LadderQueue}
+
+
+"""
+    Funcion que crea la cola de eventos por nombre
+    Args:
+        kind (str): "heap" o "ladder"
+    Returns:
+        HeapScheduler | LadderQueue
+    Raises:
+        ValueError: Si el nombre no existe
+"""
+def make_scheduler(kind: str):
+    cls = SCHEDULERS.get(kind)
+    if cls is None:
+        raise ValueError(f"scheduler invalido '{kind}' (opciones: {', '.join(SCHEDULERS)})")
+    return cls()
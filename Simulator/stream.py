@@ -0,0 +1,138 @@
+import random
+from typing import Optional
+from Utils.util import split_msg
+
+"""
+    Flujos de bytes de aplicacion sobre los protocolos ARQ.
+    ByteStream corta un buffer (archivo o generado) en segmentos de tamaño fijo:
+    el segmento i viaja como payload del mensaje MSG_i de ese peer, como un
+    memoryview del buffer original (sin copiar). StreamSink se suscribe a las
+    entregas de la capa de red y copia cada segmento una sola vez, directo a su
+    lugar en el buffer de salida, asi que el orden de llegada no importa.
+    Se enganchan con Engine.attach_stream(peer, stream).
+"""
+
+
+"""
+    Clase flujo de bytes a transmitir
+    Args:
+        data (bytes | bytearray | memoryview): Contenido (no se copia)
+        segment_size (int): Bytes por segmento (el ultimo puede ser mas corto)
+"""
+class ByteStream:
+
+    def __init__(self, data, segment_size: int = 1024):
+        if segment_size <= 0:
+            raise ValueError("segment_size debe ser > 0")
+        self.data = memoryview(data).cast("B")
+        if not len(self.data):
+            raise ValueError("el flujo esta vacio")
+        self.size = len(self.data)
+        self.segment_size = segment_size
+        self.segments = -(-self.size // segment_size)
+
+    """
+        Funcion que devuelve el segmento i como vista del buffer original
+    """
+    def segment(self, i: int) -> memoryview:
+        s = self.segment_size
+        return self.data[i * s:(i + 1) * s]
+
+
+"""
+    Funcion que arma un flujo desde un texto
+    Args:
+        spec (str): "gen:N" (N bytes pseudoaleatorios) o la ruta a un archivo
+        segment_size (int): Bytes por segmento
+        rng (random.Random, opcional): Generador para "gen:N" (por defecto el modulo random)
+    Returns:
+        ByteStream
+    Raises:
+        ValueError: Si el tamaño no es valido
+        OSError: Si el archivo no se puede leer
+"""
+def parse_stream(spec: str, segment_size: int = 1024, rng=None) -> ByteStream:
+    if spec.startswith("gen:"):
+        n = int(spec[4:])
+        if n <= 0:
+            raise ValueError("gen:N necesita N > 0")
+        return ByteStream((rng or random).randbytes(n), segment_size)
+    with open(spec, "rb") as f:
+        return ByteStream(f.read(), segment_size)
+
+
+"""
+    Clase que reensambla un ByteStream en el receptor
+    Args:
+        flow (str): Peer origen del flujo
+        stream (ByteStream): Flujo original (para tamaños y para verificar la salida)
+    Atributos:
+        out (bytearray): Buffer de salida del tamaño del flujo
+        received (int): Segmentos distintos recibidos
+        duplicates (int): Segmentos recibidos mas de una vez (no se reescriben)
+        completed_at (float | None): Instante en que llego el ultimo segmento faltante
+"""
+class StreamSink:
+
+    def __init__(self, flow: str, stream: ByteStream):
+        self.flow = flow
+        self.stream = stream
+        self.out = bytearray(stream.size)
+        self._out = memoryview(self.out)
+        self._have = bytearray(stream.segments)
+        self.received = 0
+        self.bytes = 0
+        self.duplicates = 0
+        self.completed_at: Optional[float] = None
+        self._last_t = 0.0
+
+    def attach(self, engine):
+        engine.subscribe(rx=self.on_deliver)
+
+    def on_deliver(self, t: float, p):
+        if p.payload is None:
+            return
+        flow, mid = split_msg(p.data)
+        if flow != self.flow or mid is None or mid >= len(self._have):
+            return
+        if self._have[mid]:
+            self.duplicates += 1
+            return
+        off = mid * self.stream.segment_size
+        n = len(p.payload)
+        self._out[off:off + n] = p.payload
+        self._have[mid] = 1
+        self.received += 1
+        self.bytes += n
+        self._last_t = t
+        if self.received == len(self._have):
+            self.completed_at = t
+
+    def complete(self) -> bool:
+        return self.completed_at is not None
+
+    """
+        Funcion que verifica que la salida sea identica byte a byte a la entrada
+    """
+    def identical(self) -> bool:
+        return self.complete() and self._out == self.stream.data
+
+    """
+        Funcion que resume la transferencia
+        Returns:
+            dict: bytes, segmentos, duplicados, completed_at, goodput en MB/s (hasta completar o
+                  hasta la ultima entrega) e identical
+    """
+    def summary(self) -> dict:
+        t = self.completed_at if self.complete() else self._last_t
+        return {
+            "size": self.stream.size,
+            "segment_size": self.stream.segment_size,
+            "segments": self.stream.segments,
+            "received": self.received,
+            "bytes": self.bytes,
+            "duplicates": self.duplicates,
+            "completed_at": self.completed_at,
+            "goodput_MBps": (self.bytes / t / 1e6) if t > 0 else 0.0,
+            "identical": self.identical(),
+        }
@@ -0,0 +1,216 @@
+import csv, json, math, random, struct
+from typing import Any, BinaryIO, Dict, Iterator, Optional, TextIO, Tuple
+from Utils.types import EventType, FrameKind, RxRecord, TxRecord
+
+"""
+    Escritores de traza para corridas sin GUI (JSONL, CSV y binario).
+    Todos exponen la misma interfaz: write_tx(TxRecord), write_rx(RxRecord),
+    write_event(t, nombre), write_summary(dict) y close().
+"""
+
+# Niveles de detalle de la traza (SimConfig.trace_level)
+TRACE_LEVELS = ("off", "counters", "sample", "full")
+
+REC_TX = 0
+REC_RX = 1
+REC_EVENT = 2
+
+# Traza binaria: cabecera MAGIC+version, luego registros de largo variable
+TRACE_MAGIC = b"ARQT"
+TRACE_VERSION = 1
+_HEADER = struct.Struct("<4sB")
+_RECORD = struct.Struct("<BdBiiH")     # tipo, t, kind/evento, seq, ack, largo de info
+
+_KIND_CODE = {k.name: k.value for k in FrameKind}
+_KIND_NAME = {k.value: k.name for k in FrameKind}
+_EVENT_CODE = {e.name: e.value for e in EventType}
+_EVENT_NAME = {e.value: e.name for e in EventType}
+
+
+"""
+    Clase que escribe un registro JSON por linea (tx, rx, ev y un summary al final)
+"""
+class JsonlTraceWriter:
+
+    def __init__(self, out: TextIO):
+        self.out = out
+
+    def write_tx(self, r):
+        self.out.write(json.dumps({"type": "tx", "t": r.t, "kind": r.kind, "seq": r.seq,
+                                   "ack": r.ack, "info": r.info}) + "\n")
+
+    def write_rx(self, r):
+        self.out.write(json.dumps({"type": "rx", "t": r.t, "data": r.data}) + "\n")
+
+    def write_event(self, t: float, name: str):
+        self.out.write(json.dumps({"type": "ev", "t": t, "event": name}) + "\n")
+
+    def write_summary(self, summary: Dict[str, Any]):
+        self.out.write(json.dumps({"type": "summary", **summary}) + "\n")
+
+    def close(self):
+        self.out.flush()
+
+
+"""
+    Clase que escribe la traza como CSV con columnas type,t,kind,seq,ack,info.
+    Para rx la columna info lleva el dato entregado y para ev kind lleva el evento.
+    El resumen no entra en el CSV (lo imprime el CLI por stderr).
+"""
+class CsvTraceWriter:
+
+    COLUMNS = ("type", "t", "kind", "seq", "ack", "info")
+
+    def __init__(self, out: TextIO):
+        self.out = out
+        self._w = csv.writer(out)
+        self._w.writerow(self.COLUMNS)
+
+    def write_tx(self, r):
+        self._w.writerow(("tx", repr(r.t), r.kind, r.seq, r.ack, r.info))
+
+    def write_rx(self, r):
+        self._w.writerow(("rx", repr(r.t), "", "", "", r.data))
+
+    def write_event(self, t: float, name: str):
+        self._w.writerow(("ev", repr(t), name, "", "", ""))
+
+    def write_summary(self, summary: Dict[str, Any]):
+        pass
+
+    def close(self):
+        self.out.flush()
+
+
+"""
+    Clase que escribe la traza en formato binario compacto (ver read_binary_trace)
+"""
+class BinaryTraceWriter:
+
+    def __init__(self, out: BinaryIO):
+        self.out = out
+        out.write(_HEADER.pack(TRACE_MAGIC, TRACE_VERSION))
+
+    def _write(self, rtype, t, code, seq, ack, info: str):
+        raw = info.encode("utf-8")
+        self.out.write(_RECORD.pack(rtype, t, code, seq, ack, len(raw)))
+        self.out.write(raw)
+
+    def write_tx(self, r):
+        self._write(REC_TX, r.t, _KIND_CODE[r.kind], r.seq, r.ack, r.info)
+
+    def write_rx(self, r):
+        self._write(REC_RX, r.t, 0, -1, -1, r.data)
+
+    def write_event(self, t: float, name: str):
+        self._write(REC_EVENT, t, _EVENT_CODE[name], -1, -1, "")
+
+    def write_summary(self, summary: Dict[str, Any]):
+        pass
+
+    def close(self):
+        self.out.flush()
+
+
+"""
+    Funcion que lee una traza binaria escrita por BinaryTraceWriter
+    Args:
+        f (BinaryIO): Archivo abierto en modo binario
+    Returns:
+        Iterator[tuple]: (tipo, t, kind_o_evento, seq, ack, info) con tipo en {"tx","rx","ev"}
+"""
+def read_binary_trace(f: BinaryIO) -> Iterator[Tuple[str, float, str, int, int, str]]:
+    magic, version = _HEADER.unpack(f.read(_HEADER.size))
+    if magic != TRACE_MAGIC or version != TRACE_VERSION:
+        raise ValueError("no es una traza ARQT compatible")
+    names = {REC_TX: "tx", REC_RX: "rx", REC_EVENT: "ev"}
+    while True:
+        head = f.read(_RECORD.size)
+        if len(head) < _RECORD.size:
+            return
+        rtype, t, code, seq, ack, n = _RECORD.unpack(head)
+        info = f.read(n).decode("utf-8")
+        if rtype == REC_TX:
+            label = _KIND_NAME[code]
+        elif rtype == REC_EVENT:
+            label = _EVENT_NAME[code]
+        else:
+            label = ""
+        yield names[rtype], t, label, seq, ack, info
+
+
+"""
+    Funcion que conecta un escritor al motor para volcar la traza durante la corrida
+    (sin acumular logs en memoria)
+    Args:
+        engine (Engine): Motor a observar
+        writer: Escritor de traza (JsonlTraceWriter, CsvTraceWriter o BinaryTraceWriter)
+        records (set[str]): Subconjunto de {"tx", "rx", "ev"}
+    Returns:
+        tuple: Token de Engine.subscribe (para desconectar con unsubscribe)
+"""
+def attach_writer(engine, writer, records, level: str = "full", sample: int = 1) -> tuple:
+    n = sample_rate(level, sample)
+    if n is None:
+        return ()
+    tx = rx = ev = None
+    if "tx" in records:
+        tx = sample_every(lambda t, f: writer.write_tx(TxRecord(t, f.kind.name, f.seq, f.ack, f.info.data)), n, 1)
+    if "rx" in records:
+        rx = sample_every(lambda t, p: writer.write_rx(RxRecord(t, p.data)), n, 2)
+    if "ev" in records:
+        ev = sample_every(lambda t, e, payload: writer.write_event(t, e.name), n, 3)
+    return engine.subscribe(tx=tx, rx=rx, event=ev)
+
+
+"""
+    Funcion que traduce un nivel de traza a "guardar 1 de cada n"
+    Args:
+        level (str): Uno de TRACE_LEVELS
+        sample (int): N del nivel "sample"
+    Returns:
+        int | None: n (1 = todo) o None si el nivel no guarda registros ("off", "counters")
+    Raises:
+        ValueError: Si el nivel no existe
+"""
+def sample_rate(level: str, sample: int) -> Optional[int]:
+    if level not in TRACE_LEVELS:
+        raise ValueError(f"trace_level invalido '{level}' (opciones: {', '.join(TRACE_LEVELS)})")
+    if level in ("off", "counters"):
+        return None
+    return max(1, int(sample)) if level == "sample" else 1
+
+
+"""
+    Funcion que envuelve un suscriptor para que vea cada llamada con probabilidad 1/n
+    Args:
+        fn (Callable): Suscriptor original
+        n (int): 1 de cada n en promedio (1 = sin muestreo, devuelve fn tal cual)
+        seed (int): Semilla del generador propio del muestreo
+    Returns:
+        Callable
+    Detalles:
+        - Un muestreo fijo (la 1ra, la n+1...) se sincroniza con trafico periodico (p.ej. con
+          DATA y ACK alternados y n par solo quedan DATA); al azar no.
+        - Usa su propio random.Random: muestrear no cambia la corrida.
+        - En vez de un sorteo por llamada se sortea el salto hasta la siguiente muestra (geometrico).
+"""
+def sample_every(fn, n: int, seed: int = 0):
+    if n <= 1:
+        return fn
+    rng = random.Random(seed)
+    log_q = math.log1p(-1.0 / n)
+
+    def gap():
+        return int(math.log(1.0 - rng.random()) / log_q)
+
+    k = gap()
+
+    def sampled(*args):
+        nonlocal k
+        if k == 0:
+            fn(*args)
+            k = gap()
+        else:
+            k -= 1
+    return sampled
@@ -0,0 +1,220 @@
+import random
+from typing import Dict, Optional
+
+"""
+    Modelos de fuente de trafico para la capa de red.
+    Una fuente se engancha a un peer con Engine.attach_source(peer, fuente); el
+    motor le pide el instante de la siguiente llegada, encola el paquete en el
+    backlog de ese peer y genera NETWORK_LAYER_READY solo cuando hay datos.
+    Sin fuentes el motor conserva el comportamiento saturado de siempre
+    (siempre hay un MSG_i listo).
+    Los tiempos aleatorios usan el modulo random (o el rng dado), asi que
+    random.seed(...) hace las corridas reproducibles.
+"""
+
+
+"""
+    Clase base de las fuentes de trafico
+    Atributos:
+        start (float): Instante (s) de la primera llegada posible
+        generated (int): Paquetes generados hasta ahora
+"""
+class TrafficSource:
+
+    def __init__(self, start: float = 0.0, rng: Optional[random.Random] = None):
+        self.start = float(start)
+        self.rng = rng or random
+        self.generated = 0
+
+    """
+        Funcion que devuelve el instante absoluto de la siguiente llegada
+        Args:
+            now (float): Tiempo simulado actual (el de la llegada anterior)
+        Returns:
+            float | None: Tiempo de la proxima llegada, o None si la fuente termino
+    """
+    def next_arrival(self, now: float) -> Optional[float]:
+        raise NotImplementedError
+
+    def describe(self) -> str:
+        return type(self).__name__
+
+
+"""
+    Clase fuente de Poisson: llegadas con tiempos entre llegadas exponenciales
+    Args:
+        rate (float): Paquetes por segundo (lambda)
+        limit (int, opcional): Total de paquetes a generar (None = infinito)
+"""
+class PoissonSource(TrafficSource):
+
+    def __init__(self, rate: float, limit: Optional[int] = None, start: float = 0.0, rng=None):
+        super().__init__(start, rng)
+        if rate <= 0:
+            raise ValueError("rate debe ser > 0")
+        self.rate = float(rate)
+        self.limit = limit
+
+    def next_arrival(self, now: float) -> Optional[float]:
+        if self.limit is not None and self.generated >= self.limit:
+            return None
+        self.generated += 1
+        return max(now, self.start) + self.rng.expovariate(self.rate)
+
+    def describe(self) -> str:
+        return f"poisson(rate={self.rate:g})"
+
+
+"""
+    Clase fuente de tasa fija: una llegada cada 1/rate segundos
+    Args:
+        rate (float): Paquetes por segundo
+        limit (int, opcional): Total de paquetes a generar (None = infinito)
+"""
+class FixedRateSource(TrafficSource):
+
+    def __init__(self, rate: float, limit: Optional[int] = None, start: float = 0.0, rng=None):
+        super().__init__(start, rng)
+        if rate <= 0:
+            raise ValueError("rate debe ser > 0")
+        self.period = 1.0 / float(rate)
+        self.limit = limit
+
+    def next_arrival(self, now: float) -> Optional[float]:
+        if self.limit is not None and self.generated >= self.limit:
+            return None
+        # la k-esima llegada cae en start + k*periodo (sin acumular error)
+        t = self.start + self.generated * self.period
+        self.generated += 1
+        return t
+
+    def describe(self) -> str:
+        return f"fixed(rate={1.0 / self.period:g})"
+
+
+"""
+    Clase fuente on/off: alterna periodos ON y OFF de duracion exponencial;
+    durante ON genera llegadas de Poisson con tasa rate y durante OFF no genera nada
+    Args:
+        rate (float): Paquetes por segundo durante ON
+        mean_on (float): Duracion media de un periodo ON (s)
+        mean_off (float): Duracion media de un periodo OFF (s)
+"""
+class OnOffSource(TrafficSource):
+
+    def __init__(self, rate: float, mean_on: float, mean_off: float,
+                 limit: Optional[int] = None, start: float = 0.0, rng=None):
+        super().__init__(start, rng)
+        if rate <= 0 or mean_on <= 0 or mean_off < 0:
+            raise ValueError("rate y on deben ser > 0, off >= 0")
+        self.rate = float(rate)
+        self.mean_on = float(mean_on)
+        self.mean_off = float(mean_off)
+        self.limit = limit
+        self._on_end: Optional[float] = None      # fin del periodo ON actual
+
+    def _sample(self, mean: float) -> float:
+        return self.rng.expovariate(1.0 / mean) if mean > 0 else 0.0
+
+    def next_arrival(self, now: float) -> Optional[float]:
+        if self.limit is not None and self.generated >= self.limit:
+            return None
+        t = max(now, self.start)
+        if self._on_end is None:
+            self._on_end = t + self._sample(self.mean_on)
+        t += self.rng.expovariate(self.rate)
+        # la llegada cae fuera del ON: saltar OFF(s) y reintentar en el siguiente ON
+        while t > self._on_end:
+            on_start = self._on_end + self._sample(self.mean_off)
+            self._on_end = on_start + self._sample(self.mean_on)
+            t = on_start + self.rng.expovariate(self.rate)
+        self.generated += 1
+        return t
+
+    def describe(self) -> str:
+        return f"onoff(rate={self.rate:g},on={self.mean_on:g},off={self.mean_off:g})"
+
+
+"""
+    Clase fuente de transferencia de archivo: n paquetes y luego termina.
+    Sin rate, los n paquetes estan disponibles desde start (archivo ya en disco);
+    con rate, llegan a tasa fija (archivo que se va produciendo).
+    Args:
+        n (int): Cantidad total de paquetes del archivo
+        rate (float, opcional): Paquetes por segundo
+"""
+class FileTransferSource(TrafficSource):
+
+    def __init__(self, n: int, rate: Optional[float] = None, start: float = 0.0, rng=None):
+        super().__init__(start, rng)
+        if n <= 0:
+            raise ValueError("n debe ser > 0")
+        self.n = int(n)
+        self.period = (1.0 / float(rate)) if rate else 0.0
+
+    def next_arrival(self, now: float) -> Optional[float]:
+        if self.generated >= self.n:
+            return None
+        t = self.start + self.generated * self.period
+        self.generated += 1
+        return t
+
+    def describe(self) -> str:
+        return f"file(n={self.n})"
+
+
+_KINDS = {
+    "poisson": (PoissonSource, {"rate": float, "limit": int, "start": float}),
+    "fixed": (FixedRateSource, {"rate": float, "limit": int, "start": float}),
+    "onoff": (OnOffSource, {"rate": float, "on": float, "off": float, "limit": int, "start": float}),
+    "file": (FileTransferSource, {"n": int, "rate": float, "start": float}),
+}
+_ALIASES = {"on": "mean_on", "off": "mean_off"}
+
+
+"""
+    Funcion que construye una fuente a partir de un texto
+    Args:
+        spec (str): "tipo:clave=valor,..." p.ej. "poisson:rate=50", "onoff:rate=200,on=0.5,off=1",
+                    "fixed:rate=20", "file:n=500" o "file:n=500,rate=100"
+    Returns:
+        TrafficSource
+    Raises:
+        ValueError: Si el tipo o algun parametro no es valido
+"""
+def parse_source(spec: str) -> TrafficSource:
+    kind, _, params = spec.partition(":")
+    kind = kind.strip().lower()
+    if kind not in _KINDS:
+        raise ValueError(f"fuente desconocida '{kind}' (opciones: {', '.join(sorted(_KINDS))})")
+    cls, allowed = _KINDS[kind]
+    kwargs: Dict[str, object] = {}
+    for part in filter(None, (p.strip() for p in params.split(","))):
+        key, eq, value = part.partition("=")
+        key = key.strip()
+        if not eq or key not in allowed:
+            raise ValueError(f"parametro invalido '{part}' para {kind} (validos: {', '.join(allowed)})")
+        kwargs[_ALIASES.get(key, key)] = allowed[key](value)
+    try:
+        return cls(**kwargs)
+    except TypeError as e:
+        raise ValueError(f"{kind}: {e}") from None
+
+
+"""
+    Funcion que calcula la carga ofrecida media de una fuente (paquetes/s)
+    Args:
+        src (TrafficSource): Fuente
+    Returns:
+        float | None: Tasa media (None si no esta acotada, p.ej. un archivo sin rate)
+"""
+def offered_rate(src: TrafficSource) -> Optional[float]:
+    if isinstance(src, PoissonSource):
+        return src.rate
+    if isinstance(src, FixedRateSource):
+        return 1.0 / src.period
+    if isinstance(src, OnOffSource):
+        return src.rate * src.mean_on / (src.mean_on + src.mean_off)
+    if isinstance(src, FileTransferSource):
+        return (1.0 / src.period) if src.period else None
+    return None
@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum, auto
+from typing import Any, NamedTuple, Optional
 
 class FrameKind(Enum):
     DATA = auto()
@@ -16,10 +17,28 @@ class EventType(Enum):
 @dataclass
 class Packet:
     data: str
+    payload: Optional[Any] = None     # bytes de aplicacion (memoryview de un ByteStream), opcional
 
 @dataclass
 class Frame:
     kind: FrameKind
     seq: int
     ack: int
-    info: Packet
\ No newline at end of file
+    info: Packet
+
+"""
+    Registro tipado de una transmision (lo produce Engine.snapshot y lo consume la GUI)
+"""
+class TxRecord(NamedTuple):
+    t: float
+    kind: str
+    seq: int
+    ack: int
+    info: str
+
+"""
+    Registro tipado de una entrega a la capa de red
+"""
+class RxRecord(NamedTuple):
+    t: float
+    data: str
@@ -1,3 +1,4 @@
+from Events.api import rng
 
 def inc(k, max_seq):
     if k >= max_seq:
@@ -11,3 +12,58 @@ def between(a, b, c):
         return a <= b < c
     else:
         return b >= a or b < c
+
+
+"""
+    Funcion que elige que peer atiende un NETWORK_LAYER_READY en los protocolos bidireccionales
+    Args:
+        payload (str|None): Peer que trae el evento ("A"/"B") cuando hay fuentes de trafico, o None
+        A, B: Peers con atributo label y metodo tx_window_has_space()
+        has_data (Callable[[str], bool]): Consulta si la capa de red del peer tiene datos
+    Returns:
+        peer | None: Sin payload se sortea 50/50 (con el generador del motor) y gana el sorteado si tiene espacio;
+                     con payload se prefiere ese peer y si no puede, el otro. None si nadie puede enviar.
+"""
+def pick_sender(payload, A, B, has_data):
+    if payload is None:
+        winner = A if rng().randint(1, 100) <= 50 else B
+        return winner if winner.tx_window_has_space() else None
+    order = (A, B) if payload == A.label else (B, A)
+    for peer in order:
+        if peer.tx_window_has_space() and has_data(peer.label):
+            return peer
+    return None
+
+
+"""
+    Funcion que separa el flujo y el id de mensaje del dato de un paquete
+    Args:
+        data (str): Dato entregado, p.ej. "A>MSG_12" (sin prefijo, como en Utopia, se asume flujo "A")
+    Returns:
+        tuple[str, int|None]: (flujo, id) con id None si el dato no tiene la forma MSG_i
+"""
+def split_msg(data):
+    flow, sep, rest = data.partition(">")
+    if not sep:
+        flow, rest = "A", data
+    if rest.startswith("MSG_"):
+        try:
+            return flow, int(rest[4:])
+        except ValueError:
+            pass
+    return flow, None
+
+
+"""
+    Funcion que deduce que peer envia un frame a partir de su info
+    Args:
+        f (Frame): Frame DATA ("A>MSG_3", sin prefijo = "A") o ACK ("ACK:B"; "ACK:R" es el receptor B)
+    Returns:
+        str: "A" o "B"; los DATA de los flujos del modo multi-flujo ("f3>MSG_0") van de A a B
+             y sus ACK ("ACK:f3") de B a A
+"""
+def frame_sender(f):
+    data = f.info.data if f.info is not None else ""
+    if data.startswith("ACK:"):
+        return "A" if data[4:] == "A" else "B"
+    return "B" if data.startswith("B>") else "A"